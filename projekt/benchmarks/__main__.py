@@ -0,0 +1,62 @@
+"""The command line interface of the microbenchmark suite.
+
+Usage:
+    python -m benchmarks run [--only PREFIX ...] [--out results.json]
+    python -m benchmarks compare BASELINE CURRENT [--threshold 0.1]
+"""
+
+import argparse
+import importlib
+import pkgutil
+import sys
+
+import benchmarks
+from benchmarks.core import compare, run, run_all, save
+
+
+def main() -> int:
+    """The entry point of the benchmark suite.
+
+    Returns:
+        int: The process exit code.
+    """
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--only", nargs="*", help="name prefixes")
+    run_parser.add_argument("--out", default="bench_results.json")
+    run_parser.add_argument("--rounds", type=int, default=7)
+    run_parser.add_argument("--min-time", type=float, default=0.1)
+    run_parser.add_argument(
+        "--baseline",
+        help="baseline to compare the results against",
+    )
+    run_parser.add_argument("--threshold", type=float, default=0.1)
+
+    compare_parser = commands.add_parser("compare", help="compare results")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        for module in pkgutil.iter_modules(benchmarks.__path__):
+            if module.name.startswith("bench_"):
+                importlib.import_module(f"benchmarks.{module.name}")
+
+        results = run(run_all(args.only, args.rounds, args.min_time))
+        save(results, args.out)
+        if not args.baseline:
+            return 0
+        args.current = args.out
+
+    regressions = compare(args.baseline, args.current, args.threshold)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""A module containing benchmarks of the tiered cache.
+
+The shared tier runs against the local RESP stand-in server, so L2 hits
+include a loopback round trip.
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable
+
+from benchmarks.core import benchmark
+from benchmarks.respserver import RespServer
+from benchmarks.standin import InMemoryDatabase, club_rows, use_database
+from src.infrastructure.repositories.cached import (
+    CLUB_READS,
+    CachedRepository,
+)
+from src.infrastructure.repositories.clubdb import ClubRepository
+from src.infrastructure.utils.cache import LocalCache, TieredCache
+from src.infrastructure.utils.resp import RespClient
+
+
+@asynccontextmanager
+async def _shared_cache() -> AsyncIterator[RespClient]:
+    """A function starting the stand-in server and connecting to it.
+
+    The client and the server are closed on exit, so no reader task is
+    left pending when the benchmark is done.
+
+    Yields:
+        AsyncIterator[RespClient]: The client of the stand-in.
+    """
+
+    server = RespServer()
+    client = RespClient(port=await server.start())
+    try:
+        yield client
+    finally:
+        await client.close()
+        await server.stop()
+
+
+@benchmark("cache.club.get_all.l1_hit.1000")
+async def club_get_all_l1() -> AsyncIterator[Callable]:
+    """A benchmark getting all clubs from the local cache."""
+
+    use_database(InMemoryDatabase(club_rows(1000)))
+    async with _shared_cache() as shared:
+        cache = TieredCache(LocalCache(), shared)
+        repository = CachedRepository(
+            ClubRepository(), "club", cache, CLUB_READS,
+        )
+        await repository.get_all_clubs()
+
+        yield repository.get_all_clubs
+
+
+@benchmark("cache.club.get_all.l2_hit.1000")
+async def club_get_all_l2() -> AsyncIterator[Callable]:
+    """A benchmark getting all clubs from the shared cache."""
+
+    use_database(InMemoryDatabase(club_rows(1000)))
+    async with _shared_cache() as shared:
+        cache = TieredCache(LocalCache(max_entries=0), shared)
+        repository = CachedRepository(
+            ClubRepository(), "club", cache, CLUB_READS,
+        )
+        await repository.get_all_clubs()
+
+        yield repository.get_all_clubs
+
+
+@benchmark("cache.club.get_all.miss.1000")
+async def club_get_all_miss() -> Callable:
+    """A benchmark loading all clubs through the cache every time."""
+
+    use_database(InMemoryDatabase(club_rows(1000)))
+    cache = TieredCache(LocalCache(max_entries=0))
+    repository = CachedRepository(ClubRepository(), "club", cache, CLUB_READS)
+
+    return repository.get_all_clubs
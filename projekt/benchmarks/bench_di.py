@@ -0,0 +1,103 @@
+"""A module containing dependency injection benchmarks."""
+
+from typing import Callable
+
+from dependency_injector.providers import Factory
+from dependency_injector.wiring import inject, Provide
+from fastapi import Depends, FastAPI
+
+from benchmarks.core import benchmark
+from benchmarks.standin import asgi_get
+from src.api.utils.di import resolved
+from src.container import Container
+from src.infrastructure.services.club import ClubService
+
+
+def _factory_container() -> Container:
+    """A function building the container as it was before the rework.
+
+    Returns:
+        Container: The container wired into this module, creating a new
+            service on every resolution.
+    """
+
+    container = Container()
+    container.club_service.override(
+        Factory(ClubService, repository=container.club_repository),
+    )
+    container.wire(modules=[__name__])
+
+    return container
+
+
+@inject
+async def _resolve(
+    service: object = Provide[Container.club_service],
+) -> object:
+    """A function resolving the service through the wiring."""
+
+    return service
+
+
+@benchmark("di.inject.resolve")
+def inject_resolve() -> Callable:
+    """A benchmark resolving the service with `@inject`."""
+
+    _factory_container()
+
+    return _resolve
+
+
+@benchmark("di.resolved.resolve")
+def resolved_resolve() -> Callable:
+    """A benchmark resolving the service with the prebuilt dependency."""
+
+    return resolved(Container().club_service)
+
+
+@benchmark("di.route.inject")
+def route_inject() -> Callable:
+    """A benchmark of a route getting the service with `@inject`.
+
+    This is how the routers resolved their services before, with a new
+    `Factory` instance on every request.
+    """
+
+    _factory_container()
+    app = FastAPI()
+
+    @app.get("/")
+    @inject
+    async def endpoint(
+        service: object = Depends(Provide[Container.club_service]),
+    ) -> dict:
+        return {}
+
+    return lambda: asgi_get(app, "/")
+
+
+@benchmark("di.route.resolved")
+def route_resolved() -> Callable:
+    """A benchmark of a route getting the service like the routers."""
+
+    dependency = resolved(Container().club_service)
+    app = FastAPI()
+
+    @app.get("/")
+    async def endpoint(service: object = Depends(dependency)) -> dict:
+        return {}
+
+    return lambda: asgi_get(app, "/")
+
+
+@benchmark("di.route.none")
+def route_none() -> Callable:
+    """A benchmark of the same route without any dependency."""
+
+    app = FastAPI()
+
+    @app.get("/")
+    async def endpoint() -> dict:
+        return {}
+
+    return lambda: asgi_get(app, "/")
@@ -0,0 +1,35 @@
+"""A module containing record to domain model mapping benchmarks."""
+
+from typing import Callable
+
+from benchmarks.core import benchmark
+from benchmarks.standin import club_rows, stadium_rows
+from src.core.domain.club import Club
+from src.core.domain.stadium import Stadium
+
+
+@benchmark("mapping.club.one")
+def club_one() -> Callable:
+    """A benchmark mapping a single club record."""
+
+    row = club_rows(1)[0]
+
+    return lambda: Club(**dict(row))
+
+
+@benchmark("mapping.club.1000")
+def club_many() -> Callable:
+    """A benchmark mapping a listing of clubs."""
+
+    rows = club_rows(1000)
+
+    return lambda: [Club(**dict(row)) for row in rows]
+
+
+@benchmark("mapping.stadium.1000")
+def stadium_many() -> Callable:
+    """A benchmark mapping a listing of stadiums."""
+
+    rows = stadium_rows(1000)
+
+    return lambda: [Stadium(**dict(row)) for row in rows]
@@ -0,0 +1,33 @@
+"""A module containing password hashing benchmarks."""
+
+from typing import Callable
+
+from benchmarks.core import benchmark
+from src.infrastructure.utils.password import (
+    hash_password,
+    hash_password_async,
+    verify_password,
+)
+
+
+@benchmark("password.hash")
+def password_hash() -> Callable:
+    """A benchmark hashing the password with bcrypt."""
+
+    return lambda: hash_password("s3cr3t-password")
+
+
+@benchmark("password.verify")
+def password_verify() -> Callable:
+    """A benchmark verifying the password against its bcrypt hash."""
+
+    hashed = hash_password("s3cr3t-password")
+
+    return lambda: verify_password("s3cr3t-password", hashed)
+
+
+@benchmark("password.hash.pool")
+def password_hash_pool() -> Callable:
+    """A benchmark hashing the password in the bcrypt pool."""
+
+    return lambda: hash_password_async("s3cr3t-password")
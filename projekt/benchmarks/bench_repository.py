@@ -0,0 +1,149 @@
+"""A module containing repository and service benchmarks.
+
+Set `BENCH_DATABASE_URL` to run them against a local Postgres database,
+otherwise they run against the in-memory stand-in.
+"""
+
+import asyncio
+from typing import Callable
+
+import sqlalchemy
+
+from benchmarks.core import benchmark
+from benchmarks.standin import (
+    benchmark_database,
+    club_rows,
+    postgres_database,
+    stadium_rows,
+    use_database,
+)
+from src.core.domain.club import Club, ClubIn
+from src.db import club_table
+from src.infrastructure.repositories.clubdb import (
+    FIELD_COLUMNS as CLUB_COLUMNS,
+    ClubRepository,
+)
+from src.infrastructure.repositories.coalesce import InsertCoalescer
+from src.infrastructure.repositories.stadiumdb import StadiumRepository
+from src.infrastructure.services.club import ClubService
+from src.infrastructure.services.stadium import StadiumService
+
+
+@benchmark("repository.club.get_by_id")
+async def club_get_by_id() -> Callable:
+    """A benchmark getting a club by id."""
+
+    use_database(await benchmark_database(club_rows(1)))
+    repository = ClubRepository()
+
+    return lambda: repository.get_club_by_id(1)
+
+
+@benchmark("repository.club.get_by_id.prepared")
+async def club_get_by_id_prepared() -> Callable:
+    """A benchmark getting a club by id with the prepared hot query.
+
+    Like `repository.club.get_by_id.core`, it needs `BENCH_DATABASE_URL`.
+    """
+
+    use_database(await postgres_database())
+    repository = ClubRepository()
+
+    return lambda: repository.get_club_by_id(1)
+
+
+@benchmark("repository.club.get_by_id.core")
+async def club_get_by_id_core() -> Callable:
+    """A benchmark getting a club by id through SQLAlchemy Core.
+
+    It is the path `repository.club.get_by_id` took before the hot query
+    was prepared: the statement is compiled on every call and the record
+    is copied to a dict before the model is built. It needs
+    `BENCH_DATABASE_URL`, as the stand-in answers without compiling.
+    """
+
+    database = await postgres_database()
+    columns = [column.label(field) for field, column in CLUB_COLUMNS.items()]
+
+    async def get_by_id() -> Club | None:
+        query = sqlalchemy.select(*columns).where(club_table.c.id == 1)
+        club = await database.fetch_one(query)
+
+        return Club(**dict(club)) if club else None
+
+    return get_by_id
+
+
+@benchmark("repository.club.get_all.1000")
+async def club_get_all() -> Callable:
+    """A benchmark getting all clubs."""
+
+    use_database(await benchmark_database(club_rows(1000)))
+    repository = ClubRepository()
+
+    return repository.get_all_clubs
+
+
+@benchmark("repository.club.get_all.projected.1000")
+async def club_get_all_projected() -> Callable:
+    """A benchmark getting projected clubs."""
+
+    rows = [{"id": row["id"], "name": row["name"]} for row in club_rows(1000)]
+    use_database(await benchmark_database(rows))
+    repository = ClubRepository()
+
+    return lambda: repository.get_all_clubs(fields=("id", "name"))
+
+
+@benchmark("repository.club.add.concurrent.100")
+async def club_add_concurrent() -> Callable:
+    """A benchmark adding 100 clubs concurrently, one insert each."""
+
+    use_database(await benchmark_database(club_rows(100)))
+    repository = ClubRepository()
+    clubs = [ClubIn(name=f"Club {i}", place=1, clubId=i) for i in range(100)]
+
+    return lambda: asyncio.gather(*map(repository.add_club, clubs))
+
+
+@benchmark("repository.club.add.coalesced.100")
+async def club_add_coalesced() -> Callable:
+    """A benchmark adding 100 clubs concurrently through the coalescer."""
+
+    use_database(await benchmark_database(club_rows(100)))
+    repository = ClubRepository(
+        inserts=InsertCoalescer(club_table, CLUB_COLUMNS, "club"),
+    )
+    clubs = [ClubIn(name=f"Club {i}", place=1, clubId=i) for i in range(100)]
+
+    return lambda: asyncio.gather(*map(repository.add_club, clubs))
+
+
+@benchmark("repository.stadium.get_all.1000")
+async def stadium_get_all() -> Callable:
+    """A benchmark getting all stadiums."""
+
+    use_database(await benchmark_database(stadium_rows(1000)))
+    repository = StadiumRepository()
+
+    return repository.get_all_stadiums
+
+
+@benchmark("service.club.get_all.1000")
+async def club_service_get_all() -> Callable:
+    """A benchmark getting all clubs through the service."""
+
+    use_database(await benchmark_database(club_rows(1000)))
+    service = ClubService(repository=ClubRepository())
+
+    return service.get_all_clubs
+
+
+@benchmark("service.stadium.get_all.1000")
+async def stadium_service_get_all() -> Callable:
+    """A benchmark getting all stadiums through the service."""
+
+    use_database(await benchmark_database(stadium_rows(1000)))
+    service = StadiumService(repository=StadiumRepository())
+
+    return service.get_all_stadiums
@@ -0,0 +1,148 @@
+"""A module containing router serialization benchmarks."""
+
+from typing import Callable, Iterable
+
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from benchmarks.core import benchmark
+from benchmarks.standin import asgi_get, club_rows, stadium_rows
+from src.api.utils.encoding import (
+    CompressionMiddleware,
+    FormatMiddleware,
+    NegotiatedResponse,
+)
+from src.api.utils.fields import projected_response
+from src.core.domain.club import Club
+from src.core.domain.stadium import Stadium
+
+STADIUM_FIELDS = ("id", "stadiumsName")
+
+
+def _app(
+    model: type[BaseModel],
+    rows: list[dict],
+    fields: tuple[str, ...] = ("id", "name"),
+) -> FastAPI:
+    """A function building an app serving the rows like the routers.
+
+    Both routes start from what the repository reads: `/all` builds the
+    models from the full rows and `/projected` copies the rows of the
+    projected columns.
+
+    Args:
+        model (type[BaseModel]): The domain model.
+        rows (list[dict]): The full rows.
+        fields (tuple[str, ...], optional): The projected fields.
+            Defaults to ("id", "name").
+
+    Returns:
+        FastAPI: The application.
+    """
+
+    app = FastAPI(default_response_class=NegotiatedResponse)
+    projected = [{field: row[field] for field in fields} for row in rows]
+
+    @app.get("/all", response_model=Iterable[model])  # type: ignore
+    async def get_all() -> Iterable:
+        return [model(**row) for row in rows]
+
+    @app.get("/projected")
+    async def get_projected() -> Iterable:
+        return projected_response(
+            model,
+            fields,
+            [dict(row) for row in projected],
+        )
+
+    app.add_middleware(FormatMiddleware)
+    app.add_middleware(CompressionMiddleware)
+
+    return app
+
+
+@benchmark("serialization.club.all.1000")
+def club_all() -> Callable:
+    """A benchmark serializing a listing through the response model."""
+
+    app = _app(Club, club_rows(1000))
+
+    return lambda: asgi_get(app, "/all")
+
+
+@benchmark("serialization.club.projected.1000")
+def club_projected() -> Callable:
+    """A benchmark serializing a listing projected to two of four fields."""
+
+    app = _app(Club, club_rows(1000))
+
+    return lambda: asgi_get(app, "/projected")
+
+
+@benchmark("serialization.stadium.all.1000")
+def stadium_all() -> Callable:
+    """A benchmark serializing a stadium listing."""
+
+    app = _app(Stadium, stadium_rows(1000), STADIUM_FIELDS)
+
+    return lambda: asgi_get(app, "/all")
+
+
+@benchmark("serialization.stadium.projected.1000")
+def stadium_projected() -> Callable:
+    """A benchmark serializing a listing projected to two of five fields."""
+
+    app = _app(Stadium, stadium_rows(1000), STADIUM_FIELDS)
+
+    return lambda: asgi_get(app, "/projected")
+
+
+def _negotiated(header: bytes, value: bytes) -> Callable:
+    """A function timing the listing with a negotiation header.
+
+    Args:
+        header (bytes): The negotiation header.
+        value (bytes): The requested format or encoding.
+
+    Returns:
+        Callable: The timed request.
+    """
+
+    app = _app(Club, club_rows(1000))
+
+    return lambda: asgi_get(app, "/all", headers=[(header, value)])
+
+
+@benchmark("serialization.club.all.1000.msgpack")
+def club_all_msgpack() -> Callable:
+    """A benchmark serializing a listing as MessagePack."""
+
+    return _negotiated(b"accept", b"application/msgpack")
+
+
+@benchmark("serialization.club.all.1000.columnar")
+def club_all_columnar() -> Callable:
+    """A benchmark serializing a listing as columnar JSON."""
+
+    return _negotiated(b"accept", b"application/vnd.columnar+json")
+
+
+@benchmark("serialization.club.all.1000.gzip")
+def club_all_gzip() -> Callable:
+    """A benchmark serializing a gzip compressed listing."""
+
+    return _negotiated(b"accept-encoding", b"gzip")
+
+
+@benchmark("serialization.club.all.1000.br")
+def club_all_brotli() -> Callable:
+    """A benchmark serializing a brotli compressed listing."""
+
+    return _negotiated(b"accept-encoding", b"br")
+
+
+@benchmark("serialization.club.all.1000.zstd")
+def club_all_zstd() -> Callable:
+    """A benchmark serializing a zstd compressed listing."""
+
+    return _negotiated(b"accept-encoding", b"zstd")
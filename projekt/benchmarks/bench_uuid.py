@@ -0,0 +1,57 @@
+"""A module containing benchmarks of the user key generation.
+
+They need `BENCH_DATABASE_URL` and insert into the `users` table of the
+database, which then keeps the rows, so use a scratch database. They
+compare the index locality of the keys, which grows with the table, so
+without a database they are skipped instead of measuring the stand-in.
+"""
+
+import uuid
+from typing import Callable
+
+from benchmarks.core import benchmark
+from benchmarks.standin import postgres_database
+from src.db import user_table
+from src.infrastructure.utils.uuid7 import uuid7
+
+BATCH_SIZE = 1000
+
+
+async def _bulk_insert(generate: Callable[[], uuid.UUID]) -> Callable:
+    """A function preparing the bulk insert of users.
+
+    Args:
+        generate (Callable[[], uuid.UUID]): The key generator.
+
+    Returns:
+        Callable: The coroutine function inserting a batch of users.
+    """
+
+    database = await postgres_database()
+
+    async def insert() -> None:
+        rows = []
+        for _ in range(BATCH_SIZE):
+            key = generate()
+            rows.append({
+                "id": key,
+                "email": f"{key}@bench.invalid",
+                "password": "",
+            })
+        await database.execute(user_table.insert().values(rows))
+
+    return insert
+
+
+@benchmark("user.insert.uuid4.1000")
+async def insert_uuid4() -> Callable:
+    """A benchmark inserting users keyed by random UUIDv4."""
+
+    return await _bulk_insert(uuid.uuid4)
+
+
+@benchmark("user.insert.uuid7.1000")
+async def insert_uuid7() -> Callable:
+    """A benchmark inserting users keyed by time-ordered UUIDv7."""
+
+    return await _bulk_insert(uuid7)
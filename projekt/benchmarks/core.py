@@ -0,0 +1,255 @@
+"""A module containing the microbenchmark harness."""
+
+import asyncio
+import inspect
+import json
+import platform
+import statistics
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, Awaitable, Callable
+
+registry: dict[str, Callable[[], Any]] = {}
+
+
+@dataclass
+class Result:
+    """A class representing the result of a single benchmark."""
+
+    name: str
+    median_us: float
+    min_us: float
+    stdev_us: float
+    rounds: int
+    iterations: int
+
+
+def benchmark(name: str) -> Callable:
+    """A decorator registering the benchmark factory.
+
+    The factory is called once before the measurement and returns the
+    callable (or coroutine function) to be timed. An async generator
+    factory yields it instead and is resumed after the measurement, so
+    the code after `yield` releases what the benchmark opened.
+
+    Args:
+        name (str): The unique benchmark name, prefixed with its layer.
+
+    Returns:
+        Callable: The registering decorator.
+    """
+
+    def decorator(factory: Callable[[], Any]) -> Callable[[], Any]:
+        registry[name] = factory
+        return factory
+
+    return decorator
+
+
+async def _time_async(
+    function: Callable[[], Awaitable],
+    iterations: int,
+) -> float:
+    """A function timing the coroutine function.
+
+    Args:
+        function (Callable[[], Awaitable]): The timed coroutine function.
+        iterations (int): The number of calls.
+
+    Returns:
+        float: The total duration in seconds.
+    """
+
+    start = perf_counter()
+    for _ in range(iterations):
+        await function()
+
+    return perf_counter() - start
+
+
+def _time_sync(function: Callable[[], Any], iterations: int) -> float:
+    """A function timing the callable.
+
+    Args:
+        function (Callable[[], Any]): The timed callable.
+        iterations (int): The number of calls.
+
+    Returns:
+        float: The total duration in seconds.
+    """
+
+    start = perf_counter()
+    for _ in range(iterations):
+        function()
+
+    return perf_counter() - start
+
+
+async def measure(
+    name: str,
+    function: Callable[[], Any],
+    rounds: int = 7,
+    min_time: float = 0.1,
+) -> Result:
+    """A function measuring the per-call duration of the callable.
+
+    The number of iterations per round is calibrated so that a round
+    lasts at least `min_time`.
+
+    Args:
+        name (str): The benchmark name.
+        function (Callable[[], Any]): The timed callable.
+        rounds (int, optional): The number of rounds. Defaults to 7.
+        min_time (float, optional): The minimal round duration in
+            seconds. Defaults to 0.1.
+
+    Returns:
+        Result: The benchmark statistics in microseconds per call.
+    """
+
+    probe = function()
+    is_async = inspect.isawaitable(probe)
+    if is_async:
+        await probe
+
+    async def run(iterations: int) -> float:
+        if is_async:
+            return await _time_async(function, iterations)
+        return _time_sync(function, iterations)
+
+    iterations = 1
+    while (elapsed := await run(iterations)) < min_time:
+        iterations *= 10 if elapsed < min_time / 10 else 2
+
+    samples = [
+        await run(iterations) / iterations * 1e6 for _ in range(rounds)
+    ]
+
+    return Result(
+        name=name,
+        median_us=statistics.median(samples),
+        min_us=min(samples),
+        stdev_us=statistics.stdev(samples) if rounds > 1 else 0.0,
+        rounds=rounds,
+        iterations=iterations,
+    )
+
+
+async def run_all(
+    selected: list[str] | None = None,
+    rounds: int = 7,
+    min_time: float = 0.1,
+) -> list[Result]:
+    """A function running the registered benchmarks.
+
+    Args:
+        selected (list[str] | None, optional): Name prefixes to run.
+            Defaults to all benchmarks.
+        rounds (int, optional): The number of rounds. Defaults to 7.
+        min_time (float, optional): The minimal round duration in
+            seconds. Defaults to 0.1.
+
+    Returns:
+        list[Result]: The benchmark results.
+    """
+
+    results = []
+    for name, factory in registry.items():
+        if selected and not any(name.startswith(p) for p in selected):
+            continue
+
+        teardown = None
+        try:
+            function = factory()
+            if inspect.isasyncgen(function):
+                teardown = function
+                function = await anext(teardown)
+            elif inspect.isawaitable(function):
+                function = await function
+            result = await measure(name, function, rounds, min_time)
+        except Exception as error:  # pylint: disable=broad-except
+            print(f"{name:<48} {'skipped':>12}  ({error!r})")
+            continue
+        finally:
+            if teardown is not None:
+                await anext(teardown, None)
+
+        print(
+            f"{name:<48} {result.median_us:>12.2f} us"
+            f"  (min {result.min_us:.2f}, stdev {result.stdev_us:.2f})"
+        )
+        results.append(result)
+
+    return results
+
+
+def save(results: list[Result], path: str) -> None:
+    """A function storing the results as JSON.
+
+    Args:
+        results (list[Result]): The benchmark results.
+        path (str): The output file path.
+    """
+
+    document = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(document, file, indent=2)
+
+
+def compare(
+    baseline_path: str,
+    current_path: str,
+    threshold: float,
+) -> list[str]:
+    """A function comparing the results against the baseline.
+
+    Args:
+        baseline_path (str): The baseline results file.
+        current_path (str): The current results file.
+        threshold (float): The allowed relative slowdown, e.g. 0.1.
+
+    Returns:
+        list[str]: The names of the regressed benchmarks.
+    """
+
+    with open(baseline_path, encoding="utf-8") as file:
+        baseline = json.load(file)["results"]
+    with open(current_path, encoding="utf-8") as file:
+        current = json.load(file)["results"]
+
+    regressions = []
+    for name, result in current.items():
+        if name not in baseline:
+            print(f"{name:<48} {'new':>12}")
+            continue
+
+        ratio = result["median_us"] / baseline[name]["median_us"]
+        regressed = ratio > 1 + threshold
+        print(
+            f"{name:<48} {ratio:>11.2f}x"
+            f"{'  REGRESSION' if regressed else ''}"
+        )
+        if regressed:
+            regressions.append(name)
+
+    return regressions
+
+
+def run(coroutine: Awaitable) -> Any:
+    """A function running the coroutine on a new event loop.
+
+    Args:
+        coroutine (Awaitable): The coroutine to run.
+
+    Returns:
+        Any: The coroutine result.
+    """
+
+    return asyncio.run(coroutine)  # type: ignore
@@ -0,0 +1,374 @@
+"""A synthetic scale dataset generator loading rows with COPY.
+
+Usage:
+    python -m benchmarks.dataset --clubs 1000000 --stadiums 2000000 \\
+        --users 5000000 --seed 42 --truncate
+
+The data is deterministic for a given seed and table size. Club cities
+and user e-mail domains follow a Zipf-like distribution, stadiums are
+skewed towards popular clubs, and all users share a single precomputed
+password hash, so no bcrypt work is done per row. Rows are generated in
+batches and streamed with asyncpg `copy_records_to_table`.
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+import sys
+import time
+import uuid
+from typing import Callable, Iterator
+
+import asyncpg  # type: ignore
+import sqlalchemy
+
+from src.config import config
+from src.db import club_table, stadium_table, user_table
+from src.infrastructure.utils.password import hash_password
+
+CITIES = (
+    "Madrid", "London", "Manchester", "Milan", "Munich", "Barcelona",
+    "Paris", "Turin", "Lisbon", "Porto", "Amsterdam", "Glasgow",
+    "Warsaw", "Krakow", "Poznan", "Gdansk", "Wroclaw", "Lodz",
+    "Dortmund", "Liverpool", "Rome", "Naples", "Seville", "Valencia",
+    "Marseille", "Lyon", "Istanbul", "Athens", "Vienna", "Prague",
+    "Zagreb", "Belgrade", "Kyiv", "Bucharest", "Sofia", "Budapest",
+    "Bratislava", "Ljubljana", "Oslo", "Stockholm", "Copenhagen",
+    "Helsinki", "Dublin", "Cardiff", "Brussels", "Bern", "Basel",
+)
+PREFIXES = (
+    "FC", "Real", "Sporting", "Athletic", "Dynamo", "Olympique",
+    "Inter", "Racing", "Union", "AC", "SC", "KS",
+)
+SUFFIXES = (
+    "United", "City", "Rovers", "Wanderers", "Athletic", "Town",
+    "Albion", "1899", "1904", "Reserves", "Academy", "",
+)
+STADIUM_WORDS = (
+    "Arena", "Park", "Stadium", "Ground", "Field", "Bowl", "Dome",
+)
+FIRST_NAMES = (
+    "anna", "jan", "piotr", "maria", "john", "emma", "lukas", "sofia",
+    "marco", "laura", "pierre", "julia", "adam", "eva", "tomas", "nina",
+)
+DOMAINS = (
+    "gmail.com", "outlook.com", "yahoo.com", "wp.pl", "onet.pl",
+    "icloud.com", "proton.me", "example.com",
+)
+# 2024-01-01 00:00:00 UTC in milliseconds, user n registers n ms later.
+USERS_EPOCH_MS = 1_704_067_200_000
+
+
+def zipf_weights(size: int, exponent: float = 1.1) -> list[float]:
+    """A function building cumulative Zipf weights.
+
+    Args:
+        size (int): The number of ranks.
+        exponent (float, optional): The skew. Defaults to 1.1.
+
+    Returns:
+        list[float]: The cumulative weights for `random.choices`.
+    """
+
+    return list(itertools.accumulate(
+        1 / rank ** exponent for rank in range(1, size + 1)
+    ))
+
+
+CITY_TABLE = tuple(
+    city
+    for city, rank in zip(CITIES, range(1, len(CITIES) + 1))
+    for _ in range(max(1, round(1000 / rank ** 1.1)))
+)
+
+
+def club_name(club_id: int, seed: int) -> str:
+    """A function generating the realistic name of the club.
+
+    The name is a pure function of the id, so stadiums can refer to
+    their clubs without keeping the clubs in memory.
+
+    Args:
+        club_id (int): The id of the club.
+        seed (int): The dataset seed.
+
+    Returns:
+        str: The club name.
+    """
+
+    mix = ((club_id + seed) * 0x9E3779B1) & 0xFFFFFFFF
+    parts = (
+        PREFIXES[mix % len(PREFIXES)],
+        CITY_TABLE[(mix >> 4) % len(CITY_TABLE)],
+        SUFFIXES[(mix >> 16) % len(SUFFIXES)],
+        str(club_id),
+    )
+
+    return " ".join(filter(None, parts))
+
+
+def clubs(count: int, seed: int, batch: int) -> Iterator[list[tuple]]:
+    """A function generating club rows in batches.
+
+    Args:
+        count (int): The number of rows.
+        seed (int): The seed of the random generator.
+        batch (int): The batch size.
+
+    Yields:
+        Iterator[list[tuple]]: Rows of (id, name, place, club_id).
+    """
+
+    rng = random.Random(f"clubs-{seed}")
+
+    for start in range(1, count + 1, batch):
+        size = min(batch, count - start + 1)
+        yield [
+            (
+                club_id,
+                club_name(club_id, seed),
+                str(rng.randint(1, 20)),
+                club_id,
+            )
+            for club_id in range(start, start + size)
+        ]
+
+
+def stadiums(
+    count: int,
+    club_count: int,
+    seed: int,
+    batch: int,
+) -> Iterator[list[tuple]]:
+    """A function generating stadium rows in batches.
+
+    Popular clubs get disproportionately many stadiums.
+
+    Args:
+        count (int): The number of rows.
+        club_count (int): The number of generated clubs.
+        seed (int): The seed of the random generator.
+        batch (int): The batch size.
+
+    Yields:
+        Iterator[list[tuple]]: Rows of (id, name, club name).
+    """
+
+    rng = random.Random(f"stadiums-{seed}")
+    popular = min(club_count, 10_000) or 1
+    weights = zipf_weights(popular)
+
+    for start in range(1, count + 1, batch):
+        size = min(batch, count - start + 1)
+        owners = rng.choices(
+            range(1, popular + 1),
+            cum_weights=weights,
+            k=size,
+        )
+        yield [
+            (
+                stadium_id,
+                f"{CITY_TABLE[rng.randrange(len(CITY_TABLE))]} "
+                f"{STADIUM_WORDS[rng.randrange(len(STADIUM_WORDS))]} "
+                f"{stadium_id}",
+                club_name(owner, seed),
+            )
+            for stadium_id, owner in zip(range(start, start + size), owners)
+        ]
+
+
+def user_id(number: int, rng: random.Random) -> uuid.UUID:
+    """A function generating the UUIDv7 of the user deterministically.
+
+    Users are registered one per millisecond after `USERS_EPOCH_MS`, so
+    the ids grow with the user number like the ones the application
+    generates, and the counter and random bits come from the seeded
+    generator.
+
+    Args:
+        number (int): The user number.
+        rng (random.Random): The seeded random generator.
+
+    Returns:
+        uuid.UUID: The UUID.
+    """
+
+    return uuid.UUID(
+        int=(USERS_EPOCH_MS + number) << 80
+        | 0x7 << 76
+        | rng.getrandbits(12) << 64
+        | 0b10 << 62
+        | rng.getrandbits(62),
+    )
+
+
+def users(
+    count: int,
+    seed: int,
+    batch: int,
+    password_hash: str,
+) -> Iterator[list[tuple]]:
+    """A function generating user rows in batches.
+
+    Args:
+        count (int): The number of rows.
+        seed (int): The seed of the random generator.
+        batch (int): The batch size.
+        password_hash (str): The hash shared by all users.
+
+    Yields:
+        Iterator[list[tuple]]: Rows of (id, email, password).
+    """
+
+    rng = random.Random(f"users-{seed}")
+    weights = zipf_weights(len(DOMAINS), 1.5)
+
+    for start in range(1, count + 1, batch):
+        size = min(batch, count - start + 1)
+        domains = rng.choices(DOMAINS, cum_weights=weights, k=size)
+        yield [
+            (
+                user_id(number, rng),
+                f"{FIRST_NAMES[number % len(FIRST_NAMES)]}.{number}@{domain}",
+                password_hash,
+            )
+            for number, domain in zip(range(start, start + size), domains)
+        ]
+
+
+async def load(
+    connection: asyncpg.Connection,
+    table: sqlalchemy.Table,
+    columns: list[str],
+    batches: Iterator[list[tuple]],
+    total: int,
+) -> None:
+    """A function streaming the batches into the table with COPY.
+
+    Args:
+        connection (asyncpg.Connection): The database connection.
+        table (sqlalchemy.Table): The target table definition.
+        columns (list[str]): The loaded columns.
+        batches (Iterator[list[tuple]]): The generated rows.
+        total (int): The expected number of rows.
+    """
+
+    start = time.perf_counter()
+    loaded = 0
+
+    for rows in batches:
+        await connection.copy_records_to_table(
+            table.name,
+            records=rows,
+            columns=columns,
+        )
+        loaded += len(rows)
+        elapsed = time.perf_counter() - start
+        print(
+            f"\r{table.name}: {loaded}/{total} rows "
+            f"({loaded / elapsed:,.0f} rows/s)",
+            end="",
+            file=sys.stderr,
+        )
+
+    if loaded and isinstance(table.c.id.type, sqlalchemy.Integer):
+        await connection.execute(
+            f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+            f"(SELECT max(id) FROM {table.name}))"
+        )
+    print(file=sys.stderr)
+
+
+async def generate(args: argparse.Namespace) -> None:
+    """A function generating and loading the dataset.
+
+    Args:
+        args (argparse.Namespace): The command line arguments.
+    """
+
+    connection = await asyncpg.connect(args.dsn)
+    try:
+        if args.truncate:
+            await connection.execute(
+                f"TRUNCATE {club_table.name}, {stadium_table.name}, "
+                f"{user_table.name} RESTART IDENTITY CASCADE"
+            )
+
+        jobs: list[tuple[sqlalchemy.Table, list, int, Callable]] = [
+            (
+                club_table,
+                [club_table.c.id, club_table.c.name, club_table.c.place,
+                 club_table.c.club_id],
+                args.clubs,
+                lambda: clubs(args.clubs, args.seed, args.batch),
+            ),
+            (
+                stadium_table,
+                [stadium_table.c.id, stadium_table.c.name,
+                 stadium_table.c["club name"]],
+                args.stadiums,
+                lambda: stadiums(
+                    args.stadiums, args.clubs, args.seed, args.batch,
+                ),
+            ),
+            (
+                user_table,
+                [user_table.c.id, user_table.c.email,
+                 user_table.c.password],
+                args.users,
+                lambda: users(
+                    args.users, args.seed, args.batch,
+                    hash_password(args.password),
+                ),
+            ),
+        ]
+
+        for table, columns, total, batches in jobs:
+            if total:
+                await load(
+                    connection,
+                    table,
+                    [column.name for column in columns],
+                    batches(),
+                    total,
+                )
+    finally:
+        await connection.close()
+
+
+def main() -> int:
+    """The entry point of the dataset generator.
+
+    Returns:
+        int: The process exit code.
+    """
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.dataset")
+    parser.add_argument(
+        "--dsn",
+        default=(
+            f"postgresql://{config.DB_USER}:{config.DB_PASSWORD}"
+            f"@{config.DB_HOST}/{config.DB_NAME}"
+        ),
+    )
+    parser.add_argument("--clubs", type=int, default=100_000)
+    parser.add_argument("--stadiums", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch", type=int, default=50_000)
+    parser.add_argument("--password", default="password")
+    parser.add_argument(
+        "--truncate",
+        action="store_true",
+        help="empty the tables before loading",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(generate(args))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,464 @@
+"""An end-to-end HTTP load generator for the app.
+
+Usage:
+    python -m benchmarks.loadgen --base-url http://localhost:8000 \\
+        --duration 30 --rate 200 \\
+        --mix list_clubs=5,get_club=3,create_club=1,token=1 \\
+        --out load.json
+
+With `--rate` the arrivals are open-loop (Poisson) and latency is counted
+from the scheduled start, so queueing in the client is not hidden. With
+`--concurrency` only, a closed loop of that many workers is used. With
+`--profile-rate` and `--admin-token`, a fraction of requests asks the
+server for a profile and the collected profile summaries are included in
+the report.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+import httpx
+
+PASSWORD = "l0adgen-password"
+BATCH_SIZE = 100
+
+
+@dataclass
+class RouteStats:
+    """A class collecting the samples of a single operation."""
+
+    latencies: list[float] = field(default_factory=list)
+    statuses: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    errors: int = 0
+
+    def summary(self, elapsed: float) -> dict:
+        """The method summarizing the samples.
+
+        Args:
+            elapsed (float): The duration of the run in seconds.
+
+        Returns:
+            dict: The throughput and latency percentiles in milliseconds.
+        """
+
+        latencies = sorted(self.latencies)
+
+        return {
+            "requests": len(latencies),
+            "throughput": len(latencies) / elapsed if elapsed else 0.0,
+            "errors": self.errors,
+            "statuses": dict(self.statuses),
+            "latency_ms": {
+                name: percentile(latencies, q) * 1000
+                for name, q in (
+                    ("p50", 0.5),
+                    ("p95", 0.95),
+                    ("p99", 0.99),
+                    ("p999", 0.999),
+                )
+            } | {
+                "mean": sum(latencies) / len(latencies) * 1000
+                if latencies else 0.0,
+                "max": latencies[-1] * 1000 if latencies else 0.0,
+            },
+        }
+
+
+def percentile(values: list[float], q: float) -> float:
+    """A function computing the nearest-rank percentile.
+
+    Args:
+        values (list[float]): The sorted values.
+        q (float): The quantile between 0 and 1.
+
+    Returns:
+        float: The percentile, 0.0 for no values.
+    """
+
+    if not values:
+        return 0.0
+
+    return values[min(len(values) - 1, max(0, int(q * len(values) + 0.5) - 1))]
+
+
+class Workload:
+    """A class generating the requests of the configured mix."""
+
+    def __init__(self, client: httpx.AsyncClient, seed: int) -> None:
+        """The initializer of the workload.
+
+        Args:
+            client (httpx.AsyncClient): The HTTP client.
+            seed (int): The seed of the random generator.
+        """
+
+        self.client = client
+        self.random = random.Random(seed)
+        self.club_ids: list[int] = []
+        self.stadium_ids: list[int] = []
+        self.users: list[str] = []
+        self.counter = itertools.count()
+        self.operations: dict[str, Callable[[dict], Awaitable]] = {
+            "list_clubs": self.list_clubs,
+            "list_stadiums": self.list_stadiums,
+            "get_club": self.get_club,
+            "get_stadium": self.get_stadium,
+            "create_club": self.create_club,
+            "create_stadium": self.create_stadium,
+            "update_club": self.update_club,
+            "update_stadium": self.update_stadium,
+            "delete_club": self.delete_club,
+            "delete_stadium": self.delete_stadium,
+            "batch_clubs": self.batch_clubs,
+            "batch_stadiums": self.batch_stadiums,
+            "register": self.register,
+            "token": self.token,
+        }
+
+    async def prepare(self) -> None:
+        """The method seeding the ids and users used by the operations."""
+
+        for _ in range(10):
+            await self.create_club({})
+            await self.create_stadium({})
+        await self.register({})
+
+    def _club(self) -> dict:
+        number = next(self.counter)
+        return {
+            "name": f"Load club {number}",
+            "place": self.random.randint(1, 20),
+            "clubId": number,
+        }
+
+    def _stadium(self) -> dict:
+        number = next(self.counter)
+        return {
+            "clubName": f"Load club {number}",
+            "stadiumsName": f"Load stadium {number}",
+            "stadiumsId": number,
+            "amountOfSeats": self.random.randint(1000, 90000),
+        }
+
+    def _pick(self, ids: list[int]) -> int:
+        return self.random.choice(ids) if ids else 1
+
+    async def list_clubs(self, headers: dict) -> httpx.Response:
+        """The operation listing all clubs."""
+        return await self.client.get("/club/all", headers=headers)
+
+    async def list_stadiums(self, headers: dict) -> httpx.Response:
+        """The operation listing all stadiums."""
+        return await self.client.get("/stadium/all", headers=headers)
+
+    async def get_club(self, headers: dict) -> httpx.Response:
+        """The operation getting a known club."""
+        return await self.client.get(
+            f"/club/{self._pick(self.club_ids)}",
+            headers=headers,
+        )
+
+    async def get_stadium(self, headers: dict) -> httpx.Response:
+        """The operation getting a known stadium."""
+        return await self.client.get(
+            f"/stadium/{self._pick(self.stadium_ids)}",
+            headers=headers,
+        )
+
+    async def create_club(self, headers: dict) -> httpx.Response:
+        """The operation creating a club."""
+        response = await self.client.post(
+            "/club/create",
+            json=self._club(),
+            headers=headers,
+        )
+        if response.status_code == 201 and "id" in response.json():
+            self.club_ids.append(response.json()["id"])
+        return response
+
+    async def create_stadium(self, headers: dict) -> httpx.Response:
+        """The operation creating a stadium."""
+        response = await self.client.post(
+            "/stadium/create",
+            json=self._stadium(),
+            headers=headers,
+        )
+        if response.status_code == 201 and "id" in response.json():
+            self.stadium_ids.append(response.json()["id"])
+        return response
+
+    async def update_club(self, headers: dict) -> httpx.Response:
+        """The operation updating a known club."""
+        return await self.client.put(
+            f"/club/{self._pick(self.club_ids)}",
+            json=self._club(),
+            headers=headers,
+        )
+
+    async def update_stadium(self, headers: dict) -> httpx.Response:
+        """The operation updating a known stadium."""
+        return await self.client.put(
+            f"/stadium/{self._pick(self.stadium_ids)}",
+            json=self._stadium(),
+            headers=headers,
+        )
+
+    async def delete_club(self, headers: dict) -> httpx.Response:
+        """The operation deleting a known club."""
+        club_id = self.club_ids.pop() if len(self.club_ids) > 1 else 0
+        return await self.client.delete(f"/club/{club_id}", headers=headers)
+
+    async def delete_stadium(self, headers: dict) -> httpx.Response:
+        """The operation deleting a known stadium."""
+        stadium_id = self.stadium_ids.pop() if len(self.stadium_ids) > 1 \
+            else 0
+        return await self.client.delete(
+            f"/stadium/{stadium_id}",
+            headers=headers,
+        )
+
+    async def batch_clubs(self, headers: dict) -> httpx.Response:
+        """The operation creating a batch of clubs in one request."""
+        return await self.client.post(
+            "/club/batch",
+            json={"operations": [
+                {"op": "create", "data": self._club()}
+                for _ in range(BATCH_SIZE)
+            ]},
+            headers=headers,
+        )
+
+    async def batch_stadiums(self, headers: dict) -> httpx.Response:
+        """The operation creating a batch of stadiums in one request."""
+        return await self.client.post(
+            "/stadium/batch",
+            json={"operations": [
+                {"op": "create", "data": self._stadium()}
+                for _ in range(BATCH_SIZE)
+            ]},
+            headers=headers,
+        )
+
+    async def register(self, headers: dict) -> httpx.Response:
+        """The operation registering a new user."""
+        email = f"load-{time.time_ns()}-{next(self.counter)}@example.com"
+        response = await self.client.post(
+            "/register",
+            json={"email": email, "password": PASSWORD},
+            headers=headers,
+        )
+        if response.status_code == 201:
+            self.users.append(email)
+        return response
+
+    async def token(self, headers: dict) -> httpx.Response:
+        """The operation authenticating a registered user."""
+        email = self.random.choice(self.users) if self.users else "x@x.x"
+        return await self.client.post(
+            "/token",
+            json={"email": email, "password": PASSWORD},
+            headers=headers,
+        )
+
+
+def parse_mix(mix: str, known: dict) -> dict[str, float]:
+    """A function parsing the request mix.
+
+    Args:
+        mix (str): Comma separated `operation=weight` pairs.
+        known (dict): The available operations.
+
+    Raises:
+        ValueError: If the operation is unknown.
+
+    Returns:
+        dict[str, float]: The weights of the operations.
+    """
+
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in known:
+            raise ValueError(
+                f"Unknown operation {name!r}, expected one of "
+                f"{', '.join(known)}"
+            )
+        weights[name] = float(weight or 1)
+
+    return weights
+
+
+async def run_load(args: argparse.Namespace) -> dict:
+    """A function running the load test.
+
+    Args:
+        args (argparse.Namespace): The command line arguments.
+
+    Returns:
+        dict: The machine-readable report.
+    """
+
+    limits = httpx.Limits(
+        max_connections=args.connections,
+        max_keepalive_connections=args.connections,
+    )
+    async with httpx.AsyncClient(
+        base_url=args.base_url,
+        limits=limits,
+        timeout=args.timeout,
+    ) as client:
+        workload = Workload(client, args.seed)
+        weights = parse_mix(args.mix, workload.operations)
+        names, cumulative = list(weights), list(weights.values())
+        stats: dict[str, RouteStats] = defaultdict(RouteStats)
+        await workload.prepare()
+
+        profile_headers = {
+            "X-Profile": "1",
+            "X-Admin-Token": args.admin_token or "",
+        }
+
+        async def issue(name: str, scheduled: float) -> None:
+            headers = profile_headers \
+                if workload.random.random() < args.profile_rate else {}
+            route = stats[name]
+            try:
+                response = await workload.operations[name](headers)
+                route.statuses[str(response.status_code)] += 1
+                if response.status_code >= 500:
+                    route.errors += 1
+            except httpx.HTTPError as error:
+                route.errors += 1
+                route.statuses[type(error).__name__] += 1
+            route.latencies.append(time.perf_counter() - scheduled)
+
+        def choose() -> str:
+            return workload.random.choices(names, weights=cumulative)[0]
+
+        start = time.perf_counter()
+        deadline = start + args.duration
+
+        if args.rate:
+            in_flight: set[asyncio.Task] = set()
+            scheduled = start
+            dropped = 0
+            while scheduled < deadline:
+                scheduled += workload.random.expovariate(args.rate)
+                if (delay := scheduled - time.perf_counter()) > 0:
+                    await asyncio.sleep(delay)
+                if len(in_flight) >= args.concurrency:
+                    dropped += 1
+                    continue
+                task = asyncio.create_task(issue(choose(), scheduled))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            await asyncio.gather(*in_flight)
+        else:
+            dropped = 0
+
+            async def worker() -> None:
+                while time.perf_counter() < deadline:
+                    await issue(choose(), time.perf_counter())
+
+            await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+
+        elapsed = time.perf_counter() - start
+        profiles = []
+        if args.profile_rate and args.admin_token:
+            response = await client.get(
+                "/admin/profiles",
+                headers={"X-Admin-Token": args.admin_token},
+            )
+            if response.status_code == 200:
+                profiles = response.json()
+
+    total = RouteStats()
+    for route in stats.values():
+        total.latencies.extend(route.latencies)
+        total.errors += route.errors
+        for status, count in route.statuses.items():
+            total.statuses[status] += count
+
+    return {
+        "config": {
+            key: value
+            for key, value in vars(args).items()
+            if key != "admin_token"
+        },
+        "elapsed": elapsed,
+        "dropped": dropped,
+        "total": total.summary(elapsed),
+        "routes": {
+            name: route.summary(elapsed) for name, route in stats.items()
+        },
+        "profiles": profiles,
+    }
+
+
+def main() -> int:
+    """The entry point of the load generator.
+
+    Returns:
+        int: The process exit code.
+    """
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.loadgen")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=0.0,
+        help="open-loop arrival rate in requests per second",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=32,
+        help="closed-loop workers, or the in-flight cap with --rate",
+    )
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument(
+        "--mix",
+        default="list_clubs=4,list_stadiums=4,get_club=4,get_stadium=4,"
+        "create_club=1,create_stadium=1,update_club=1,update_stadium=1,"
+        "token=1",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--profile-rate", type=float, default=0.0)
+    parser.add_argument("--admin-token")
+    parser.add_argument("--out", help="report file, stdout by default")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_load(args))
+    document = json.dumps(report, indent=2)
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as file:
+            file.write(document)
+    else:
+        print(document)
+
+    total = report["total"]
+    print(
+        f"{total['requests']} requests, {total['throughput']:.1f} req/s, "
+        f"p99 {total['latency_ms']['p99']:.1f} ms, "
+        f"{total['errors']} errors",
+        file=sys.stderr,
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
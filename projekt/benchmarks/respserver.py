@@ -0,0 +1,173 @@
+"""A module containing a local stand-in of the shared cache server.
+
+It speaks enough of the Redis protocol for the cache: PING, GET, SET
+with PX, DEL, INCR and FLUSHALL, with the data kept in memory. It lets
+the shared cache be benchmarked and tried out without Redis:
+
+    python -m benchmarks.respserver --port 6379
+    CACHE_URL=redis://localhost:6379/0 uvicorn src.main:app
+"""
+
+import argparse
+import asyncio
+from time import monotonic
+
+from src.infrastructure.utils.resp import _encode, _read_reply
+
+
+class RespServer:
+    """A class serving the RESP commands from memory."""
+
+    def __init__(self) -> None:
+        """The initializer of the server."""
+
+        self.data: dict[bytes, tuple[bytes, float | None]] = {}
+        self._server: asyncio.Server | None = None
+        self._connections: dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """The method starting to accept the connections.
+
+        Args:
+            host (str, optional): The bound host. Defaults to 127.0.0.1.
+            port (int, optional): The bound port, 0 for any free one.
+                Defaults to 0.
+
+        Returns:
+            int: The bound port.
+        """
+
+        self._server = await asyncio.start_server(self._serve, host, port)
+
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """The method closing the server and its open connections."""
+
+        if self._server is not None:
+            self._server.close()
+            for writer in self._connections.values():
+                writer.close()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+
+    async def _serve(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """A private method answering the commands of the connection.
+
+        Args:
+            reader (asyncio.StreamReader): The reader of the connection.
+            writer (asyncio.StreamWriter): The writer of the connection.
+        """
+
+        task = asyncio.current_task()
+        if task is not None:
+            self._connections[task] = writer
+        try:
+            while True:
+                command = await _read_reply(reader)
+                if not isinstance(command, list) or not command:
+                    break
+                writer.write(self._execute(command))
+                await writer.drain()
+        except (OSError, EOFError):
+            pass
+        finally:
+            self._connections.pop(task, None)  # type: ignore
+            writer.close()
+
+    def _execute(self, command: list) -> bytes:
+        """A private method executing the command.
+
+        Args:
+            command (list): The command name and its arguments.
+
+        Returns:
+            bytes: The encoded reply.
+        """
+
+        name, args = command[0].upper(), command[1:]
+
+        if name == b"PING":
+            return b"+PONG\r\n"
+        if name in (b"AUTH", b"SELECT"):
+            return b"+OK\r\n"
+        if name == b"GET":
+            value = self._get(args[0])
+            return b"$-1\r\n" if value is None else _bulk(value)
+        if name == b"SET":
+            expiry = None
+            if len(args) == 4 and args[2].upper() == b"PX":
+                expiry = monotonic() + int(args[3]) / 1000
+            self.data[args[0]] = (args[1], expiry)
+            return b"+OK\r\n"
+        if name == b"DEL":
+            deleted = sum(self.data.pop(key, None) is not None for key in args)
+            return b":%d\r\n" % deleted
+        if name == b"INCR":
+            value = int(self._get(args[0]) or 0) + 1
+            self.data[args[0]] = (str(value).encode(), None)
+            return b":%d\r\n" % value
+        if name == b"FLUSHALL":
+            self.data.clear()
+            return b"+OK\r\n"
+
+        return b"-ERR unknown command '%s'\r\n" % name
+
+    def _get(self, key: bytes) -> bytes | None:
+        """A private method getting the value unless expired.
+
+        Args:
+            key (bytes): The key.
+
+        Returns:
+            bytes | None: The value, None if missing.
+        """
+
+        value, expiry = self.data.get(key, (None, None))
+        if expiry is not None and expiry <= monotonic():
+            del self.data[key]
+            return None
+
+        return value
+
+
+def _bulk(value: bytes) -> bytes:
+    """A private function encoding the bulk string reply.
+
+    Args:
+        value (bytes): The value.
+
+    Returns:
+        bytes: The encoded reply.
+    """
+
+    return _encode((value,))[len(b"*1\r\n"):]
+
+
+async def serve(host: str, port: int) -> None:
+    """A function serving until interrupted.
+
+    Args:
+        host (str): The bound host.
+        port (int): The bound port.
+    """
+
+    server = RespServer()
+    port = await server.start(host, port)
+    print(f"RESP stand-in listening on {host}:{port}")
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.respserver")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6379)
+    options = parser.parse_args()
+    try:
+        asyncio.run(serve(options.host, options.port))
+    except KeyboardInterrupt:
+        pass
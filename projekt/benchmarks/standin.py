@@ -0,0 +1,227 @@
+"""A module containing in-memory stand-ins used by the benchmarks."""
+
+import os
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import Any
+
+import databases
+
+from src.db import query_tracer
+from src.infrastructure.repositories import (
+    batch,
+    clubdb,
+    coalesce,
+    invalidation,
+    stadiumdb,
+    user,
+)
+from src.infrastructure.utils.prepared import PREPARED_POOL_OPTIONS
+from src.infrastructure.utils.querytrace import TracedDatabase
+
+REPOSITORY_MODULES = (
+    batch,
+    clubdb,
+    coalesce,
+    invalidation,
+    stadiumdb,
+    user,
+)
+
+
+def club_rows(count: int) -> list[dict]:
+    """A function generating club rows as returned by the database.
+
+    Args:
+        count (int): The number of rows.
+
+    Returns:
+        list[dict]: The club rows.
+    """
+
+    return [
+        {"id": i, "name": f"Club {i}", "place": i % 20 + 1, "clubId": i}
+        for i in range(1, count + 1)
+    ]
+
+
+def stadium_rows(count: int) -> list[dict]:
+    """A function generating stadium rows as returned by the database.
+
+    Args:
+        count (int): The number of rows.
+
+    Returns:
+        list[dict]: The stadium rows.
+    """
+
+    return [
+        {
+            "id": i,
+            "clubName": f"Club {i}",
+            "stadiumsName": f"Stadium {i}",
+            "stadiumsId": i,
+            "amountOfSeats": 10000 + i,
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+class InMemoryDatabase:
+    """A class standing in for `databases.Database` without I/O.
+
+    It returns the prepared rows for every query, so the benchmarks
+    measure the repository overhead: building the statements and mapping
+    the records to the domain models.
+    """
+
+    def __init__(self, rows: list[dict]) -> None:
+        """The initializer of the stand-in.
+
+        Args:
+            rows (list[dict]): The rows returned by the queries.
+        """
+
+        self.rows = rows
+
+    async def fetch_all(self, query: Any, values: Any = None) -> list:
+        """The method returning all prepared rows."""
+
+        return self.rows
+
+    async def fetch_one(self, query: Any, values: Any = None) -> Any:
+        """The method returning the first prepared row."""
+
+        return self.rows[0] if self.rows else None
+
+    async def fetch_prepared(self, name: str, *args: Any) -> Any:
+        """The method returning the first prepared row."""
+
+        return self.rows[0] if self.rows else None
+
+    async def fetch_val(
+        self,
+        query: Any,
+        values: Any = None,
+        column: Any = 0,
+    ) -> Any:
+        """The method returning the first value of the first row."""
+
+        return next(iter(self.rows[0].values())) if self.rows else None
+
+    async def execute(self, query: Any, values: Any = None) -> Any:
+        """The method returning the id of the first prepared row."""
+
+        return self.rows[0]["id"] if self.rows else None
+
+    async def execute_many(self, query: Any, values: list) -> None:
+        """The method ignoring the statement."""
+
+    def transaction(self) -> AbstractAsyncContextManager:
+        """The method returning a transaction doing nothing."""
+
+        return nullcontext()
+
+
+async def benchmark_database(rows: list[dict]) -> Any:
+    """A function getting the database used by repository benchmarks.
+
+    The `BENCH_DATABASE_URL` environment variable selects a real
+    Postgres database, otherwise the in-memory stand-in is used.
+
+    Args:
+        rows (list[dict]): The rows served by the stand-in.
+
+    Returns:
+        Any: The connected database or the stand-in.
+    """
+
+    if os.environ.get("BENCH_DATABASE_URL"):
+        return await postgres_database()
+
+    return InMemoryDatabase(rows)
+
+
+async def postgres_database() -> TracedDatabase:
+    """A function connecting the database selected by `BENCH_DATABASE_URL`.
+
+    Benchmarks comparing the database round trips use it directly, as
+    the in-memory stand-in has none to compare.
+
+    Raises:
+        RuntimeError: If `BENCH_DATABASE_URL` is not set.
+
+    Returns:
+        TracedDatabase: The connected database.
+    """
+
+    url = os.environ.get("BENCH_DATABASE_URL")
+    if not url:
+        raise RuntimeError("BENCH_DATABASE_URL is not set")
+
+    database = TracedDatabase(
+        databases.Database(url, **PREPARED_POOL_OPTIONS),
+        query_tracer,
+    )
+    await database.connect()
+
+    return database
+
+
+def use_database(database: Any) -> None:
+    """A function making the repositories use the database.
+
+    The benchmarks run in a dedicated process, so the swap is permanent.
+
+    Args:
+        database (Any): The database or its stand-in.
+    """
+
+    for module in REPOSITORY_MODULES:
+        module.database = database
+
+
+async def asgi_get(
+    app: Any,
+    path: str,
+    query: bytes = b"",
+    headers: list[tuple[bytes, bytes]] | None = None,
+) -> bytes:
+    """A function performing a GET request directly against the ASGI app.
+
+    Args:
+        app (Any): The ASGI application.
+        path (str): The request path.
+        query (bytes, optional): The query string. Defaults to b"".
+        headers (list[tuple[bytes, bytes]] | None, optional): Additional
+            request headers.
+
+    Returns:
+        bytes: The response body.
+    """
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query,
+        "headers": [(b"host", b"bench"), *(headers or [])],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+    body = []
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+
+    return b"".join(body)
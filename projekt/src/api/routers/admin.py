@@ -0,0 +1,100 @@
+"""A module containing administrative endpoints."""
+
+from typing import Iterable
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from src.api.utils.admin import require_admin
+from src.api.utils.profiling import profiles
+from src.db import query_tracer
+from src.infrastructure.repositories.rekey import (
+    count_random_ids,
+    rekey_users,
+)
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@router.get("/queries/slow", status_code=200)
+async def get_slow_queries() -> Iterable:
+    """An endpoint for getting the recent slow queries.
+
+    Returns:
+        Iterable: The slow query traces, the most recent last.
+    """
+
+    return [trace.to_dict() for trace in query_tracer.slow_queries]
+
+
+@router.get("/queries/explain", status_code=200)
+async def get_query_plans() -> Iterable:
+    """An endpoint for getting the sampled plans of the slowest queries.
+
+    Returns:
+        Iterable: The slow query traces with `EXPLAIN ANALYZE` output.
+    """
+
+    return list(query_tracer.explains)
+
+
+@router.get("/profiles", status_code=200)
+async def get_profiles() -> Iterable:
+    """An endpoint for listing the stored request profiles.
+
+    Returns:
+        Iterable: The profile summaries, the most recent last.
+    """
+
+    return [
+        {
+            key: value
+            for key, value in profile.items()
+            if key not in ("profile", "allocations")
+        }
+        for profile in profiles
+    ]
+
+
+@router.get("/profiles/{profileId}", status_code=200)
+async def get_profile(profileId: str) -> dict:
+    """An endpoint for getting the stored request profile.
+
+    Args:
+        profileId (str): The id returned in the `X-Profile-Id` header.
+
+    Raises:
+        HTTPException: 404 if the profile does not exist.
+
+    Returns:
+        dict: The profile report.
+    """
+
+    if profile := next((p for p in profiles if p["id"] == profileId), None):
+        return profile
+
+    raise HTTPException(status_code=404, detail="Profile not found")
+
+
+@router.post("/users/rekey", status_code=200)
+async def rekey_user_ids(
+    batch_size: int = Query(1000, ge=1, le=10000),
+    dry_run: bool = Query(True),
+) -> dict:
+    """An endpoint for migrating the random user ids to UUIDv7.
+
+    Rekeyed users are logged out, as their issued tokens carry the old
+    ids. By default it only counts the affected users; the ids are
+    changed with `dry_run=false`.
+
+    Args:
+        batch_size (int): The users rekeyed per transaction.
+        dry_run (bool): Whether to only count the affected users.
+
+    Returns:
+        dict: The number of affected or rekeyed users.
+    """
+
+    if dry_run:
+        return {"rekeyed": await count_random_ids(), "dry_run": True}
+
+    return {"rekeyed": await rekey_users(batch_size), "dry_run": False}
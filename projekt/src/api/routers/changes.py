@@ -0,0 +1,61 @@
+"""A module containing the change feed endpoints."""
+
+import asyncio
+from typing import AsyncIterator
+
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+
+from src.config import config
+from src.db import change_feed
+
+router = APIRouter()
+
+
+@router.get("/stream", response_class=StreamingResponse)
+async def stream_changes() -> StreamingResponse:
+    """An endpoint streaming club and stadium changes as server-sent events.
+
+    Every insert, update and delete is sent as a `change` event with the
+    table, operation and id. A `reload` operation means that too many
+    rows changed at once and the table should be fetched again. Clients
+    that fall behind receive a `dropped` event and are disconnected.
+
+    Returns:
+        StreamingResponse: The `text/event-stream` response.
+    """
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _events() -> AsyncIterator[str]:
+    """A private function rendering the subscription as events.
+
+    Yields:
+        AsyncIterator[str]: The server-sent events.
+    """
+
+    subscription = change_feed.subscribe()
+    try:
+        yield "retry: 3000\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    subscription.get(),
+                    config.CHANGE_FEED_KEEPALIVE,
+                )
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+
+            if event is None:
+                yield "event: dropped\ndata: {}\n\n"
+                return
+
+            yield f"event: change\ndata: {event.to_json()}\n\n"
+    finally:
+        change_feed.unsubscribe(subscription)
@@ -2,21 +2,37 @@
 
 from typing import Iterable
 
-from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
-
-from src.container import Container
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import StreamingResponse
+
+from src.api.utils.count import CountMode, with_total_count
+from src.api.utils.di import resolved
+from src.api.utils.fields import parse_fields, projected_response
+from src.container import container
+from src.core.domain.batch import BatchRequest, BatchResult
+from src.core.domain.changes import CHANGE_CURSOR_PATTERN, ChangeSet
 from src.core.domain.club import Club, ClubIn
 from src.infrastructure.services.iclub import IClubService
 
 router = APIRouter()
 
+CHANGES_PAGE_SIZE = 1000
+CHANGES_MAX_PAGE_SIZE = 10000
+
+club_service = resolved(container.club_service)
+
 
 @router.post("/create", response_model=Club, status_code=201)
-@inject
 async def create_club(
     club: ClubIn,
-    service: IClubService = Depends(Provide[Container.club_service]),
+    service: IClubService = Depends(club_service),
 ) -> dict:
     """An endpoint for adding new clubs.
 
@@ -33,45 +49,181 @@ async def create_club(
     return new_club.model_dump() if new_club else {}
 
 
+@router.post("/batch", response_model=list[BatchResult], status_code=200)
+async def apply_club_batch(
+    batch: BatchRequest[ClubIn],
+    service: IClubService = Depends(club_service),
+) -> list:
+    """An endpoint applying club creates, updates and deletes in bulk.
+
+    All operations run in a single transaction. Missing clubs are
+    reported in the per-item results without aborting the batch.
+
+    Args:
+        batch (BatchRequest[ClubIn]): The operations to apply.
+        service (IClubService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 400 if the batch is invalid.
+
+    Returns:
+        list: The per-item results in the order of the operations.
+    """
+
+    try:
+        return await service.apply_batch(batch.operations)
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error)) from error
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_clubs(
+    service: IClubService = Depends(club_service),
+) -> StreamingResponse:
+    """An endpoint streaming all clubs as CSV.
+
+    Args:
+        service (IClubService, optional): The injected service dependency.
+
+    Returns:
+        StreamingResponse: The CSV produced by `COPY ... TO STDOUT`.
+    """
+
+    return StreamingResponse(
+        service.export_csv(),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="clubs.csv"'},
+    )
+
+
+@router.post("/import", status_code=201)
+async def import_clubs(
+    request: Request,
+    service: IClubService = Depends(club_service),
+) -> dict:
+    """An endpoint loading clubs from the CSV request body.
+
+    The body is streamed into `COPY ... FROM STDIN`. The first line is a
+    header of column names; all rows are rejected if any row is invalid.
+
+    Args:
+        request (Request): The request with the `text/csv` body.
+        service (IClubService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 400 if the CSV is invalid.
+
+    Returns:
+        dict: The number of imported rows.
+    """
+
+    try:
+        rows = await service.import_csv(request.stream())
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error)) from error
+
+    return {"rows": rows}
+
+
+@router.get("/changes", response_model=ChangeSet, status_code=200)
+async def get_club_changes(
+    since: str = Query("0", pattern=CHANGE_CURSOR_PATTERN),
+    limit: int = Query(CHANGES_PAGE_SIZE, ge=1, le=CHANGES_MAX_PAGE_SIZE),
+    service: IClubService = Depends(club_service),
+) -> ChangeSet:
+    """An endpoint for getting the clubs changed since the cursor.
+
+    The first sync starts from 0. Every response carries the cursor of
+    the next request; while `more` is set, the client keeps paging.
+
+    Args:
+        since (str, optional): The cursor of the last synced change.
+        limit (int, optional): The maximum number of changes.
+        service (IClubService, optional): The injected service dependency.
+
+    Returns:
+        ChangeSet: The changed and deleted clubs and the next cursor.
+    """
+
+    return await service.get_changes(since, limit)
+
+
 @router.get("/all", response_model=Iterable[Club], status_code=200)
-@inject
 async def get_all_clubs(
-    service: IClubService = Depends(Provide[Container.club_service]),
+    response: Response,
+    fields: str | None = None,
+    count: CountMode | None = None,
+    service: IClubService = Depends(club_service),
 ) -> Iterable:
     """An endpoint for getting all clubs.
 
+    With `count` the total number of clubs is reported in the
+    `X-Total-Count` header, either exact or estimated from the planner
+    statistics.
+
     Args:
+        response (Response): The response to add the headers to.
+        fields (str | None, optional): Comma separated fields to return.
+        count (CountMode | None, optional): The total count mode.
         service (IClubService, optional): The injected service dependency.
 
+    Raises:
+        HTTPException: 400 if the fields cannot be projected.
+
     Returns:
         Iterable: The club attributes collection.
     """
 
+    total = await service.count_clubs(count == "approx") if count else None
+
+    if projection := parse_fields(fields, Club):
+        try:
+            clubs = await service.get_all_clubs(fields=projection)
+        except ValueError as error:
+            raise HTTPException(status_code=400, detail=str(error)) from error
+
+        return with_total_count(
+            projected_response(Club, projection, clubs),
+            total,
+        )
+
     clubs = await service.get_all_clubs()
+    with_total_count(response, total)
 
     return clubs
 
 
 @router.get("/{clubId}", response_model=Club, status_code=200)
-@inject
 async def get_club_by_id(
     clubId: int,
-    service: IClubService = Depends(Provide[Container.club_service]),
+    fields: str | None = None,
+    service: IClubService = Depends(club_service),
 ) -> dict:
     """An endpoint for getting club details by id.
 
     Args:
         clubIdd (int): The id of the club.
+        fields (str | None, optional): Comma separated fields to return.
         service (IClubService, optional): The injected service dependency.
 
     Raises:
+        HTTPException: 400 if the fields cannot be projected.
         HTTPException: 404 if club does not exist.
 
     Returns:
         dict: The requested club attributes.
     """
 
-    if club := await service.get_club_by_id(clubId=clubId):
+    if projection := parse_fields(fields, Club):
+        try:
+            club = await service.get_club_by_id(clubId, fields=projection)
+        except ValueError as error:
+            raise HTTPException(status_code=400, detail=str(error)) from error
+
+        if club:
+            return projected_response(Club, projection, club)
+
+    elif club := await service.get_club_by_id(clubId=clubId):
         return club.model_dump()
 
     raise HTTPException(status_code=404, detail="Club not found")
@@ -85,11 +237,10 @@ async def get_club_by_id(
 
 
 @router.put("/{clubId}", response_model=Club, status_code=201)
-@inject
 async def update_club(
     clubId: int,
     updated_club: ClubIn,
-    service: IClubService = Depends(Provide[Container.club_service]),
+    service: IClubService = Depends(club_service),
 ) -> dict:
     """An endpoint for updating club data.
 
@@ -116,10 +267,9 @@ async def update_club(
 
 
 @router.delete("/{clubId}", status_code=204)
-@inject
 async def delete_club(
     clubId: int,
-    service: IClubService = Depends(Provide[Container.club_service]),
+    service: IClubService = Depends(club_service),
 ) -> None:
     """An endpoint for deleting clubs.
 
@@ -0,0 +1,21 @@
+"""A module containing the metrics endpoint."""
+
+from fastapi import APIRouter, Response
+
+from src.infrastructure.utils.metrics import REGISTRY
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+    """An endpoint exposing metrics in the Prometheus text format.
+
+    Returns:
+        Response: The rendered metrics.
+    """
+
+    return Response(
+        content=REGISTRY.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -1,21 +1,37 @@
 """A module containing stadium endpoints."""
 
 from typing import Iterable
-from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
-
-from src.container import Container
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import StreamingResponse
+
+from src.api.utils.count import CountMode, with_total_count
+from src.api.utils.di import resolved
+from src.api.utils.fields import parse_fields, projected_response
+from src.container import container
+from src.core.domain.batch import BatchRequest, BatchResult
+from src.core.domain.changes import CHANGE_CURSOR_PATTERN, ChangeSet
 from src.core.domain.stadium import Stadium, StadiumIn
 from src.infrastructure.services.istadium import IStadiumService
 
 router = APIRouter()
 
+CHANGES_PAGE_SIZE = 1000
+CHANGES_MAX_PAGE_SIZE = 10000
+
+stadium_service = resolved(container.stadium_service)
+
 
 @router.post("/create", response_model=Stadium, status_code=201)
-@inject
 async def create_stadium(
     stadium: StadiumIn,
-    service: IStadiumService = Depends(Provide[Container.stadium_service]),
+    service: IStadiumService = Depends(stadium_service),
 ) -> dict:
     """An endpoint for adding new stadium.
 
@@ -32,56 +48,194 @@ async def create_stadium(
     return new_stadium.model_dump() if new_stadium else {}
 
 
+@router.post("/batch", response_model=list[BatchResult], status_code=200)
+async def apply_stadium_batch(
+    batch: BatchRequest[StadiumIn],
+    service: IStadiumService = Depends(stadium_service),
+) -> list:
+    """An endpoint applying stadium creates, updates and deletes in bulk.
+
+    All operations run in a single transaction. Missing stadiums are
+    reported in the per-item results without aborting the batch.
+
+    Args:
+        batch (BatchRequest[StadiumIn]): The operations to apply.
+        service (IStadiumService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 400 if the batch is invalid.
+
+    Returns:
+        list: The per-item results in the order of the operations.
+    """
+
+    try:
+        return await service.apply_batch(batch.operations)
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error)) from error
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_stadiums(
+    service: IStadiumService = Depends(stadium_service),
+) -> StreamingResponse:
+    """An endpoint streaming all stadiums as CSV.
+
+    Args:
+        service (IStadiumService, optional): The injected service dependency.
+
+    Returns:
+        StreamingResponse: The CSV produced by `COPY ... TO STDOUT`.
+    """
+
+    return StreamingResponse(
+        service.export_csv(),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="stadiums.csv"'},
+    )
+
+
+@router.post("/import", status_code=201)
+async def import_stadiums(
+    request: Request,
+    service: IStadiumService = Depends(stadium_service),
+) -> dict:
+    """An endpoint loading stadiums from the CSV request body.
+
+    The body is streamed into `COPY ... FROM STDIN`. The first line is a
+    header of column names; all rows are rejected if any row is invalid.
+
+    Args:
+        request (Request): The request with the `text/csv` body.
+        service (IStadiumService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 400 if the CSV is invalid.
+
+    Returns:
+        dict: The number of imported rows.
+    """
+
+    try:
+        rows = await service.import_csv(request.stream())
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error)) from error
+
+    return {"rows": rows}
+
+
+@router.get("/changes", response_model=ChangeSet, status_code=200)
+async def get_stadium_changes(
+    since: str = Query("0", pattern=CHANGE_CURSOR_PATTERN),
+    limit: int = Query(CHANGES_PAGE_SIZE, ge=1, le=CHANGES_MAX_PAGE_SIZE),
+    service: IStadiumService = Depends(stadium_service),
+) -> ChangeSet:
+    """An endpoint for getting the stadiums changed since the cursor.
+
+    The first sync starts from 0. Every response carries the cursor of
+    the next request; while `more` is set, the client keeps paging.
+
+    Args:
+        since (str, optional): The cursor of the last synced change.
+        limit (int, optional): The maximum number of changes.
+        service (IStadiumService, optional): The injected service dependency.
+
+    Returns:
+        ChangeSet: The changed and deleted stadiums and the next cursor.
+    """
+
+    return await service.get_changes(since, limit)
+
+
 @router.get("/all", response_model=Iterable[Stadium], status_code=200)
-@inject
 async def get_all_stadiums(
-    service: IStadiumService = Depends(Provide[Container.stadium_service]),
+    response: Response,
+    fields: str | None = None,
+    count: CountMode | None = None,
+    service: IStadiumService = Depends(stadium_service),
 ) -> Iterable:
     """An endpoint for getting all stadiums.
 
+    With `count` the total number of stadiums is reported in the
+    `X-Total-Count` header, either exact or estimated from the planner
+    statistics.
+
     Args:
+        response (Response): The response to add the headers to.
+        fields (str | None, optional): Comma separated fields to return.
+        count (CountMode | None, optional): The total count mode.
         service (IStadiumService, optional): The injected service dependency.
 
+    Raises:
+        HTTPException: 400 if the fields cannot be projected.
+
     Returns:
         Iterable: The stadium attributes collection.
     """
 
+    total = await service.count_stadiums(count == "approx") if count else None
+
+    if projection := parse_fields(fields, Stadium):
+        try:
+            stadiums = await service.get_all_stadiums(fields=projection)
+        except ValueError as error:
+            raise HTTPException(status_code=400, detail=str(error)) from error
+
+        return with_total_count(
+            projected_response(Stadium, projection, stadiums),
+            total,
+        )
+
     stadiums = await service.get_all_stadiums()
+    with_total_count(response, total)
 
     return stadiums
 
 
 @router.get("/{stadiumsId}", response_model=Stadium, status_code=200)
-@inject
 async def get_stadium_by_id(
     stadiumsId: int,
-    service: IStadiumService = Depends(Provide[Container.stadium_service]),
+    fields: str | None = None,
+    service: IStadiumService = Depends(stadium_service),
 ) -> dict:
     """An endpoint for getting stadium details by id.
 
     Args:
         stadiumsId (int): The id of the stadium.
+        fields (str | None, optional): Comma separated fields to return.
         service (IStadiumService, optional): The injected service dependency.
 
     Raises:
+        HTTPException: 400 if the fields cannot be projected.
         HTTPException: 404 if stadium does not exist.
 
     Returns:
         dict: The requested stadium attributes.
     """
 
-    if stadium := await service.get_stadium_by_id(stadiumsId):
+    if projection := parse_fields(fields, Stadium):
+        try:
+            stadium = await service.get_stadium_by_id(
+                stadiumsId,
+                fields=projection,
+            )
+        except ValueError as error:
+            raise HTTPException(status_code=400, detail=str(error)) from error
+
+        if stadium:
+            return projected_response(Stadium, projection, stadium)
+
+    elif stadium := await service.get_stadium_by_id(stadiumsId):
         return stadium.model_dump()
 
     raise HTTPException(status_code=404, detail="Stadium not found")
 
 
 @router.put("/{stadiumsId}", response_model=Stadium, status_code=201)
-@inject
 async def update_stadium(
     stadiumsId: int,
     updated_stadium: StadiumIn,
-    service: IStadiumService = Depends(Provide[Container.stadium_service]),
+    service: IStadiumService = Depends(stadium_service),
 ) -> dict:
     """An endpoint for updating stadium data.
 
@@ -109,10 +263,9 @@ async def update_stadium(
 
 
 @router.delete("/{stadiumsId}", status_code=204)
-@inject
 async def delete_stadium(
     stadiumsId: int,
-    service: IStadiumService = Depends(Provide[Container.stadium_service]),
+    service: IStadiumService = Depends(stadium_service),
 ) -> None:
     """An endpoint for deleting stadiums.
 
@@ -1,9 +1,9 @@
 """A module containing user-related routers."""
 
-from dependency_injector.wiring import inject, Provide
 from fastapi import APIRouter, Depends, HTTPException
 
-from src.container import Container
+from src.api.utils.di import resolved
+from src.container import container
 from src.core.domain.user import UserIn
 from src.infrastructure.dto.tokendto import TokenDTO
 from src.infrastructure.dto.userdto import UserDTO
@@ -11,12 +11,13 @@ from src.infrastructure.services.iuser import IUserService
 
 router = APIRouter()
 
+user_service = resolved(container.user_service)
+
 
 @router.post("/register", response_model=UserDTO, status_code=201)
-@inject
 async def register_user(
     user: UserIn,
-    service: IUserService = Depends(Provide[Container.user_service]),
+    service: IUserService = Depends(user_service),
 ) -> dict:
     """A router coroutine for registering new user
 
@@ -38,10 +39,9 @@ async def register_user(
 
 
 @router.post("/token", response_model=TokenDTO, status_code=200)
-@inject
 async def authenticate_user(
     user: UserIn,
-    service: IUserService = Depends(Provide[Container.user_service]),
+    service: IUserService = Depends(user_service),
 ) -> dict:
     """A router coroutine for authenticating users.
 
@@ -54,7 +54,6 @@ async def authenticate_user(
     """
 
     if token_details := await service.authenticate_user(user):
-        print("user confirmed")
         return token_details.model_dump()
 
     raise HTTPException(
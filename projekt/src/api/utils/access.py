@@ -0,0 +1,117 @@
+"""A module containing the access logging middleware."""
+
+import logging
+import random
+import uuid
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.utils.requestcontext import (
+    RequestContext,
+    request_context,
+)
+
+logger = logging.getLogger("src.access")
+
+
+class AccessLogMiddleware:
+    """An ASGI middleware logging requests with their database time.
+
+    Successful requests faster than `slow_ms` are logged with the
+    `sample_rate` probability, all other requests are always logged.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = 1.0,
+        slow_ms: float = 1000.0,
+    ) -> None:
+        """The initializer of the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            sample_rate (float, optional): The fraction of successful
+                requests to log. Defaults to 1.0.
+            slow_ms (float, optional): The duration above which requests
+                are always logged. Defaults to 1000.0.
+        """
+
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow = slow_ms / 1000
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """The method handling the ASGI call.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel.
+            send (Send): The send channel.
+        """
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = next(
+            (
+                value.decode("latin-1")
+                for key, value in scope["headers"]
+                if key == b"x-request-id"
+            ),
+            None,
+        ) or uuid.uuid4().hex
+        context = RequestContext(request_id=request_id)
+        token = request_context.set(context)
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"x-request-id", request_id.encode("latin-1")),
+                    *(
+                        (name.lower().encode("latin-1"),
+                         value.encode("latin-1"))
+                        for name, value in context.headers.items()
+                    ),
+                ]
+            await send(message)
+
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = perf_counter() - start
+            request_context.reset(token)
+
+            if (
+                status >= 400
+                or duration >= self.slow
+                or random.random() < self.sample_rate  # nosec B311
+            ):
+                route = scope.get("route")
+                logger.info(
+                    "%s %s %d",
+                    scope["method"],
+                    scope["path"],
+                    status,
+                    extra={
+                        "request_id": request_id,
+                        "method": scope["method"],
+                        "route": route.path if route else None,
+                        "status": status,
+                        "duration_ms": round(duration * 1000, 3),
+                        "db_ms": round(context.db_time * 1000, 3),
+                        "db_queries": context.db_queries,
+                    },
+                )
@@ -0,0 +1,40 @@
+"""A module containing the admin access dependency."""
+
+import secrets
+
+from fastapi import Header, HTTPException
+
+from src.config import config
+
+
+def is_admin(token: str | None) -> bool:
+    """A function checking the admin token.
+
+    Args:
+        token (str | None): The token provided by the client.
+
+    Returns:
+        bool: True if admin access is configured and the token matches.
+    """
+
+    return bool(
+        config.ADMIN_TOKEN
+        and token
+        and secrets.compare_digest(token, config.ADMIN_TOKEN)
+    )
+
+
+async def require_admin(
+    x_admin_token: str | None = Header(default=None),
+) -> None:
+    """A dependency restricting the endpoint to administrators.
+
+    Args:
+        x_admin_token (str | None, optional): The `X-Admin-Token` header.
+
+    Raises:
+        HTTPException: 403 if the token is missing or incorrect.
+    """
+
+    if not is_admin(x_admin_token):
+        raise HTTPException(status_code=403, detail="Admin access required")
@@ -0,0 +1,26 @@
+"""A module containing helpers for total count reporting."""
+
+from typing import Literal
+
+from fastapi import Response
+
+CountMode = Literal["exact", "approx"]
+
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+def with_total_count(response: Response, total: int | None) -> Response:
+    """A function adding the total count header to the response.
+
+    Args:
+        response (Response): The listing response.
+        total (int | None): The total count, None if not requested.
+
+    Returns:
+        Response: The same response.
+    """
+
+    if total is not None:
+        response.headers[TOTAL_COUNT_HEADER] = str(total)
+
+    return response
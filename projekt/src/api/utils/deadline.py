@@ -0,0 +1,242 @@
+"""A module containing the request deadline middleware.
+
+Every request gets a time budget, the per-route default optionally
+shortened by the client with `X-Request-Timeout-Ms`. The deadline is
+stored in the request context, where the database layer bounds every
+query by the remaining budget. The handler is cancelled when the budget
+runs out or the client disconnects, and cancelling it cancels its
+running query in Postgres, so no capacity is spent on abandoned work.
+"""
+
+import asyncio
+import json
+from contextlib import suppress
+from time import monotonic
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.utils.requestcontext import request_context
+
+TIMEOUT_HEADER = "x-request-timeout-ms"
+
+# Budgets in seconds by path prefix, None for requests without a
+# deadline. Streams and bulk transfers last as long as the client reads.
+ROUTE_TIMEOUTS: dict[str, float | None] = {
+    "/changes/": None,
+    "/club/export": None,
+    "/stadium/export": None,
+    "/club/import": 300.0,
+    "/stadium/import": 300.0,
+    "/club/batch": 60.0,
+    "/stadium/batch": 60.0,
+    "/admin/users/rekey": 300.0,
+}
+
+
+class DeadlineMiddleware:
+    """An ASGI middleware enforcing the request deadline.
+
+    It has to run inside `AccessLogMiddleware`, which creates the request
+    context.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        default_timeout: float = 10.0,
+        max_timeout: float = 60.0,
+        route_timeouts: dict[str, float | None] | None = None,
+    ) -> None:
+        """The initializer of the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            default_timeout (float, optional): The budget of the routes
+                without their own in seconds. Defaults to 10.0.
+            max_timeout (float, optional): The longest budget a client
+                may ask for in seconds. Defaults to 60.0.
+            route_timeouts (dict[str, float | None] | None, optional):
+                The budgets by path prefix. Defaults to `ROUTE_TIMEOUTS`.
+        """
+
+        self.app = app
+        self.default_timeout = default_timeout
+        self.max_timeout = max_timeout
+        self.route_timeouts = ROUTE_TIMEOUTS if route_timeouts is None \
+            else route_timeouts
+
+    def budget(self, scope: Scope) -> float | None:
+        """The method getting the time budget of the request.
+
+        Args:
+            scope (Scope): The connection scope.
+
+        Returns:
+            float | None: The budget in seconds, None without a deadline.
+        """
+
+        path = scope["path"]
+        timeout = next(
+            (
+                timeout
+                for prefix, timeout in self.route_timeouts.items()
+                if path.startswith(prefix)
+            ),
+            self.default_timeout,
+        )
+
+        requested = Headers(scope=scope).get(TIMEOUT_HEADER)
+        if requested:
+            try:
+                client_timeout = min(
+                    max(float(requested) / 1000, 0.0),
+                    self.max_timeout,
+                )
+            except ValueError:
+                return timeout
+            if timeout is None or client_timeout < timeout:
+                return client_timeout
+
+        return timeout
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """The method handling the ASGI call.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel.
+            send (Send): The send channel.
+        """
+
+        context = request_context.get()
+        if scope["type"] != "http" or context is None:
+            await self.app(scope, receive, send)
+            return
+
+        budget = self.budget(scope)
+        if budget is not None:
+            context.deadline = monotonic() + budget
+
+        started = False
+        watcher = DisconnectWatcher(scope, receive)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal started
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+
+        handler = asyncio.create_task(
+            self.app(scope, watcher.receive, send_wrapper),
+        )
+        disconnected = asyncio.create_task(watcher.disconnected.wait())
+        try:
+            done, _ = await asyncio.wait(
+                (handler, disconnected),
+                timeout=budget,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        except asyncio.CancelledError:
+            handler.cancel()
+            raise
+        finally:
+            disconnected.cancel()
+            watcher.stop()
+
+        if handler in done:
+            handler.result()
+            return
+
+        handler.cancel()
+        with suppress(asyncio.CancelledError):
+            await handler
+
+        if disconnected not in done and not started:
+            await self._timeout(send)
+
+    @staticmethod
+    async def _timeout(send: Send) -> None:
+        """A private method sending the 504 response.
+
+        Args:
+            send (Send): The send channel.
+        """
+
+        body = json.dumps({"detail": "Request deadline exceeded"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 504,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+class DisconnectWatcher:
+    """A class detecting the client disconnect while the handler runs.
+
+    The request body is passed through to the handler first. Once it is
+    read, the watcher keeps receiving on its own and only a disconnect
+    is expected; later `receive` calls of the handler wait for it.
+    """
+
+    def __init__(self, scope: Scope, receive: Receive) -> None:
+        """The initializer of the watcher.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel of the server.
+        """
+
+        self._receive = receive
+        self.disconnected = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        headers = Headers(scope=scope)
+        if (
+            "content-length" not in headers
+            and "transfer-encoding" not in headers
+        ):
+            self._watch()
+
+    async def receive(self) -> Message:
+        """The method receiving the next message for the handler.
+
+        Returns:
+            Message: The request body or the disconnect message.
+        """
+
+        if self._task is None and not self.disconnected.is_set():
+            message = await self._receive()
+            if message["type"] == "http.disconnect":
+                self.disconnected.set()
+            elif not message.get("more_body", False):
+                self._watch()
+            return message
+
+        await self.disconnected.wait()
+
+        return {"type": "http.disconnect"}
+
+    def stop(self) -> None:
+        """The method ending the watching."""
+
+        if self._task is not None:
+            self._task.cancel()
+
+    def _watch(self) -> None:
+        """A private method starting to receive in the background."""
+
+        async def watch() -> None:
+            while (await self._receive())["type"] != "http.disconnect":
+                pass
+            self.disconnected.set()
+
+        self._task = asyncio.create_task(watch())
@@ -0,0 +1,37 @@
+"""A module containing the request-time dependency resolution."""
+
+from typing import Any, Callable, Coroutine
+
+from dependency_injector.providers import Provider
+
+
+def resolved(
+    provider: Provider,
+) -> Callable[[], Coroutine[Any, Any, Any]]:
+    """A function building the FastAPI dependency of the provider.
+
+    The instance is resolved once, on the first request, instead of
+    going through `@inject` and a `Provide` marker on every request, so
+    importing a router does not build the service stack. The dependency
+    is a coroutine function, so FastAPI calls it directly on the event
+    loop rather than in the threadpool used for the synchronous `Provide`
+    marker. Meant for `Singleton` providers; overrides have to be in
+    place before the first request.
+
+    Args:
+        provider (Provider): The provider of the container instance.
+
+    Returns:
+        Callable[[], Coroutine[Any, Any, Any]]: The dependency.
+    """
+
+    instance = None
+
+    async def dependency() -> Any:
+        nonlocal instance
+        if instance is None:
+            instance = provider()
+
+        return instance
+
+    return dependency
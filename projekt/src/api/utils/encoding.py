@@ -0,0 +1,379 @@
+"""A module containing the response format and encoding negotiation.
+
+`FormatMiddleware` picks JSON, MessagePack or columnar JSON by `Accept`
+and `NegotiatedResponse`, the default response class, encodes the
+serialized response models in it. `CompressionMiddleware` compresses
+responses with zstd, brotli or gzip according to `Accept-Encoding`.
+MessagePack, brotli and zstd are optional and only offered when their
+packages are installed.
+"""
+
+import zlib
+from contextvars import ContextVar
+from typing import Any, Callable, Mapping, Protocol
+
+from pydantic_core import to_json
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import msgpack  # type: ignore
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard  # type: ignore
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+COLUMNAR = "application/vnd.columnar+json"
+
+COMPRESSIBLE = ("text/", JSON, MSGPACK, COLUMNAR, "application/xml")
+UNBUFFERED = ("text/event-stream",)
+
+response_format: ContextVar[str] = ContextVar("response_format", default=JSON)
+
+
+def parse_accept(header: str) -> dict[str, float]:
+    """A function parsing the `Accept` or `Accept-Encoding` header.
+
+    Args:
+        header (str): The header value.
+
+    Returns:
+        dict[str, float]: The quality of every listed value.
+    """
+
+    qualities = {}
+    for part in header.split(","):
+        value, *params = part.strip().split(";")
+        quality = 1.0
+        for param in params:
+            name, _, number = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(number)
+                except ValueError:
+                    quality = 0.0
+        if value:
+            qualities[value.strip().lower()] = quality
+
+    return qualities
+
+
+def negotiate(header: str, available: list[str]) -> str | None:
+    """A function choosing the preferred available value.
+
+    On equal quality the order of `available` decides.
+
+    Args:
+        header (str): The `Accept` or `Accept-Encoding` header value.
+        available (list[str]): The values supported by the server.
+
+    Returns:
+        str | None: The chosen value, None if none is acceptable.
+    """
+
+    qualities = parse_accept(header)
+    wildcard = qualities.get("*", qualities.get("*/*", 0.0))
+    best, best_quality = None, 0.0
+    for value in available:
+        group = value.split("/")[0] + "/*"
+        quality = qualities.get(value, qualities.get(group, wildcard))
+        if quality > best_quality:
+            best, best_quality = value, quality
+
+    return best
+
+
+def to_columnar(data: Any) -> dict | None:
+    """A function converting the item or items into columnar JSON.
+
+    Args:
+        data (Any): The serialized JSON document.
+
+    Returns:
+        dict | None: The field names and one value array per field, None
+            if the document is not an object or a list of objects.
+    """
+
+    rows = data if isinstance(data, list) else [data]
+    if not all(isinstance(row, dict) for row in rows):
+        return None
+
+    fields = list(dict.fromkeys(key for row in rows for key in row))
+
+    return {
+        "fields": fields,
+        "values": [[row.get(field) for row in rows] for field in fields],
+    }
+
+
+class FormatMiddleware:
+    """An ASGI middleware negotiating the response format by `Accept`.
+
+    The chosen format is stored for `NegotiatedResponse`, which encodes
+    the serialized response models in it.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """The initializer of the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+        """
+
+        self.app = app
+        self.available = [JSON, COLUMNAR, *([MSGPACK] if msgpack else [])]
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """The method handling the ASGI call.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel.
+            send (Send): The send channel.
+        """
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept = Headers(scope=scope).get("accept", "")
+        target = negotiate(accept, self.available) if accept else JSON
+        token = response_format.set(target or JSON)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            response_format.reset(token)
+
+
+class NegotiatedResponse(JSONResponse):
+    """A class of the responses encoded in the negotiated format.
+
+    FastAPI passes it the serialized response model, so MessagePack and
+    columnar JSON are encoded directly, without decoding the JSON body
+    again. The representation depends on `Accept`, so every response
+    varies by it.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """The method encoding the content in the negotiated format.
+
+        Args:
+            content (Any): The serialized response model.
+
+        Returns:
+            bytes: The encoded body.
+        """
+
+        target = response_format.get()
+        if target == MSGPACK:
+            self.media_type = MSGPACK
+            return msgpack.packb(content)
+
+        if target == COLUMNAR and (columns := to_columnar(content)):
+            self.media_type = COLUMNAR
+            return to_json(columns)
+
+        return to_json(content)
+
+    def init_headers(self, headers: Mapping[str, str] | None = None) -> None:
+        """The method adding `Vary: Accept` to the response headers.
+
+        Args:
+            headers (Mapping[str, str] | None, optional): The headers.
+        """
+
+        super().init_headers(headers)
+        self.headers.add_vary_header("Accept")
+
+
+class Compressor(Protocol):
+    """A protocol of the incremental compressors."""
+
+    def compress(self, data: bytes) -> bytes:
+        """The method compressing the next chunk."""
+
+    def flush(self) -> bytes:
+        """The method finishing the stream."""
+
+
+class GzipCompressor:
+    """An incremental gzip compressor."""
+
+    def __init__(self, level: int) -> None:
+        """The initializer of the compressor."""
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        """The method compressing the next chunk."""
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        """The method finishing the stream."""
+        return self._compressor.flush()
+
+
+class BrotliCompressor:
+    """An incremental brotli compressor."""
+
+    def __init__(self, quality: int) -> None:
+        """The initializer of the compressor."""
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        """The method compressing the next chunk."""
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        """The method finishing the stream."""
+        return self._compressor.finish()
+
+
+class ZstdCompressor:
+    """An incremental zstd compressor."""
+
+    def __init__(self, level: int) -> None:
+        """The initializer of the compressor."""
+        self._compressor = zstandard.ZstdCompressor(level=level) \
+            .compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        """The method compressing the next chunk."""
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        """The method finishing the stream."""
+        return self._compressor.flush()
+
+
+class CompressionMiddleware:
+    """An ASGI middleware compressing responses by `Accept-Encoding`.
+
+    Bodies sent in one message below `minimum_size` are left as they
+    are, streamed bodies are compressed chunk by chunk.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        zstd_level: int = 3,
+    ) -> None:
+        """The initializer of the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            minimum_size (int, optional): The smallest body to compress in
+                bytes. Defaults to 1024.
+            gzip_level (int, optional): The gzip level. Defaults to 6.
+            brotli_quality (int, optional): The brotli quality. Defaults
+                to 4.
+            zstd_level (int, optional): The zstd level. Defaults to 3.
+        """
+
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encoders: dict[str, Callable[[], Compressor]] = {}
+        if zstandard:
+            self.encoders["zstd"] = lambda: ZstdCompressor(zstd_level)
+        if brotli:
+            self.encoders["br"] = lambda: BrotliCompressor(brotli_quality)
+        self.encoders["gzip"] = lambda: GzipCompressor(gzip_level)
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """The method handling the ASGI call.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel.
+            send (Send): The send channel.
+        """
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept = Headers(scope=scope).get("accept-encoding", "")
+        encoding = negotiate(accept, list(self.encoders)) if accept else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message = {}
+        compressor: Compressor | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                passthrough = (
+                    "content-encoding" in headers
+                    or not content_type.startswith(COMPRESSIBLE)
+                    or content_type.startswith(UNBUFFERED)
+                )
+                if passthrough:
+                    await send(start)
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                headers = MutableHeaders(raw=start["headers"])
+                headers.add_vary_header("Accept-Encoding")
+                if not more_body and len(body) < self.minimum_size:
+                    await send(start)
+                    await send(message)
+                    return
+
+                compressor = self.encoders[encoding]()
+                headers["content-encoding"] = encoding
+                del headers["content-length"]
+                if not more_body:
+                    body = compressor.compress(body) + compressor.flush()
+                    headers["content-length"] = str(len(body))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                await send(start)
+
+            chunk = compressor.compress(body)
+            if not more_body:
+                chunk += compressor.flush()
+            if chunk or not more_body:
+                await send({
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": more_body,
+                })
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,107 @@
+"""A module containing helpers for response field projection."""
+
+from functools import lru_cache
+from typing import Iterable, Mapping
+
+from fastapi import HTTPException, Response
+from pydantic import BaseModel, TypeAdapter
+from typing_extensions import TypedDict
+
+from src.api.utils.encoding import JSON, NegotiatedResponse, response_format
+
+
+def parse_fields(
+    fields: str | None,
+    model: type[BaseModel],
+) -> tuple[str, ...] | None:
+    """A function validating the `fields` query parameter.
+
+    Args:
+        fields (str | None): Comma separated list of requested fields.
+        model (type[BaseModel]): The domain model the fields belong to.
+
+    Raises:
+        HTTPException: 400 if any of the fields is not a model field.
+
+    Returns:
+        tuple[str, ...] | None: The requested fields, None if not provided.
+    """
+
+    if fields is None:
+        return None
+
+    requested = tuple(dict.fromkeys(
+        field.strip() for field in fields.split(",") if field.strip()
+    ))
+    unknown = [field for field in requested if field not in model.model_fields]
+
+    if not requested:
+        raise HTTPException(status_code=400, detail="No fields requested")
+
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}",
+        )
+
+    return requested
+
+
+@lru_cache(maxsize=128)
+def projected_adapter(
+    model: type[BaseModel],
+    fields: tuple[str, ...],
+    many: bool = True,
+) -> TypeAdapter:
+    """A function building the adapter of the projected response model.
+
+    The projection is a `TypedDict`, so the projected rows are validated
+    as dictionaries without creating a model instance per row.
+
+    Args:
+        model (type[BaseModel]): The domain model.
+        fields (tuple[str, ...]): The projected fields.
+        many (bool, optional): Whether the adapter validates a list of
+            items. Defaults to True.
+
+    Returns:
+        TypeAdapter: The adapter of the projected model.
+    """
+
+    projection = TypedDict(  # type: ignore
+        f"{model.__name__}Projection",
+        {field: model.model_fields[field].annotation for field in fields},
+    )
+
+    return TypeAdapter(list[projection] if many else projection)  # type: ignore
+
+
+def projected_response(
+    model: type[BaseModel],
+    fields: tuple[str, ...],
+    data: Mapping | Iterable[Mapping],
+) -> Response:
+    """A function serializing projected data into the response.
+
+    Args:
+        model (type[BaseModel]): The domain model.
+        fields (tuple[str, ...]): The projected fields.
+        data (Mapping | Iterable[Mapping]): The projected item or items.
+
+    Returns:
+        Response: The negotiated response with projected data.
+    """
+
+    many = not isinstance(data, Mapping)
+    adapter = projected_adapter(model, fields, many)
+    content = list(data) if many else dict(data)  # type: ignore
+
+    items = adapter.validate_python(content)
+    if response_format.get() == JSON:
+        return Response(
+            content=adapter.dump_json(items),
+            media_type=JSON,
+            headers={"Vary": "Accept"},
+        )
+
+    return NegotiatedResponse(adapter.dump_python(items, mode="json"))
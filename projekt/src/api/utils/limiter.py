@@ -0,0 +1,331 @@
+"""A module containing the adaptive concurrency limiting middleware.
+
+Every route class gets its own limit adjusted with AIMD: the limit grows
+by one per limit of fast responses and shrinks multiplicatively when the
+smoothed latency rises above a multiple of its long-term average or the
+response is a server error. Requests above the limit wait in a short bounded
+queue and are rejected with 503 once it is full or the wait times out,
+so an overloaded database costs clients a fast retry instead of a slow
+timeout, and writes and logins never queue behind listings.
+"""
+
+import asyncio
+import json
+import math
+from collections import deque
+from time import perf_counter
+from typing import Callable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.utils.metrics import (
+    CONCURRENCY_IN_FLIGHT,
+    CONCURRENCY_LIMIT,
+    REQUESTS_SHED,
+)
+
+AUTH_PATHS = ("/token", "/register")
+# CSV exports and imports run for as long as the transfer takes, so their
+# latency would shrink the limits of the ordinary requests.
+EXEMPT_PATHS = (
+    "/metrics",
+    "/admin",
+    "/changes/",
+    "/club/export",
+    "/club/import",
+    "/stadium/export",
+    "/stadium/import",
+)
+WRITE_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+
+class Overloaded(Exception):
+    """An exception raised when the request is shed."""
+
+    def __init__(self, reason: str) -> None:
+        """The initializer of the exception.
+
+        Args:
+            reason (str): Why the request was shed.
+        """
+
+        super().__init__(reason)
+        self.reason = reason
+
+
+class AdaptiveLimiter:
+    """A class limiting the concurrency of one route class with AIMD."""
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        queue_size: int = 50,
+        queue_timeout: float = 1.0,
+        tolerance: float = 2.0,
+        backoff: float = 0.9,
+    ) -> None:
+        """The initializer of the limiter.
+
+        Args:
+            name (str): The route class, used as the metric label.
+            initial_limit (int, optional): The starting limit. Defaults
+                to 20.
+            min_limit (int, optional): The lowest limit. Defaults to 1.
+            max_limit (int, optional): The highest limit. Defaults to 200.
+            queue_size (int, optional): The maximum number of waiting
+                requests. Defaults to 50.
+            queue_timeout (float, optional): The longest wait for a slot
+                in seconds. Defaults to 1.0.
+            tolerance (float, optional): The latency to baseline ratio
+                treated as congestion. Defaults to 2.0.
+            backoff (float, optional): The factor of the limit decrease.
+                Defaults to 0.9.
+        """
+
+        self.name = name
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.in_flight = 0
+        self.baseline: float | None = None
+        self.latency = 0.0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._last_decrease = 0.0
+        self._limit_gauge = CONCURRENCY_LIMIT.labels(name)
+        self._limit_gauge.set(self.limit)
+        self._in_flight_gauge = CONCURRENCY_IN_FLIGHT.labels(name)
+
+    async def acquire(self) -> None:
+        """The method waiting for a free slot.
+
+        Raises:
+            Overloaded: If the queue is full or the wait timed out.
+        """
+
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self._take()
+            return
+
+        if len(self._waiters) >= self.queue_size:
+            raise Overloaded("queue_full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout)
+        except asyncio.TimeoutError as error:
+            if not self._abandon(waiter):
+                raise Overloaded("timeout") from error
+        except asyncio.CancelledError:
+            if self._abandon(waiter):
+                self.in_flight -= 1
+                self._in_flight_gauge.dec()
+                self._wake()
+            raise
+
+    def release(self, latency: float, failed: bool = False) -> None:
+        """The method freeing the slot and adjusting the limit.
+
+        Args:
+            latency (float): The duration of the request in seconds.
+            failed (bool, optional): Whether the request failed on the
+                server side. Defaults to False.
+        """
+
+        self.in_flight -= 1
+        self._in_flight_gauge.dec()
+
+        if self.baseline is None:
+            self.baseline = self.latency = latency
+        self.latency += (latency - self.latency) * 0.2
+        congested = failed or self.latency > self.baseline * self.tolerance
+        # The baseline follows a lasting change of the workload, but only
+        # slowly while congested, so overload is not taken as the norm.
+        self.baseline += (latency - self.baseline) * (
+            0.001 if congested else 0.01
+        )
+
+        now = perf_counter()
+        if congested:
+            # One decrease per round trip, as the responses of the same
+            # congested period all arrive late together.
+            if now - self._last_decrease > self.latency:
+                self._last_decrease = now
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+        elif self.in_flight + 1 >= int(self.limit):
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        self._limit_gauge.set(self.limit)
+
+        self._wake()
+
+    def retry_after(self) -> int:
+        """The method estimating when a retry is likely to be admitted.
+
+        Returns:
+            int: The number of seconds.
+        """
+
+        pending = len(self._waiters) + self.in_flight
+        latency = self.baseline or self.queue_timeout
+
+        return max(1, math.ceil(latency * pending / max(1, self.limit)))
+
+    def _take(self) -> None:
+        """A private method occupying a slot."""
+
+        self.in_flight += 1
+        self._in_flight_gauge.inc()
+
+    def _wake(self) -> None:
+        """A private method handing the free slots to the waiters."""
+
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._take()
+                waiter.set_result(None)
+
+    def _abandon(self, waiter: asyncio.Future) -> bool:
+        """A private method withdrawing the waiter from the queue.
+
+        Args:
+            waiter (asyncio.Future): The future of the waiting request.
+
+        Returns:
+            bool: True if the slot was handed over meanwhile and is kept.
+        """
+
+        if waiter.done() and not waiter.cancelled():
+            return True
+
+        waiter.cancel()
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+        return False
+
+
+def classify(scope: Scope) -> str | None:
+    """A function assigning the request to its route class.
+
+    Args:
+        scope (Scope): The connection scope.
+
+    Returns:
+        str | None: `auth`, `write` or `read`, None for the requests
+            exempt from limiting.
+    """
+
+    path = scope["path"]
+    if path.startswith(EXEMPT_PATHS):
+        return None
+    if path in AUTH_PATHS:
+        return "auth"
+    if scope["method"] in WRITE_METHODS:
+        return "write"
+
+    return "read"
+
+
+class ConcurrencyLimitMiddleware:
+    """An ASGI middleware shedding the load above the adaptive limits.
+
+    Long-lived streams, CSV transfers, metrics and admin requests are not
+    limited.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        classes: tuple[str, ...] = ("read", "write", "auth"),
+        classifier: Callable[[Scope], str | None] = classify,
+        **options: float,
+    ) -> None:
+        """The initializer of the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            classes (tuple[str, ...], optional): The route classes.
+                Defaults to read, write and auth.
+            classifier (Callable[[Scope], str | None], optional): The
+                function classifying the requests. Defaults to `classify`.
+            **options (float): The `AdaptiveLimiter` options.
+        """
+
+        self.app = app
+        self.classifier = classifier
+        self.limiters = {
+            name: AdaptiveLimiter(name, **options) for name in classes
+        }
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """The method handling the ASGI call.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel.
+            send (Send): The send channel.
+        """
+
+        route_class = self.classifier(scope) if scope["type"] == "http" \
+            else None
+        limiter = self.limiters.get(route_class) if route_class else None
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await limiter.acquire()
+        except Overloaded as error:
+            REQUESTS_SHED.labels(limiter.name, error.reason).inc()
+            await self._reject(send, limiter.retry_after())
+            return
+
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            limiter.release(perf_counter() - start, status >= 500)
+
+    @staticmethod
+    async def _reject(send: Send, retry_after: int) -> None:
+        """A private method sending the 503 response.
+
+        Args:
+            send (Send): The send channel.
+            retry_after (int): The `Retry-After` value in seconds.
+        """
+
+        body = json.dumps({"detail": "Server overloaded"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
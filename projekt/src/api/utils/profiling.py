@@ -0,0 +1,150 @@
+"""A module containing the on-demand request profiling middleware.
+
+The middleware is only installed when `PROFILING_ENABLED` is set, so it
+costs nothing otherwise. A request is profiled when it carries the
+`X-Profile` header together with a valid `X-Admin-Token`, or when it is
+picked by `PROFILING_SAMPLE_RATE`. Profiling is deterministic and runs
+one request at a time; code of concurrent requests executed on the event
+loop in the meantime is part of the profile as well.
+"""
+
+import cProfile
+import io
+import pstats
+import random
+import tracemalloc
+import uuid
+from collections import deque
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.api.utils.admin import is_admin
+from src.config import config
+
+profiles: deque[dict] = deque(maxlen=config.PROFILING_BUFFER_SIZE)
+
+
+class ProfilingMiddleware:
+    """An ASGI middleware profiling selected requests."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = 0.0,
+        top: int = 30,
+    ) -> None:
+        """The initializer of the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            sample_rate (float, optional): The fraction of traffic to
+                profile. Defaults to 0.0.
+            top (int, optional): The number of entries in the report.
+                Defaults to 30.
+        """
+
+        self.app = app
+        self.sample_rate = sample_rate
+        self.top = top
+        self._active = False
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """The method handling the ASGI call.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel.
+            send (Send): The send channel.
+        """
+
+        if (
+            scope["type"] != "http"
+            or self._active
+            or not self._selected(scope)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid.uuid4().hex
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"x-profile-id", profile_id.encode()),
+                ]
+            await send(message)
+
+        self._active = True
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        profiler = cProfile.Profile()
+        start = perf_counter()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.disable()
+            duration = perf_counter() - start
+            after = tracemalloc.take_snapshot()
+            if not tracing:
+                tracemalloc.stop()
+            self._active = False
+
+            profiles.append({
+                "id": profile_id,
+                "method": scope["method"],
+                "path": scope["path"],
+                "status": status,
+                "duration": duration,
+                "profile": self._stats(profiler),
+                "allocations": [
+                    str(stat)
+                    for stat in after.compare_to(before, "lineno")[:self.top]
+                ],
+            })
+
+    def _selected(self, scope: Scope) -> bool:
+        """A private method checking whether to profile the request.
+
+        Args:
+            scope (Scope): The connection scope.
+
+        Returns:
+            bool: True if the request should be profiled.
+        """
+
+        headers = dict(scope["headers"])
+        if b"x-profile" in headers:
+            token = headers.get(b"x-admin-token", b"").decode("latin-1")
+            return is_admin(token)
+
+        return random.random() < self.sample_rate  # nosec B311
+
+    def _stats(self, profiler: cProfile.Profile) -> str:
+        """A private method rendering the profile report.
+
+        Args:
+            profiler (cProfile.Profile): The finished profiler.
+
+        Returns:
+            str: The top entries sorted by cumulative time.
+        """
+
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream) \
+            .sort_stats(pstats.SortKey.CUMULATIVE) \
+            .print_stats(self.top)
+
+        return stream.getvalue()
@@ -0,0 +1,185 @@
+"""A module containing the read routing middleware.
+
+Reads of the routed resources may be answered by a read replica, which
+lags the primary a little. To keep a client reading its own writes, a
+successful write sets a cookie with the write-ahead log position of the
+primary after the write, which is committed before the response starts.
+Reads carrying the cookie go only to replicas which replayed that
+position, and the cookie is dropped once all replicas did.
+"""
+
+import logging
+from http.cookies import SimpleCookie
+from typing import Protocol
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.utils.breaker import UNAVAILABLE_ERRORS
+from src.infrastructure.utils.requestcontext import request_context
+
+logger = logging.getLogger(__name__)
+
+POSITION_COOKIE = "write_lsn"
+READ_METHODS = ("GET", "HEAD")
+ROUTED_PREFIXES = ("/club", "/stadium")
+
+# The delta sync reads its horizon, rows and tombstones with separate
+# queries, which have to see the same server, so it stays on the primary.
+PRIMARY_PREFIXES = ("/club/changes", "/stadium/changes")
+
+
+class ReplicatedDatabase(Protocol):
+    """A protocol of the database tracking the replication positions."""
+
+    async def write_position(self) -> int | None:
+        """The method reading the position of the committed writes."""
+
+    def replayed(self, position: int) -> bool:
+        """The method checking whether all replicas replayed it."""
+
+
+class ReadRoutingMiddleware:
+    """An ASGI middleware deciding which requests may read from replicas.
+
+    It has to run inside `AccessLogMiddleware`, which creates the request
+    context.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        database: ReplicatedDatabase,
+        prefixes: tuple[str, ...] = ROUTED_PREFIXES,
+        excluded: tuple[str, ...] = PRIMARY_PREFIXES,
+    ) -> None:
+        """The initializer of the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            database (ReplicatedDatabase): The routed database.
+            prefixes (tuple[str, ...], optional): The path prefixes of
+                the routed resources. Defaults to `ROUTED_PREFIXES`.
+            excluded (tuple[str, ...], optional): The path prefixes of
+                the reads kept on the primary. Defaults to
+                `PRIMARY_PREFIXES`.
+        """
+
+        self.app = app
+        self.database = database
+        self.prefixes = prefixes
+        self.excluded = excluded
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """The method handling the ASGI call.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel.
+            send (Send): The send channel.
+        """
+
+        context = request_context.get()
+        if (
+            scope["type"] != "http"
+            or context is None
+            or not scope["path"].startswith(self.prefixes)
+            or scope["path"].startswith(self.excluded)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] in READ_METHODS:
+            context.use_replica = True
+            position = self.position(scope)
+            if position is None or not self.database.replayed(position):
+                context.read_position = position
+                await self.app(scope, receive, send)
+                return
+
+            await self.app(scope, receive, self._with_cookie(send, b""))
+            return
+
+        await self.app(scope, receive, self._with_cookie(send, None))
+
+    def position(self, scope: Scope) -> int | None:
+        """The method reading the position of the client's last write.
+
+        Args:
+            scope (Scope): The connection scope.
+
+        Returns:
+            int | None: The write-ahead log position, None if the client
+                has not written.
+        """
+
+        header = Headers(scope=scope).get("cookie")
+        if not header or POSITION_COOKIE not in header:
+            return None
+
+        cookie = SimpleCookie()
+        cookie.load(header)
+        try:
+            return int(cookie[POSITION_COOKIE].value)
+        except (KeyError, ValueError):
+            return None
+
+    def _with_cookie(self, send: Send, value: bytes | None) -> Send:
+        """A private method wrapping the channel to set the cookie.
+
+        Args:
+            send (Send): The send channel.
+            value (bytes | None): The cookie value, empty to drop the
+                cookie and None for the position of the write.
+
+        Returns:
+            Send: The wrapped send channel.
+        """
+
+        async def send_wrapper(message: Message) -> None:
+            if (
+                message["type"] == "http.response.start"
+                and message["status"] < 400
+                and (cookie := await self._cookie(value)) is not None
+            ):
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"set-cookie", cookie),
+                ]
+            await send(message)
+
+        return send_wrapper
+
+    async def _cookie(self, value: bytes | None) -> bytes | None:
+        """A private method building the position cookie.
+
+        Args:
+            value (bytes | None): The cookie value, empty to drop the
+                cookie and None for the position of the write.
+
+        Returns:
+            bytes | None: The `Set-Cookie` header value, None if there is
+                nothing to set.
+        """
+
+        if value is None:
+            try:
+                position = await self.database.write_position()
+            except UNAVAILABLE_ERRORS as error:
+                logger.warning("Could not read the write position: %s", error)
+                return None
+            if position is None:
+                return None
+            value = str(position).encode()
+
+        max_age = b"; Max-Age=0" if not value else b""
+
+        return (
+            POSITION_COOKIE.encode() + b"=" + value + max_age
+            + b"; Path=/; HttpOnly; SameSite=Lax"
+        )
@@ -15,6 +15,53 @@ class AppConfig(BaseConfig):
     DB_NAME: Optional[str] = None
     DB_USER: Optional[str] = None
     DB_PASSWORD: Optional[str] = None
+    DB_ECHO: bool = False
+    DB_REPLICA_URLS: Optional[str] = None
+    DB_REPLICA_MAX_LAG: float = 2.0
+    DB_REPLICA_POLL_INTERVAL: float = 1.0
+    BCRYPT_WORKERS: int = 4
+    ADMIN_TOKEN: Optional[str] = None
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    EXPLAIN_SAMPLE_RATE: float = 0.0
+    QUERY_RING_BUFFER_SIZE: int = 100
+    PROFILING_ENABLED: bool = False
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_TOP: int = 30
+    PROFILING_BUFFER_SIZE: int = 20
+    LOG_LEVEL: str = "INFO"
+    ACCESS_LOG_SAMPLE_RATE: float = 1.0
+    ACCESS_LOG_SLOW_MS: float = 1000.0
+    COMPRESSION_MIN_SIZE: int = 1024
+    GZIP_LEVEL: int = 6
+    BROTLI_QUALITY: int = 4
+    ZSTD_LEVEL: int = 3
+    CHANGE_FEED_QUEUE_SIZE: int = 100
+    CHANGE_FEED_KEEPALIVE: float = 15.0
+    CONCURRENCY_LIMIT_ENABLED: bool = True
+    CONCURRENCY_INITIAL_LIMIT: int = 20
+    CONCURRENCY_MAX_LIMIT: int = 200
+    CONCURRENCY_QUEUE_SIZE: int = 50
+    CONCURRENCY_QUEUE_TIMEOUT: float = 1.0
+    CONCURRENCY_LATENCY_TOLERANCE: float = 2.0
+    REQUEST_TIMEOUT: float = 10.0
+    REQUEST_TIMEOUT_MAX: float = 60.0
+    BREAKER_FAILURE_THRESHOLD: int = 5
+    BREAKER_RESET_TIMEOUT: float = 5.0
+    STALE_MAX_AGE: float = 300.0
+    STALE_MAX_ENTRIES: int = 1024
+    INSERT_COALESCING_ENABLED: bool = False
+    INSERT_COALESCING_MAX_BATCH: int = 100
+    INSERT_COALESCING_MAX_DELAY_MS: float = 2.0
+    EMAIL_FILTER_ENABLED: bool = True
+    EMAIL_FILTER_ERROR_RATE: float = 0.01
+    EMAIL_FILTER_MIN_CAPACITY: int = 100000
+    EMAIL_FILTER_REBUILD_INTERVAL: float = 3600.0
+    CACHE_URL: Optional[str] = None
+    CACHE_TIMEOUT: float = 0.5
+    CACHE_L1_SIZE: int = 10000
+    CACHE_TTL: float = 60.0
+    CACHE_TTL_JITTER: float = 0.1
+    CACHE_XFETCH_BETA: float = 1.0
 
 
 config = AppConfig()
\ No newline at end of file
@@ -1,36 +1,133 @@
 """Module providing containers injecting dependencies."""
 
 from dependency_injector.containers import DeclarativeContainer
-from dependency_injector.providers import Factory, Singleton
+from dependency_injector.providers import Singleton
 
+from src.config import config
+from src.db import club_table, stadium_table
+from src.infrastructure.repositories.cached import (
+    CLUB_READS,
+    STADIUM_READS,
+    CachedRepository,
+)
 from src.infrastructure.repositories.user import UserRepository
-from src.infrastructure.repositories.clubdb import \
-    ClubRepository
-from src.infrastructure.repositories.stadiumdb import \
-    StadiumRepository
+from src.infrastructure.repositories.clubdb import (
+    FIELD_COLUMNS as CLUB_COLUMNS,
+    ClubRepository,
+)
+from src.infrastructure.repositories.coalesce import InsertCoalescer
+from src.infrastructure.repositories.emailfilter import EmailFilter
+from src.infrastructure.repositories.resilient import ResilientRepository
+from src.infrastructure.repositories.stadiumdb import (
+    FIELD_COLUMNS as STADIUM_COLUMNS,
+    StadiumRepository,
+)
 
 
 from src.infrastructure.services.club import ClubService
 from src.infrastructure.services.stadium import StadiumService
 from src.infrastructure.services.user import UserService
+from src.infrastructure.utils.breaker import CircuitBreaker, StaleCache
+from src.infrastructure.utils.cache import LocalCache, TieredCache
+from src.infrastructure.utils.resp import RespClient
 
 
 class Container(DeclarativeContainer):
     """Container class for dependency injecting purposes."""
-    club_repository = Singleton(ClubRepository)
-    stadium_repository = Singleton(StadiumRepository)
-    user_repository = Singleton(UserRepository)
+    database_breaker = Singleton(
+        CircuitBreaker,
+        name="postgres",
+        failure_threshold=config.BREAKER_FAILURE_THRESHOLD,
+        reset_timeout=config.BREAKER_RESET_TIMEOUT,
+    )
+    stale_cache = Singleton(
+        StaleCache,
+        max_entries=config.STALE_MAX_ENTRIES,
+        max_age=config.STALE_MAX_AGE,
+    )
+    cache = Singleton(
+        TieredCache,
+        local=Singleton(LocalCache, max_entries=config.CACHE_L1_SIZE),
+        shared=Singleton(
+            RespClient.from_url,
+            config.CACHE_URL,
+            timeout=config.CACHE_TIMEOUT,
+        ) if config.CACHE_URL else None,
+        ttl=config.CACHE_TTL,
+        jitter=config.CACHE_TTL_JITTER,
+        beta=config.CACHE_XFETCH_BETA,
+        settle=config.DB_REPLICA_MAX_LAG if config.DB_REPLICA_URLS else 0.0,
+    )
 
-    club_service = Factory(
+    club_repository = Singleton(
+        ResilientRepository,
+        repository=Singleton(
+            CachedRepository,
+            repository=Singleton(
+                ClubRepository,
+                inserts=Singleton(
+                    InsertCoalescer,
+                    table=club_table,
+                    field_columns=CLUB_COLUMNS,
+                    entity="club",
+                    max_batch=config.INSERT_COALESCING_MAX_BATCH,
+                    max_delay=config.INSERT_COALESCING_MAX_DELAY_MS / 1000,
+                ) if config.INSERT_COALESCING_ENABLED else None,
+            ),
+            entity="club",
+            cache=cache,
+            reads=CLUB_READS,
+        ),
+        entity="club",
+        breaker=database_breaker,
+        stale=stale_cache,
+    )
+    stadium_repository = Singleton(
+        ResilientRepository,
+        repository=Singleton(
+            CachedRepository,
+            repository=Singleton(
+                StadiumRepository,
+                inserts=Singleton(
+                    InsertCoalescer,
+                    table=stadium_table,
+                    field_columns=STADIUM_COLUMNS,
+                    entity="stadium",
+                    max_batch=config.INSERT_COALESCING_MAX_BATCH,
+                    max_delay=config.INSERT_COALESCING_MAX_DELAY_MS / 1000,
+                ) if config.INSERT_COALESCING_ENABLED else None,
+            ),
+            entity="stadium",
+            cache=cache,
+            reads=STADIUM_READS,
+        ),
+        entity="stadium",
+        breaker=database_breaker,
+        stale=stale_cache,
+    )
+    email_filter = Singleton(
+        EmailFilter,
+        error_rate=config.EMAIL_FILTER_ERROR_RATE,
+        min_capacity=config.EMAIL_FILTER_MIN_CAPACITY,
+        rebuild_interval=config.EMAIL_FILTER_REBUILD_INTERVAL,
+    )
+    user_repository = Singleton(
+        UserRepository,
+        emails=email_filter if config.EMAIL_FILTER_ENABLED else None,
+    )
+
+    club_service = Singleton(
         ClubService,
         repository=club_repository,
     )
-    stadium_service = Factory(
+    stadium_service = Singleton(
         StadiumService,
         repository=stadium_repository,
     )
-   
-    user_service = Factory(
+    user_service = Singleton(
         UserService,
         repository=user_repository,
-    )
\ No newline at end of file
+    )
+
+
+container = Container()
\ No newline at end of file
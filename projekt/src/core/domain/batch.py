@@ -0,0 +1,58 @@
+"""A module containing batch mutation models."""
+
+from typing import Generic, Literal, TypeVar
+
+from pydantic import BaseModel, Field, model_validator
+
+DataT = TypeVar("DataT", bound=BaseModel)
+
+BatchOp = Literal["create", "update", "delete"]
+
+
+class BatchOperation(BaseModel, Generic[DataT]):
+    """A single operation of the batch request.
+
+    `create` requires `data`, `update` requires `id` and `data`, and
+    `delete` requires `id` only.
+    """
+
+    op: BatchOp
+    id: int | None = None
+    data: DataT | None = None
+
+    @model_validator(mode="after")
+    def check_arguments(self) -> "BatchOperation":
+        """The method validating the arguments of the operation.
+
+        Raises:
+            ValueError: If a required argument is missing or unexpected.
+
+        Returns:
+            BatchOperation: The validated operation.
+        """
+
+        if self.op == "create" and self.id is not None:
+            raise ValueError("create does not accept an id")
+        if self.op != "create" and self.id is None:
+            raise ValueError(f"{self.op} requires an id")
+        if self.op != "delete" and self.data is None:
+            raise ValueError(f"{self.op} requires data")
+
+        return self
+
+
+class BatchRequest(BaseModel, Generic[DataT]):
+    """A batch of operations applied in a single transaction."""
+
+    operations: list[BatchOperation[DataT]] = Field(min_length=1)
+
+
+class BatchResult(BaseModel):
+    """The result of a single operation of the batch."""
+
+    index: int
+    op: BatchOp
+    status: int
+    id: int | None = None
+    item: dict | None = None
+    error: str | None = None
@@ -0,0 +1,22 @@
+"""A module containing delta synchronization models."""
+
+from pydantic import BaseModel
+
+# A cursor is `0` before the first sync, then the transaction id and the
+# sequence value of the last synced change.
+CHANGE_CURSOR_PATTERN = r"^(0|[0-9]+:[0-9]+)$"
+
+
+class ChangeSet(BaseModel):
+    """The changes of a table since the client cursor.
+
+    `changed` holds the current attributes of the created and updated
+    rows and `deleted` the ids of the removed ones. The returned `cursor`
+    is passed as `since` of the next request; `more` is set when the page
+    limit cut the changes short.
+    """
+
+    cursor: str
+    more: bool
+    changed: list[dict]
+    deleted: list[int]
@@ -1,5 +1,3 @@
-from typing import Optional
-from fastapi import fastAPI, Depends
 from pydantic import BaseModel, ConfigDict
 
 
@@ -13,6 +11,4 @@ class StadiumIn(BaseModel):
 
 class Stadium(StadiumIn):
     id: int
-    model_config = ConfigDict(from_attributes=True, extra="ignore")
-
-app = fastAPI()
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
\ No newline at end of file
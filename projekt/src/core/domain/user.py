@@ -1,7 +1,9 @@
 """A model containing user-related models."""
 
 
-from pydantic import BaseModel, ConfigDict, UUID1
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
 
 
 class UserIn(BaseModel):
@@ -12,6 +14,6 @@ class UserIn(BaseModel):
 
 class User(UserIn):
     """The user model class."""
-    id: UUID1
+    id: UUID
 
     model_config = ConfigDict(from_attributes=True, extra="ignore")
\ No newline at end of file
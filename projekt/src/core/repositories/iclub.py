@@ -1,8 +1,10 @@
 """Module containing contient repository abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import AsyncIterable, AsyncIterator, Iterable
 
+from src.core.domain.batch import BatchOperation, BatchResult
+from src.core.domain.changes import ChangeSet
 from src.core.domain.club import Club, ClubIn
 
 
@@ -10,20 +12,33 @@ class IClubRepository(ABC):
     """An abstract class representing protocol of continent repository."""
 
     @abstractmethod
-    async def get_continent_by_id(self, club_id: int) -> Club | None:
+    async def get_club_by_id(
+        self,
+        club_id: int,
+        fields: Iterable[str] | None = None,
+    ) -> Club | dict | None:
         """The abstract getting a club from the data storage.
 
         Args:
             club_id (int): The id of the club.
+            fields (Iterable[str] | None, optional): The projected fields.
+                Defaults to None.
 
         Returns:
-            club | None: The club data if exists.
+            club | dict | None: The club data if exists.
         """
 
     @abstractmethod
-    async def get_all_clubs(self) -> Iterable[Club]:
+    async def get_all_clubs(
+        self,
+        fields: Iterable[str] | None = None,
+    ) -> Iterable[Club | dict]:
         """The abstract getting all clus from the data storage.
 
+        Args:
+            fields (Iterable[str] | None, optional): The projected fields.
+                Defaults to None.
+
         Returns:
             Iterable[Club]: The collection of the all continents.
         """
@@ -61,4 +76,61 @@ class IClubRepository(ABC):
 
         Returns:
             bool: Success of the operation.
-        """
\ No newline at end of file
+        """
+
+    @abstractmethod
+    async def apply_batch(
+        self,
+        operations: list[BatchOperation[ClubIn]],
+    ) -> list[BatchResult]:
+        """The abstract applying the batch of mutations in one transaction.
+
+        Args:
+            operations (list[BatchOperation[ClubIn]]): The operations.
+
+        Returns:
+            list[BatchResult]: The per-item results.
+        """
+
+    @abstractmethod
+    def export_csv(self) -> AsyncIterator[bytes]:
+        """The abstract streaming all clubs as CSV.
+
+        Returns:
+            AsyncIterator[bytes]: The CSV chunks.
+        """
+
+    @abstractmethod
+    async def import_csv(self, body: AsyncIterable[bytes]) -> int:
+        """The abstract loading clubs from the streamed CSV.
+
+        Args:
+            body (AsyncIterable[bytes]): The CSV upload.
+
+        Returns:
+            int: The number of imported clubs.
+        """
+
+    @abstractmethod
+    async def get_changes(self, since: str, limit: int) -> ChangeSet:
+        """The abstract getting the clubs changed after the cursor.
+
+        Args:
+            since (str): The cursor of the last synced change.
+            limit (int): The maximum number of changes.
+
+        Returns:
+            ChangeSet: The changed and deleted clubs and the next cursor.
+        """
+
+    @abstractmethod
+    async def count_clubs(self, approximate: bool = False) -> int:
+        """The abstract counting all clubs.
+
+        Args:
+            approximate (bool, optional): Whether an estimate is
+                sufficient. Defaults to False.
+
+        Returns:
+            int: The number of clubs.
+        """
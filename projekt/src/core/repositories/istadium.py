@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import AsyncIterable, AsyncIterator, Iterable
 
+from src.core.domain.batch import BatchOperation, BatchResult
+from src.core.domain.changes import ChangeSet
 from src.core.domain.stadium import Stadium, StadiumIn
 
 
@@ -8,22 +10,35 @@ class IStadiumRepository(ABC):
     """An abstract class representing protocol of stadiums repository."""
 
     @abstractmethod
-    async def get_all_stadiums(self) -> Iterable[Stadium]:
+    async def get_all_stadiums(
+        self,
+        fields: Iterable[str] | None = None,
+    ) -> Iterable[Stadium | dict]:
         """The abstract getting all stadiums from the data storage.
 
+        Args:
+            fields (Iterable[str] | None, optional): The projected fields.
+                Defaults to None.
+
         Returns:
-            Iterable[Stadium]: Stadiums in the data storage.
+            Iterable[Stadium | dict]: Stadiums in the data storage.
         """
 
     @abstractmethod
-    async def get_by_id(self, stadiumId: int) -> Stadium | None:
+    async def get_stadium_by_id(
+        self,
+        stadiumsId: int,
+        fields: Iterable[str] | None = None,
+    ) -> Stadium | dict | None:
         """The abstract getting stadium by provided id.
 
         Args:
-            stadium_id (int): The id of the airport.
+            stadiumsId (int): The id of the stadium.
+            fields (Iterable[str] | None, optional): The projected fields.
+                Defaults to None.
 
         Returns:
-            Stadium | None: The stadium details.
+            Stadium | dict | None: The stadium details.
         """
 
         @abstractmethod
@@ -94,3 +109,59 @@ class IStadiumRepository(ABC):
                 bool: Success of the operation.
             """
 
+    @abstractmethod
+    async def apply_batch(
+        self,
+        operations: list[BatchOperation[StadiumIn]],
+    ) -> list[BatchResult]:
+        """The abstract applying the batch of mutations in one transaction.
+
+        Args:
+            operations (list[BatchOperation[StadiumIn]]): The operations.
+
+        Returns:
+            list[BatchResult]: The per-item results.
+        """
+
+    @abstractmethod
+    def export_csv(self) -> AsyncIterator[bytes]:
+        """The abstract streaming all stadiums as CSV.
+
+        Returns:
+            AsyncIterator[bytes]: The CSV chunks.
+        """
+
+    @abstractmethod
+    async def import_csv(self, body: AsyncIterable[bytes]) -> int:
+        """The abstract loading stadiums from the streamed CSV.
+
+        Args:
+            body (AsyncIterable[bytes]): The CSV upload.
+
+        Returns:
+            int: The number of imported stadiums.
+        """
+
+    @abstractmethod
+    async def get_changes(self, since: str, limit: int) -> ChangeSet:
+        """The abstract getting the stadiums changed after the cursor.
+
+        Args:
+            since (str): The cursor of the last synced change.
+            limit (int): The maximum number of changes.
+
+        Returns:
+            ChangeSet: The changed and deleted stadiums and the next cursor.
+        """
+
+    @abstractmethod
+    async def count_stadiums(self, approximate: bool = False) -> int:
+        """The abstract counting all stadiums.
+
+        Args:
+            approximate (bool, optional): Whether an estimate is
+                sufficient. Defaults to False.
+
+        Returns:
+            int: The number of stadiums.
+        """
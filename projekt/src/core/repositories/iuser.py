@@ -3,8 +3,7 @@
 
 from abc import ABC, abstractmethod
 from typing import Any
-
-from pydantic import UUID5
+from uuid import UUID
 
 from src.core.domain.user import UserIn
 
@@ -24,11 +23,11 @@ class IUserRepository(ABC):
         """
 
     @abstractmethod
-    async def get_by_uuid(self, uuid: UUID5) -> Any | None:
+    async def get_by_uuid(self, uuid: UUID) -> Any | None:
         """A method getting user by UUID.
 
         Args:
-            uuid (UUID5): UUID of the user.
+            uuid (UUID): UUID of the user.
 
         Returns:
             Any | None: The user object if exists.
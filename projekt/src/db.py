@@ -1,6 +1,7 @@
 """A module providing database access."""
 
 import asyncio
+import logging
 
 import databases
 import sqlalchemy
@@ -14,15 +15,72 @@ from asyncpg.exceptions import (    # type: ignore
 )
 
 from src.config import config
+from src.infrastructure.utils.changefeed import (
+    CHANGES_CHANNEL,
+    ChangeEvent,
+    ChangeFeed,
+)
+from src.infrastructure.utils.invalidation import (
+    INVALIDATION_CHANNEL,
+    InvalidationBus,
+)
+from src.infrastructure.utils.metrics import DB_POOL_CONNECTIONS
+from src.infrastructure.utils.pglisten import PgListener
+from src.infrastructure.utils.prepared import PREPARED_POOL_OPTIONS
+from src.infrastructure.utils.querytrace import QueryTracer, TracedDatabase
+from src.infrastructure.utils.replicas import Replica, RoutedDatabase
+from src.infrastructure.utils.uuid7 import uuid7
+
+logger = logging.getLogger(__name__)
 
 metadata = sqlalchemy.MetaData()
 
+# A single sequence orders the changes of all synchronized tables, so one
+# cursor is comparable across rows and tombstones.
+change_sequence = sqlalchemy.Sequence("change_seq", metadata=metadata)
+
+# The id of the writing transaction orders the changes before the
+# sequence, so a cursor never passes a transaction still in progress.
+CURRENT_XID = "pg_current_xact_id()::text::bigint"
+
+
+def _change_seq_column() -> sqlalchemy.Column:
+    """Function creating the change sequence column.
+
+    Returns:
+        sqlalchemy.Column: The column filled from `change_seq`.
+    """
+    return sqlalchemy.Column(
+        "change_seq",
+        sqlalchemy.BigInteger,
+        server_default=sqlalchemy.text("nextval('change_seq')"),
+        nullable=False,
+    )
+
+
+def _change_xid_column() -> sqlalchemy.Column:
+    """Function creating the writing transaction id column.
+
+    Returns:
+        sqlalchemy.Column: The column filled with the transaction id.
+    """
+    return sqlalchemy.Column(
+        "change_xid",
+        sqlalchemy.BigInteger,
+        server_default=sqlalchemy.text(CURRENT_XID),
+        nullable=False,
+    )
+
+
 stadium_table = sqlalchemy.Table(
     "stadiums",
     metadata,
     sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
     sqlalchemy.Column("name", sqlalchemy.String),
     sqlalchemy.Column("club name", sqlalchemy.String),
+    _change_seq_column(),
+    _change_xid_column(),
+    sqlalchemy.Index("ix_stadiums_change", "change_xid", "change_seq"),
 )
 
 club_table = sqlalchemy.Table(
@@ -36,9 +94,29 @@ club_table = sqlalchemy.Table(
         sqlalchemy.ForeignKey("club_id"),
         nullable=False,
     ),
+    _change_seq_column(),
+    _change_xid_column(),
+    sqlalchemy.Index("ix_clubs_change", "change_xid", "change_seq"),
+)
+
+tombstone_table = sqlalchemy.Table(
+    "tombstones",
+    metadata,
+    sqlalchemy.Column("table_name", sqlalchemy.String, primary_key=True),
+    sqlalchemy.Column("row_id", sqlalchemy.Integer, primary_key=True),
+    _change_seq_column(),
+    _change_xid_column(),
+    sqlalchemy.Index(
+        "ix_tombstones_change",
+        "table_name",
+        "change_xid",
+        "change_seq",
+    ),
 )
 
 
+# The application generates time-ordered UUIDv7 ids, the random server
+# default only covers rows inserted by other clients.
 user_table = sqlalchemy.Table(
     "users",
     metadata,
@@ -46,6 +124,7 @@ user_table = sqlalchemy.Table(
         "id",
         UUID(as_uuid=True),
         primary_key=True,
+        default=uuid7,
         server_default=sqlalchemy.text("gen_random_uuid()"),
     ),
     sqlalchemy.Column("email", sqlalchemy.String, unique=True),
@@ -57,18 +136,181 @@ db_uri = (
     f"@{config.DB_HOST}/{config.DB_NAME}"
 )
 
+# Statement-level triggers notify one event per changed row, or a single
+# `reload` event for statements changing more than 1000 rows.
+change_triggers = [
+    f"""
+    CREATE OR REPLACE FUNCTION notify_table_change() RETURNS trigger AS $$
+    DECLARE
+        changed integer[];
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            SELECT array_agg(id) INTO changed
+            FROM (SELECT id FROM old_rows LIMIT 1001) AS limited;
+        ELSE
+            SELECT array_agg(id) INTO changed
+            FROM (SELECT id FROM new_rows LIMIT 1001) AS limited;
+        END IF;
+
+        IF cardinality(changed) > 1000 THEN
+            PERFORM pg_notify('{CHANGES_CHANNEL}', CAST(json_build_object(
+                'table', TG_TABLE_NAME, 'op', 'reload', 'id', NULL
+            ) AS text));
+        ELSE
+            PERFORM pg_notify('{CHANGES_CHANNEL}', CAST(json_build_object(
+                'table', TG_TABLE_NAME, 'op', lower(TG_OP), 'id', id
+            ) AS text))
+            FROM unnest(changed) AS id;
+        END IF;
+
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    *(
+        f"""
+        CREATE OR REPLACE TRIGGER {table.name}_notify_{op.lower()}
+        AFTER {op} ON {table.name}
+        REFERENCING {"OLD" if op == "DELETE" else "NEW"} TABLE AS
+            {"old_rows" if op == "DELETE" else "new_rows"}
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change()
+        """
+        for table in (club_table, stadium_table)
+        for op in ("INSERT", "UPDATE", "DELETE")
+    ),
+]
+
+# Every insert and update takes the next value of `change_seq` and the id
+# of its transaction, including rows loaded with `COPY`. The columns and
+# indexes are added to tables created before change tracking.
+change_tracking = [
+    "CREATE SEQUENCE IF NOT EXISTS change_seq",
+    *(
+        statement
+        for table in (club_table, stadium_table)
+        for statement in (
+            f"""
+            ALTER TABLE {table.name} ADD COLUMN IF NOT EXISTS change_seq
+            bigint NOT NULL DEFAULT nextval('change_seq')
+            """,
+            f"""
+            ALTER TABLE {table.name} ADD COLUMN IF NOT EXISTS change_xid
+            bigint NOT NULL DEFAULT {CURRENT_XID}
+            """,
+            f"DROP INDEX IF EXISTS ix_{table.name}_change_seq",
+            f"""
+            CREATE INDEX IF NOT EXISTS ix_{table.name}_change
+            ON {table.name} (change_xid, change_seq)
+            """,
+        )
+    ),
+    f"""
+    ALTER TABLE tombstones ADD COLUMN IF NOT EXISTS change_xid
+    bigint NOT NULL DEFAULT {CURRENT_XID}
+    """,
+    "DROP INDEX IF EXISTS ix_tombstones_change_seq",
+    """
+    CREATE INDEX IF NOT EXISTS ix_tombstones_change
+    ON tombstones (table_name, change_xid, change_seq)
+    """,
+    f"""
+    CREATE OR REPLACE FUNCTION set_change_seq() RETURNS trigger AS $$
+    BEGIN
+        NEW.change_xid := {CURRENT_XID};
+        NEW.change_seq := nextval('change_seq');
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    *(
+        f"""
+        CREATE OR REPLACE TRIGGER {table.name}_change_seq
+        BEFORE INSERT OR UPDATE ON {table.name}
+        FOR EACH ROW EXECUTE FUNCTION set_change_seq()
+        """
+        for table in (club_table, stadium_table)
+    ),
+]
+
 engine = create_async_engine(
     db_uri,
-    echo=True,
+    echo=config.DB_ECHO,
     future=True,
     pool_pre_ping=True,
 )
 
-database = databases.Database(
-    db_uri,
-    force_rollback=True,
+query_tracer = QueryTracer(
+    threshold=config.SLOW_QUERY_THRESHOLD_MS / 1000,
+    explain_rate=config.EXPLAIN_SAMPLE_RATE,
+    buffer_size=config.QUERY_RING_BUFFER_SIZE,
 )
 
+# Read replicas are given as comma separated asyncpg connection strings.
+replica_uris = [
+    uri.strip()
+    for uri in (config.DB_REPLICA_URLS or "").split(",")
+    if uri.strip()
+]
+
+database = RoutedDatabase(
+    TracedDatabase(
+        databases.Database(db_uri, **PREPARED_POOL_OPTIONS),
+        query_tracer,
+    ),
+    [
+        Replica(
+            f"replica{index}",
+            TracedDatabase(
+                databases.Database(uri, **PREPARED_POOL_OPTIONS),
+                query_tracer,
+            ),
+        )
+        for index, uri in enumerate(replica_uris, start=1)
+    ],
+    max_lag=config.DB_REPLICA_MAX_LAG,
+    poll_interval=config.DB_REPLICA_POLL_INTERVAL,
+)
+
+
+change_feed = ChangeFeed(queue_size=config.CHANGE_FEED_QUEUE_SIZE)
+
+invalidation_bus = InvalidationBus()
+
+pg_listener = PgListener(db_uri.replace("+asyncpg", "", 1))
+pg_listener.add_listener(CHANGES_CHANNEL, change_feed.publish_payload)
+pg_listener.add_listener(INVALIDATION_CHANNEL, invalidation_bus.receive)
+
+
+def _resync() -> None:
+    """Function resetting the state fed by the missed notifications."""
+    invalidation_bus.flush()
+    for table in (club_table, stadium_table):
+        change_feed.publish(ChangeEvent(table.name, "reload", None))
+
+
+pg_listener.add_reconnect_listener(_resync)
+
+
+def _pool_size(idle: bool = False) -> int:
+    """Function reading the connection count of the database pool.
+
+    Args:
+        idle (bool, optional): Whether to count idle connections only.
+            Defaults to False.
+
+    Returns:
+        int: The number of connections.
+    """
+    pool = getattr(database._backend, "_pool", None)  # pylint: disable=W0212
+    if pool is None:
+        return 0
+
+    return pool.get_idle_size() if idle else pool.get_size()
+
+
+DB_POOL_CONNECTIONS.labels("open").set_function(_pool_size)
+DB_POOL_CONNECTIONS.labels("idle").set_function(lambda: _pool_size(True))
+
 
 async def init_db(retries: int = 5, delay: int = 5) -> None:
     """Function initializing the DB.
@@ -82,6 +324,8 @@ async def init_db(retries: int = 5, delay: int = 5) -> None:
         try:
             async with engine.begin() as conn:
                 await conn.run_sync(metadata.create_all)
+                for statement in [*change_tracking, *change_triggers]:
+                    await conn.execute(sqlalchemy.text(statement))
             return
         except (
             OperationalError,
@@ -89,7 +333,7 @@ async def init_db(retries: int = 5, delay: int = 5) -> None:
             CannotConnectNowError,
             ConnectionDoesNotExistError,
         ) as e:
-            print(f"Attempt {attempt + 1} failed: {e}")
+            logger.warning("Attempt %d failed: %s", attempt + 1, e)
             await asyncio.sleep(delay)
 
     raise ConnectionError("Could not connect to DB after several retries.")
\ No newline at end of file
@@ -2,8 +2,10 @@
 
 
 from typing import Optional
+from uuid import UUID
+
 from asyncpg import Record  # type: ignore
-from pydantic import UUID4, BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict
 
 from src.infrastructure.dto.clubdto import ClubDTO
 
@@ -13,7 +15,7 @@ class StadiumDTO(BaseModel):
     id: int
     name: str
     club: ClubDTO
-    user_id: UUID4
+    user_id: UUID
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -1,13 +1,15 @@
 """A module containing user DTO model."""
 
 
-from pydantic import UUID4, BaseModel, ConfigDict
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
 
 
 class UserDTO(BaseModel):
     """A DTO model for user."""
 
-    id: UUID4
+    id: UUID
     email: str
 
     model_config = ConfigDict(
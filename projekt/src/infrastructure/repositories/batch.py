@@ -0,0 +1,289 @@
+"""Module containing the set-based batch mutation implementation."""
+
+from typing import Iterable, Mapping
+
+import sqlalchemy
+from pydantic import BaseModel
+
+from src.core.domain.batch import BatchOperation, BatchResult
+from src.db import database
+from src.infrastructure.repositories.changes import record_tombstones
+
+# PostgreSQL accepts at most 32767 bind parameters per statement.
+MAX_PARAMETERS = 32767
+
+
+async def apply_batch(
+    table: sqlalchemy.Table,
+    field_columns: Mapping[str, sqlalchemy.Column],
+    operations: list[BatchOperation],
+) -> list[BatchResult]:
+    """A function applying the batch operations in a single transaction.
+
+    Operations are grouped by kind and every group is executed as a few
+    multi-row statements: creates as `INSERT ... VALUES ... RETURNING`,
+    updates as `UPDATE ... FROM (VALUES ...) RETURNING` and deletes as
+    `DELETE ... WHERE id IN (...) RETURNING`. Creates run first, then
+    updates, then deletes. The returned rows are matched to the
+    operations by id, as their order is not guaranteed. Missing rows are
+    reported per item, while a database error rolls the whole batch back.
+
+    Args:
+        table (sqlalchemy.Table): The mutated table.
+        field_columns (Mapping[str, sqlalchemy.Column]): The model fields
+            mapped to the table columns.
+        operations (list[BatchOperation]): The operations of the batch.
+
+    Raises:
+        ValueError: If an id is targeted by more than one operation.
+
+    Returns:
+        list[BatchResult]: The results in the order of the operations.
+    """
+
+    targets = [
+        operation.id for operation in operations if operation.id is not None
+    ]
+    if len(targets) != len(set(targets)):
+        raise ValueError("Each id may be targeted by one operation only")
+
+    returning = [
+        column.label(field) for field, column in field_columns.items()
+    ]
+    results: list[BatchResult | None] = [None] * len(operations)
+    groups: dict[str, list[int]] = {"create": [], "update": [], "delete": []}
+    for index, operation in enumerate(operations):
+        groups[operation.op].append(index)
+
+    async with database.transaction():
+        for chunk in _chunks(groups["create"], len(returning)):
+            ids = await reserve_ids(table, len(chunk))
+            query = (
+                table.insert()
+                .values([
+                    {
+                        table.c.id.name: row_id,
+                        **column_values(field_columns, operations[index].data),
+                    }
+                    for row_id, index in zip(ids, chunk)
+                ])
+                .returning(*returning)
+            )
+            created = {
+                row["id"]: row for row in await database.fetch_all(query)
+            }
+            for row_id, index in zip(ids, chunk):
+                results[index] = _result(
+                    index,
+                    operations[index],
+                    201,
+                    created[row_id],
+                )
+
+        for chunk in _chunks(groups["update"], len(returning) + 1):
+            rows = await database.fetch_all(
+                _update(table, field_columns, operations, chunk, returning),
+            )
+            updated = {row["id"]: dict(row) for row in rows}
+            for index in chunk:
+                item = updated.get(operations[index].id)
+                results[index] = _result(
+                    index,
+                    operations[index],
+                    200 if item else 404,
+                    item,
+                )
+
+        for chunk in _chunks(groups["delete"], 1):
+            ids = [operations[index].id for index in chunk]
+            query = (
+                table.delete()
+                .where(table.c.id.in_(ids))
+                .returning(table.c.id)
+            )
+            deleted = {row["id"] for row in await database.fetch_all(query)}
+            await record_tombstones(table, deleted)
+            for index in chunk:
+                status = 204 if operations[index].id in deleted else 404
+                results[index] = _result(index, operations[index], status)
+
+    return [result for result in results if result]
+
+
+async def reserve_ids(table: sqlalchemy.Table, count: int) -> list[int]:
+    """A function taking the next values of the serial id of the table.
+
+    Multi-row inserts get their ids upfront, so their rows can be told
+    apart in the `RETURNING` rows, which come back in no guaranteed
+    order.
+
+    Args:
+        table (sqlalchemy.Table): The table with a serial `id` column.
+        count (int): The number of ids.
+
+    Returns:
+        list[int]: The reserved ids.
+    """
+
+    query = sqlalchemy.select(
+        sqlalchemy.func.nextval(
+            sqlalchemy.func.pg_get_serial_sequence(table.name, "id"),
+        ).label("id"),
+    ).select_from(sqlalchemy.func.generate_series(1, count))
+
+    return [row["id"] for row in await database.fetch_all(query)]
+
+
+def _update(
+    table: sqlalchemy.Table,
+    field_columns: Mapping[str, sqlalchemy.Column],
+    operations: list[BatchOperation],
+    chunk: list[int],
+    returning: list,
+) -> sqlalchemy.Update:
+    """A private function building the multi-row update statement.
+
+    Args:
+        table (sqlalchemy.Table): The mutated table.
+        field_columns (Mapping[str, sqlalchemy.Column]): The field mapping.
+        operations (list[BatchOperation]): The operations of the batch.
+        chunk (list[int]): The indexes of the updates in the statement.
+        returning (list): The labelled columns to return.
+
+    Returns:
+        sqlalchemy.Update: The `UPDATE ... FROM (VALUES ...)` statement.
+    """
+
+    columns = [
+        column for column in field_columns.values()
+        if column is not table.c.id
+    ]
+    source = sqlalchemy.values(
+        sqlalchemy.column("id", table.c.id.type),
+        *(sqlalchemy.column(column.name, column.type) for column in columns),
+        name="source",
+    ).data([
+        (
+            operations[index].id,
+            *column_values(field_columns, operations[index].data).values(),
+        )
+        for index in chunk
+    ])
+
+    return (
+        table.update()
+        .where(table.c.id == _typed(source.c.id, table.c.id))
+        .values({
+            column.name: _typed(source.c[column.name], column)
+            for column in columns
+        })
+        .returning(*returning)
+    )
+
+
+def _typed(
+    value: sqlalchemy.ColumnElement,
+    column: sqlalchemy.Column,
+) -> sqlalchemy.ColumnElement:
+    """A private function casting the `VALUES` column to the column type.
+
+    PostgreSQL types untyped parameters of a `VALUES` list as text, so
+    they need an explicit cast to be compared with or assigned to the
+    table columns.
+
+    Args:
+        value (sqlalchemy.ColumnElement): The `VALUES` column.
+        column (sqlalchemy.Column): The table column.
+
+    Returns:
+        sqlalchemy.ColumnElement: The cast column if the type is known.
+    """
+
+    if isinstance(column.type, sqlalchemy.types.NullType):
+        return value
+
+    return sqlalchemy.cast(value, column.type)
+
+
+def column_values(
+    field_columns: Mapping[str, sqlalchemy.Column],
+    data: BaseModel | None,
+) -> dict:
+    """A function mapping the model to the stored column values.
+
+    Args:
+        field_columns (Mapping[str, sqlalchemy.Column]): The field mapping.
+        data (BaseModel | None): The model of the operation.
+
+    Returns:
+        dict: The values keyed by column name, the id excluded.
+    """
+
+    fields = data.model_dump() if data else {}
+
+    return {
+        column.name: _coerce(column, fields.get(field))
+        for field, column in field_columns.items()
+        if field != "id"
+    }
+
+
+def _coerce(column: sqlalchemy.Column, value: object) -> object:
+    """A private function converting the value to the column type.
+
+    Args:
+        column (sqlalchemy.Column): The target column.
+        value (object): The model value.
+
+    Returns:
+        object: The value accepted by the column.
+    """
+
+    if value is not None and isinstance(column.type, sqlalchemy.String):
+        return str(value)
+
+    return value
+
+
+def _chunks(indexes: list[int], width: int) -> Iterable[list[int]]:
+    """A private function splitting the rows by the parameter limit.
+
+    Args:
+        indexes (list[int]): The indexes of the operations.
+        width (int): The number of parameters per row.
+
+    Yields:
+        Iterable[list[int]]: The indexes fitting one statement.
+    """
+
+    size = max(1, MAX_PARAMETERS // max(1, width))
+    for start in range(0, len(indexes), size):
+        yield indexes[start:start + size]
+
+
+def _result(
+    index: int,
+    operation: BatchOperation,
+    status: int,
+    item: Mapping | None = None,
+) -> BatchResult:
+    """A private function building the result of the operation.
+
+    Args:
+        index (int): The position of the operation in the batch.
+        operation (BatchOperation): The applied operation.
+        status (int): The HTTP-like status of the operation.
+        item (Mapping | None, optional): The stored attributes.
+
+    Returns:
+        BatchResult: The result of the operation.
+    """
+
+    return BatchResult(
+        index=index,
+        op=operation.op,
+        status=status,
+        id=item["id"] if item else operation.id,
+        item=dict(item) if item else None,
+        error="Not found" if status == 404 else None,
+    )
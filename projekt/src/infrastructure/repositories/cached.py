@@ -0,0 +1,92 @@
+"""Module containing the caching repository wrapper."""
+
+import inspect
+from typing import Any, Callable
+
+from pydantic import TypeAdapter
+
+from src.core.domain.club import Club
+from src.core.domain.stadium import Stadium
+from src.infrastructure.utils.cache import TieredCache
+
+# The cached read methods with the adapters (de)serializing their results.
+CLUB_READS: dict[str, TypeAdapter] = {
+    "get_club_by_id": TypeAdapter(Club | None),
+    "get_all_clubs": TypeAdapter(list[Club]),
+}
+STADIUM_READS: dict[str, TypeAdapter] = {
+    "get_stadium_by_id": TypeAdapter(Stadium | None),
+    "get_all_stadiums": TypeAdapter(list[Stadium]),
+}
+
+
+class CachedRepository:
+    """A class answering the repository reads from the tiered cache.
+
+    Results of the listed read methods are cached as JSON, keyed by the
+    call arguments. Projected reads vary with the requested fields and
+    are passed through, as are all other attributes. Writes invalidate
+    the cache through the invalidation bus.
+    """
+
+    def __init__(
+        self,
+        repository: Any,
+        entity: str,
+        cache: TieredCache,
+        reads: dict[str, TypeAdapter],
+    ) -> None:
+        """The initializer of the wrapper.
+
+        Args:
+            repository (Any): The wrapped repository.
+            entity (str): The entity name keying the cached results.
+            cache (TieredCache): The cache of the results.
+            reads (dict[str, TypeAdapter]): The cached methods with the
+                adapters of their results.
+        """
+
+        self._repository = repository
+        self._entity = entity
+        self._cache = cache
+        self._reads = reads
+        self._methods: dict[str, Callable] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._repository, name)
+        if name not in self._reads:
+            return attribute
+
+        if name not in self._methods:
+            self._methods[name] = self._cached(name, attribute)
+
+        return self._methods[name]
+
+    def _cached(self, name: str, method: Callable) -> Callable:
+        """A private method wrapping the read method.
+
+        Args:
+            name (str): The method name.
+            method (Callable): The bound method.
+
+        Returns:
+            Callable: The caching method.
+        """
+
+        adapter = self._reads[name]
+        signature = inspect.signature(method)
+
+        async def cached(*args: Any, **kwargs: Any) -> Any:
+            arguments = signature.bind(*args, **kwargs).arguments
+            if arguments.get("fields"):
+                return await method(*args, **kwargs)
+
+            async def load() -> bytes:
+                return adapter.dump_json(await method(*args, **kwargs))
+
+            key = name + repr(sorted(arguments.items()))
+            payload = await self._cache.get_or_load(self._entity, key, load)
+
+            return adapter.validate_json(payload)
+
+        return cached
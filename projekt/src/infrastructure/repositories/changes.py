@@ -0,0 +1,157 @@
+"""Module containing change cursors and tombstones of synced tables."""
+
+from typing import Iterable, Mapping
+
+import sqlalchemy
+from sqlalchemy.dialects.postgresql import insert
+
+from src.core.domain.changes import ChangeSet
+from src.db import CURRENT_XID, database, tombstone_table
+
+# The oldest transaction still in progress. Every transaction below it
+# has ended, so its changes are final.
+HORIZON_QUERY = (
+    "SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint"
+)
+
+
+async def record_tombstones(
+    table: sqlalchemy.Table,
+    ids: Iterable[int],
+) -> None:
+    """A function storing the tombstones of the deleted rows.
+
+    It has to run in the transaction of the delete, so a tombstone is
+    visible exactly when the row is gone. A re-deleted id moves its
+    tombstone forward.
+
+    Args:
+        table (sqlalchemy.Table): The table of the deleted rows.
+        ids (Iterable[int]): The ids of the deleted rows.
+    """
+
+    rows = [{"table_name": table.name, "row_id": row_id} for row_id in ids]
+    if not rows:
+        return
+
+    query = insert(tombstone_table).values(rows)
+    query = query.on_conflict_do_update(
+        index_elements=[
+            tombstone_table.c.table_name,
+            tombstone_table.c.row_id,
+        ],
+        set_={
+            "change_seq": sqlalchemy.func.nextval("change_seq"),
+            "change_xid": sqlalchemy.text(CURRENT_XID),
+        },
+    )
+    await database.execute(query)
+
+
+async def fetch_changes(
+    table: sqlalchemy.Table,
+    field_columns: Mapping[str, sqlalchemy.Column],
+    since: str,
+    limit: int,
+) -> ChangeSet:
+    """A function reading the changes after the cursor.
+
+    Changes are ordered by the id of the writing transaction and then by
+    the sequence value. Sequence values are taken when a row is written,
+    not when it is committed, so a transaction still in progress may
+    commit a change below the changes already visible. Only changes of
+    transactions older than the oldest one in progress are returned, so
+    the cursor never passes a change that commits later.
+
+    Rows and tombstones are both read by a range scan of their change
+    index, so the cost grows with the number of changes instead of the
+    table size. They are merged and cut at `limit`; when a row was
+    deleted and created again only the latest change is returned.
+
+    Args:
+        table (sqlalchemy.Table): The synced table.
+        field_columns (Mapping[str, sqlalchemy.Column]): The model fields
+            mapped to the table columns.
+        since (str): The cursor of the last synced change.
+        limit (int): The maximum number of changes.
+
+    Returns:
+        ChangeSet: The page of changes and the next cursor.
+    """
+
+    position = _position(since)
+    horizon = await database.fetch_val(HORIZON_QUERY)
+
+    rows_query = (
+        sqlalchemy.select(
+            table.c.change_xid,
+            table.c.change_seq,
+            *(column.label(field) for field, column in field_columns.items()),
+        )
+        .where(
+            sqlalchemy.tuple_(table.c.change_xid, table.c.change_seq)
+            > sqlalchemy.tuple_(*position),
+            table.c.change_xid < horizon,
+        )
+        .order_by(table.c.change_xid, table.c.change_seq)
+        .limit(limit + 1)
+    )
+    tombstones_query = (
+        sqlalchemy.select(
+            tombstone_table.c.change_xid,
+            tombstone_table.c.change_seq,
+            tombstone_table.c.row_id,
+        )
+        .where(
+            tombstone_table.c.table_name == table.name,
+            sqlalchemy.tuple_(
+                tombstone_table.c.change_xid,
+                tombstone_table.c.change_seq,
+            ) > sqlalchemy.tuple_(*position),
+            tombstone_table.c.change_xid < horizon,
+        )
+        .order_by(tombstone_table.c.change_xid, tombstone_table.c.change_seq)
+        .limit(limit + 1)
+    )
+
+    changes = sorted(
+        [
+            *(((row["change_xid"], row["change_seq"]), row["id"], row)
+              for row in await database.fetch_all(rows_query)),
+            *(((row["change_xid"], row["change_seq"]), row["row_id"], None)
+              for row in await database.fetch_all(tombstones_query)),
+        ],
+        key=lambda change: change[0],
+    )
+    page = changes[:limit]
+
+    latest: dict[int, Mapping | None] = {}
+    for _, row_id, row in page:
+        latest.pop(row_id, None)
+        latest[row_id] = row
+
+    return ChangeSet(
+        cursor="%d:%d" % page[-1][0] if page else since,
+        more=len(changes) > limit,
+        changed=[
+            {field: row[field] for field in field_columns}
+            for row in latest.values()
+            if row is not None
+        ],
+        deleted=[row_id for row_id, row in latest.items() if row is None],
+    )
+
+
+def _position(cursor: str) -> tuple[int, int]:
+    """A private function reading the change position of the cursor.
+
+    Args:
+        cursor (str): The cursor matching `CHANGE_CURSOR_PATTERN`.
+
+    Returns:
+        tuple[int, int]: The transaction id and the sequence value.
+    """
+
+    xid, _, seq = cursor.partition(":")
+
+    return int(xid), int(seq or 0)
@@ -1,45 +1,140 @@
 """Module containing club repository database implementation."""
 
-from typing import Any, Iterable
+from typing import Any, AsyncIterable, AsyncIterator, Iterable
 
-from asyncpg import Record  # type: ignore
+import sqlalchemy
 
+from src.core.domain.batch import BatchOperation, BatchResult
+from src.core.domain.changes import ChangeSet
 from src.core.domain.club import Club, ClubIn
 from src.core.repositories.iclub import IClubRepository
 from src.db import club_table, database
+from src.infrastructure.repositories.batch import apply_batch
+from src.infrastructure.repositories.changes import (
+    fetch_changes,
+    record_tombstones,
+)
+from src.infrastructure.repositories.coalesce import InsertCoalescer
+from src.infrastructure.repositories.count import count_rows
+from src.infrastructure.repositories.csvcopy import export_csv, import_csv
+from src.infrastructure.repositories.invalidation import publish_invalidation
+from src.infrastructure.utils.metrics import track_query
+from src.infrastructure.utils.prepared import hot_query
+
+FIELD_COLUMNS = {
+    "id": club_table.c.id,
+    "name": club_table.c.name,
+    "place": club_table.c.place,
+    "clubId": club_table.c.club_id,
+}
+
+CLUB_BY_ID = hot_query(
+    "club_by_id",
+    sqlalchemy.select(
+        *[column.label(field) for field, column in FIELD_COLUMNS.items()],
+    ).where(club_table.c.id == sqlalchemy.bindparam("id")),
+)
 
 
 class ClubRepository(IClubRepository):
     """A class implementing the database club repository."""
 
-    async def get_club_by_id(self, clubId: int) -> Any | None:
+    def __init__(self, inserts: InsertCoalescer | None = None) -> None:
+        """The initializer of the repository.
+
+        Args:
+            inserts (InsertCoalescer | None, optional): The coalescer of
+                the concurrent inserts. Defaults to None.
+        """
+
+        self._inserts = inserts
+
+    @track_query
+    async def get_club_by_id(
+        self,
+        clubId: int,
+        fields: Iterable[str] | None = None,
+    ) -> Any | None:
         """The method getting a club from the temporary data storage.
 
         Args:
             clubId (int): The id of the club.
+            fields (Iterable[str] | None, optional): The projected fields.
+                Defaults to None.
 
         Returns:
             Any | None: The club data if exists.
         """
 
-        club = await self._get_by_id(clubId)
+        if fields:
+            query = (
+                sqlalchemy.select(*self._columns(fields))
+                .where(club_table.c.id == clubId)
+            )
+            club = await database.fetch_one(query)
+
+            return dict(club) if club else None
 
-        return Club(**dict(club)) if club else None
+        return await self._get_by_id(clubId)
 
-    async def get_all_clubs(self) -> Iterable[Any]:
+    @track_query
+    async def get_all_clubs(
+        self,
+        fields: Iterable[str] | None = None,
+    ) -> Iterable[Any]:
         """The abstract getting all clubs from the data storage.
 
+        Args:
+            fields (Iterable[str] | None, optional): The projected fields.
+                Defaults to None.
+
         Returns:
             Iterable[Any]: The collection of the all clubs.
         """
 
+        if fields:
+            query = (
+                sqlalchemy.select(*self._columns(fields))
+                .order_by(club_table.c.name.asc())
+            )
+            clubs = await database.fetch_all(query)
+
+            return [dict(club) for club in clubs]
+
         query = club_table.select().order_by(club_table.c.name.asc())
         clubs = await database.fetch_all(query)
 
         return [Club(**dict(club)) for club in clubs]
 
+    @track_query
+    async def get_changes(self, since: str, limit: int) -> ChangeSet:
+        """The method getting the clubs changed after the cursor.
+
+        Args:
+            since (str): The cursor of the last synced change.
+            limit (int): The maximum number of changes.
+
+        Returns:
+            ChangeSet: The changed and deleted clubs and the next cursor.
+        """
+
+        return await fetch_changes(club_table, FIELD_COLUMNS, since, limit)
+
+    @track_query
+    async def count_clubs(self, approximate: bool = False) -> int:
+        """The method counting all clubs.
+
+        Args:
+            approximate (bool, optional): Whether the planner estimate is
+                sufficient. Defaults to False.
+
+        Returns:
+            int: The number of clubs.
+        """
 
+        return await count_rows(club_table, approximate)
 
+    @track_query
     async def add_club(self, data: ClubIn) -> Any | None:
         """The abstract adding new club to the data storage.
 
@@ -50,12 +145,17 @@ class ClubRepository(IClubRepository):
             Any | None: The newly created club.
         """
 
+        if self._inserts is not None:
+            return Club(**await self._inserts.insert(data))
+
         query = club_table.insert().values(**data.model_dump())
-        new_club_id = await database.execute(query)
-        new_club = await self._get_by_id(new_club_id)
+        async with database.transaction():
+            new_club_id = await database.execute(query)
+            await publish_invalidation("club", [new_club_id])
 
-        return Club(**dict(new_club)) if new_club else None
+        return await self._get_by_id(new_club_id)
 
+    @track_query
     async def update_club(
             self,
             clubId: int,
@@ -77,14 +177,15 @@ class ClubRepository(IClubRepository):
                 .where(club_table.c.id == clubId)
                 .values(**data.model_dump())
             )
-            await database.execute(query)
-
-            club = await self._get_by_id(clubId)
+            async with database.transaction():
+                await database.execute(query)
+                await publish_invalidation("club", [clubId])
 
-            return Club(**dict(club)) if club else None
+            return await self._get_by_id(clubId)
 
         return None
 
+    @track_query
     async def delete_club(self, clubId: int) -> bool:
         """The abstract updating removing club from the data storage.
 
@@ -92,30 +193,109 @@ class ClubRepository(IClubRepository):
             clubId (int): The club id.
         """
 
-        if self._get_by_id(clubId):
-            query = club_table \
-                .delete() \
-                .where(club_table.c.id == clubId)
-            await database.execute(query)
+        query = (
+            club_table.delete()
+            .where(club_table.c.id == clubId)
+            .returning(club_table.c.id)
+        )
+        async with database.transaction():
+            deleted = await database.fetch_all(query)
+            await record_tombstones(
+                club_table,
+                [row["id"] for row in deleted],
+            )
+            await publish_invalidation(
+                "club",
+                [row["id"] for row in deleted],
+            )
+
+        return bool(deleted)
+
+    @track_query
+    async def apply_batch(
+        self,
+        operations: list[BatchOperation[ClubIn]],
+    ) -> list[BatchResult]:
+        """The method applying the batch of mutations in one transaction.
+
+        Args:
+            operations (list[BatchOperation[ClubIn]]): The operations.
+
+        Raises:
+            ValueError: If an id is targeted by more than one operation.
+
+        Returns:
+            list[BatchResult]: The per-item results.
+        """
+
+        async with database.transaction():
+            results = await apply_batch(club_table, FIELD_COLUMNS, operations)
+            await publish_invalidation(
+                "club",
+                [result.id for result in results if result.status != 404],
+            )
+
+        return results
+
+    def export_csv(self) -> AsyncIterator[bytes]:
+        """The method streaming all clubs with `COPY ... TO STDOUT`.
+
+        Returns:
+            AsyncIterator[bytes]: The CSV chunks.
+        """
+
+        return export_csv(club_table)
+
+    @track_query
+    async def import_csv(self, body: AsyncIterable[bytes]) -> int:
+        """The method loading clubs with `COPY ... FROM STDIN`.
 
-            return True
+        Args:
+            body (AsyncIterable[bytes]): The CSV upload.
+
+        Raises:
+            ValueError: If the CSV does not match the table.
+
+        Returns:
+            int: The number of imported clubs.
+        """
 
-        return False
+        rows = await import_csv(club_table, body)
+        await publish_invalidation("club")
 
-    async def _get_by_id(self, clubId: int) -> Record | None:
+        return rows
+
+    async def _get_by_id(self, clubId: int) -> Club | None:
         """A private method getting club from the DB based on its ID.
 
+        It runs the prepared statement of the hot query.
+
         Args:
             clubId (int): The ID of the club.
 
         Returns:
-            Any | None: Club record if exists.
+            Club | None: The club if exists.
         """
 
-        query = (
-            club_table.select()
-            .where(club_table.c.id == clubId)
-            .order_by(club_table.c.name.asc())
-        )
+        club = await database.fetch_prepared(CLUB_BY_ID, clubId)
+
+        return Club.model_validate(club) if club else None
+
+    @staticmethod
+    def _columns(fields: Iterable[str]) -> list:
+        """A private method mapping model fields to labelled columns.
+
+        Args:
+            fields (Iterable[str]): The projected fields.
+
+        Raises:
+            ValueError: If any of the fields is not stored in the table.
+
+        Returns:
+            list: The columns labelled with the model field names.
+        """
 
-        return await database.fetch_one(query)
\ No newline at end of file
+        try:
+            return [FIELD_COLUMNS[field].label(field) for field in fields]
+        except KeyError as error:
+            raise ValueError(f"Field {error} cannot be projected") from error
\ No newline at end of file
@@ -0,0 +1,190 @@
+"""Module containing the coalescing of concurrent single-row inserts."""
+
+import asyncio
+import contextvars
+import logging
+from typing import Mapping
+
+import sqlalchemy
+from pydantic import BaseModel
+
+from src.db import database
+from src.infrastructure.repositories.batch import (
+    MAX_PARAMETERS,
+    column_values,
+    reserve_ids,
+)
+from src.infrastructure.repositories.invalidation import publish_invalidation
+from src.infrastructure.utils.metrics import INSERT_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class InsertCoalescer:
+    """A class merging concurrent inserts into multi-row statements.
+
+    Inserts arriving within `max_delay` seconds of the first waiting one
+    are written by a single `INSERT ... VALUES ... RETURNING`, or sooner
+    once `max_batch` rows are waiting. Every caller gets its own row once
+    the statement is committed, so it reads its write as before. If the
+    statement fails, its transaction is rolled back and the rows are
+    retried one by one, so every caller gets the error of its own row
+    only.
+    """
+
+    def __init__(
+        self,
+        table: sqlalchemy.Table,
+        field_columns: Mapping[str, sqlalchemy.Column],
+        entity: str,
+        max_batch: int = 100,
+        max_delay: float = 0.002,
+    ) -> None:
+        """The initializer of the coalescer.
+
+        Args:
+            table (sqlalchemy.Table): The table of the inserts.
+            field_columns (Mapping[str, sqlalchemy.Column]): The model
+                fields mapped to the table columns.
+            entity (str): The entity name of the cache invalidation.
+            max_batch (int, optional): The most rows per statement.
+                Defaults to 100.
+            max_delay (float, optional): The longest wait for more rows
+                in seconds. Defaults to 0.002.
+        """
+
+        self.table = table
+        self.field_columns = field_columns
+        self.entity = entity
+        self.max_batch = min(
+            max(1, max_batch),
+            MAX_PARAMETERS // max(1, len(field_columns)),
+        )
+        self.max_delay = max_delay
+        self._returning = [
+            column.label(field) for field, column in field_columns.items()
+        ]
+        self._pending: list[tuple[dict, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._rows = INSERT_BATCH_SIZE.labels(table.name)
+
+    async def insert(self, data: BaseModel) -> dict:
+        """The method inserting the row with the concurrent ones.
+
+        Args:
+            data (BaseModel): The attributes of the row.
+
+        Returns:
+            dict: The stored attributes keyed by model field.
+        """
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        values = column_values(self.field_columns, data)
+        self._pending.append((values, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """A private method writing the waiting rows in the background.
+
+        The write runs outside of the request contexts, so the deadline
+        of one caller does not cancel the rows of the others.
+        """
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending, self._pending = self._pending, []
+        if pending:
+            asyncio.get_running_loop().create_task(
+                self._write(pending),
+                context=contextvars.Context(),
+            )
+
+    async def _write(
+        self,
+        pending: list[tuple[dict, asyncio.Future]],
+    ) -> None:
+        """A private method inserting the rows and resolving the callers.
+
+        Args:
+            pending (list[tuple[dict, asyncio.Future]]): The column values
+                and the futures of the callers.
+        """
+
+        self._rows.observe(len(pending))
+        try:
+            async with database.transaction():
+                rows = await self._insert([values for values, _ in pending])
+                await publish_invalidation(
+                    self.entity,
+                    [row["id"] for row in rows],
+                )
+        except Exception as error:  # pylint: disable=broad-except
+            if len(pending) == 1:
+                _resolve(pending[0][1], error=error)
+                return
+            logger.debug("Coalesced insert failed, retrying row by row")
+            for values, future in pending:
+                await self._write([(values, future)])
+            return
+
+        for (_, future), row in zip(pending, rows):
+            _resolve(future, row)
+
+    async def _insert(self, rows: list[dict]) -> list[dict]:
+        """A private method running the multi-row insert.
+
+        The rows get their ids upfront and the stored rows are matched by
+        them, as `RETURNING` gives no order guarantee.
+
+        Args:
+            rows (list[dict]): The column values of the rows.
+
+        Returns:
+            list[dict]: The stored attributes in the order of the rows.
+        """
+
+        ids = await reserve_ids(self.table, len(rows))
+        query = (
+            self.table.insert()
+            .values([
+                {self.table.c.id.name: row_id, **values}
+                for row_id, values in zip(ids, rows)
+            ])
+            .returning(*self._returning)
+        )
+        stored = {
+            row["id"]: dict(row) for row in await database.fetch_all(query)
+        }
+
+        return [stored[row_id] for row_id in ids]
+
+
+def _resolve(
+    future: asyncio.Future,
+    row: dict | None = None,
+    error: BaseException | None = None,
+) -> None:
+    """A private function handing the result to the waiting caller.
+
+    Args:
+        future (asyncio.Future): The future of the caller.
+        row (dict | None, optional): The stored row.
+        error (BaseException | None, optional): The error of the row.
+    """
+
+    if future.done():
+        return
+
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(row)
@@ -0,0 +1,45 @@
+"""Module containing the exact and approximate row counting."""
+
+import sqlalchemy
+
+from src.db import database
+
+# Below this estimate an exact count is cheap and preferred.
+APPROXIMATE_MIN_ROWS = 10_000
+
+pg_class = sqlalchemy.table(
+    "pg_class",
+    sqlalchemy.column("oid"),
+    sqlalchemy.column("reltuples"),
+)
+
+
+async def count_rows(table: sqlalchemy.Table, approximate: bool) -> int:
+    """A function counting the rows of the table.
+
+    The approximate count reads the planner statistics maintained by
+    `ANALYZE` and autovacuum. It falls back to the exact count for
+    tables never analyzed or smaller than `APPROXIMATE_MIN_ROWS`.
+
+    Args:
+        table (sqlalchemy.Table): The counted table.
+        approximate (bool): Whether an estimate is sufficient.
+
+    Returns:
+        int: The number of rows.
+    """
+
+    if approximate:
+        query = (
+            sqlalchemy.select(
+                sqlalchemy.cast(pg_class.c.reltuples, sqlalchemy.BigInteger),
+            )
+            .where(pg_class.c.oid == sqlalchemy.func.to_regclass(table.name))
+        )
+        estimate = await database.fetch_val(query)
+        if estimate is not None and estimate >= APPROXIMATE_MIN_ROWS:
+            return estimate
+
+    query = sqlalchemy.select(sqlalchemy.func.count()).select_from(table)
+
+    return await database.fetch_val(query)
@@ -0,0 +1,337 @@
+"""Module containing streaming CSV import and export via `COPY`."""
+
+import asyncio
+import codecs
+import csv
+import io
+import uuid
+from typing import AsyncIterable, AsyncIterator, Callable
+
+import asyncpg  # type: ignore
+import sqlalchemy
+
+from src.db import database
+
+EXPORT_QUEUE_SIZE = 16
+IMPORT_CHUNK_SIZE = 1 << 20
+
+
+async def export_csv(table: sqlalchemy.Table) -> AsyncIterator[bytes]:
+    """A function streaming the table as CSV with `COPY ... TO STDOUT`.
+
+    The `COPY` runs on a connection of its own. The chunks are passed
+    through a bounded queue, so a slow client pauses the `COPY` instead
+    of growing the memory usage.
+
+    Args:
+        table (sqlalchemy.Table): The exported table.
+
+    Yields:
+        AsyncIterator[bytes]: The CSV chunks with the header first.
+    """
+
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue(EXPORT_QUEUE_SIZE)
+
+    async def produce() -> None:
+        cancelled = False
+        try:
+            async with database.dedicated_connection() as connection:
+                await connection.copy_from_table(
+                    table.name,
+                    columns=[column.name for column in table.columns],
+                    output=queue.put,
+                    format="csv",
+                    header=True,
+                )
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            if not cancelled:
+                await queue.put(None)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while (chunk := await queue.get()) is not None:
+            yield chunk
+        await producer
+    finally:
+        producer.cancel()
+
+
+async def import_csv(
+    table: sqlalchemy.Table,
+    body: AsyncIterable[bytes],
+) -> int:
+    """A function streaming the CSV upload with `COPY ... FROM STDIN`.
+
+    The first line has to be a header of table column names. Every chunk
+    is validated against the column definitions before it is forwarded,
+    and an invalid row aborts the `COPY`, so no row is stored. The `COPY`
+    runs on a connection of its own.
+
+    Args:
+        table (sqlalchemy.Table): The target table.
+        body (AsyncIterable[bytes]): The uploaded CSV.
+
+    Raises:
+        ValueError: If the header or any of the rows is invalid, or the
+            rows violate a constraint.
+
+    Returns:
+        int: The number of imported rows.
+    """
+
+    validator = CsvValidator(table)
+
+    async with database.dedicated_connection() as raw:
+        async with raw.transaction():
+            chunks = validator.validate(body)
+            header = await anext(chunks, b"")
+            if not validator.columns:
+                raise ValueError("The CSV header is missing")
+
+            try:
+                status = await raw.copy_to_table(
+                    table.name,
+                    source=_prepend(header, chunks),
+                    columns=validator.columns,
+                    format="csv",
+                    header=True,
+                )
+            except (
+                asyncpg.DataError,
+                asyncpg.IntegrityConstraintViolationError,
+            ) as error:
+                raise ValueError(str(error)) from error
+
+            if (
+                "id" in validator.columns
+                and isinstance(table.c.id.type, sqlalchemy.Integer)
+            ):
+                await raw.execute(
+                    f"SELECT setval(pg_get_serial_sequence('{table.name}', "
+                    f"'id'), (SELECT max(id) FROM {table.name}))"
+                )
+
+    return int(status.rsplit(" ", 1)[-1])
+
+
+class CsvValidator:
+    """A class validating CSV chunks against the table definition."""
+
+    def __init__(self, table: sqlalchemy.Table) -> None:
+        """The initializer of the validator.
+
+        Args:
+            table (sqlalchemy.Table): The target table.
+        """
+
+        self.table = table
+        self.columns: list[str] = []
+        self.rows = 0
+        self._converters: list[Callable[[str], object] | None] = []
+        self._required: list[bool] = []
+
+    async def validate(
+        self,
+        body: AsyncIterable[bytes],
+    ) -> AsyncIterator[bytes]:
+        """The method validating the upload chunk by chunk.
+
+        Chunks are cut at the last record boundary, so only the tail of
+        an unfinished record is kept between them.
+
+        Args:
+            body (AsyncIterable[bytes]): The uploaded CSV.
+
+        Raises:
+            ValueError: If the header or any of the rows is invalid.
+
+        Yields:
+            AsyncIterator[bytes]: The validated chunks.
+        """
+
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        pending = ""
+
+        async for data in _rechunk(body):
+            pending += decoder.decode(data)
+            cut = _record_boundary(pending)
+            if cut:
+                complete, pending = pending[:cut], pending[cut:]
+                self._check(complete)
+                yield complete.encode()
+
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            self._check(pending)
+            yield pending.encode()
+
+    def _check(self, text: str) -> None:
+        """A private method validating complete CSV records.
+
+        Args:
+            text (str): The records.
+
+        Raises:
+            ValueError: If the header or any of the rows is invalid.
+        """
+
+        reader = csv.reader(io.StringIO(text, newline=""), strict=True)
+        try:
+            for row in reader:
+                if not self.columns:
+                    self._header(row)
+                    continue
+
+                self.rows += 1
+                self._row(row)
+        except csv.Error as error:
+            raise ValueError(f"Row {self.rows}: {error}") from error
+
+    def _header(self, row: list[str]) -> None:
+        """A private method reading the column order from the header.
+
+        Args:
+            row (list[str]): The header row.
+
+        Raises:
+            ValueError: If the header does not match the table.
+        """
+
+        unknown = [name for name in row if name not in self.table.c]
+        if unknown or len(set(row)) != len(row):
+            raise ValueError(
+                f"Invalid header, expected columns of {self.table.name}: "
+                f"{', '.join(column.name for column in self.table.columns)}"
+            )
+
+        missing = [
+            column.name
+            for column in self.table.columns
+            if column.name not in row
+            and not column.nullable
+            and column.server_default is None
+            and not column.primary_key
+        ]
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+        self.columns = row
+        columns = [self.table.c[name] for name in row]
+        self._converters = [_converter(column) for column in columns]
+        self._required = [
+            not column.nullable and column.server_default is None
+            for column in columns
+        ]
+
+    def _row(self, row: list[str]) -> None:
+        """A private method validating a single data row.
+
+        Args:
+            row (list[str]): The data row.
+
+        Raises:
+            ValueError: If the row does not match the columns.
+        """
+
+        if len(row) != len(self.columns):
+            raise ValueError(
+                f"Row {self.rows}: expected {len(self.columns)} values, "
+                f"got {len(row)}"
+            )
+
+        for name, value, convert, required in zip(
+            self.columns, row, self._converters, self._required,
+        ):
+            if not value:
+                if required:
+                    raise ValueError(f"Row {self.rows}: {name} is required")
+                continue
+
+            if convert:
+                try:
+                    convert(value)
+                except ValueError as error:
+                    raise ValueError(
+                        f"Row {self.rows}: invalid {name} {value!r}",
+                    ) from error
+
+
+def _converter(column: sqlalchemy.Column) -> Callable[[str], object] | None:
+    """A private function getting the parser matching the column type.
+
+    Args:
+        column (sqlalchemy.Column): The table column.
+
+    Returns:
+        Callable[[str], object] | None: The parser, None for text.
+    """
+
+    if isinstance(column.type, sqlalchemy.Integer):
+        return int
+    if isinstance(column.type, sqlalchemy.Uuid):
+        return uuid.UUID
+
+    return None
+
+
+def _record_boundary(text: str) -> int:
+    """A private function finding the end of the last complete record.
+
+    A newline ends a record only outside of a quoted field, that is when
+    the number of quotes before it is even.
+
+    Args:
+        text (str): The buffered CSV text.
+
+    Returns:
+        int: The length of the complete records, 0 if there are none.
+    """
+
+    cut = text.rfind("\n")
+    while cut != -1 and text.count('"', 0, cut) % 2:
+        cut = text.rfind("\n", 0, cut)
+
+    return cut + 1
+
+
+async def _rechunk(body: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """A private function merging small upload chunks.
+
+    Args:
+        body (AsyncIterable[bytes]): The uploaded chunks.
+
+    Yields:
+        AsyncIterator[bytes]: Chunks of about `IMPORT_CHUNK_SIZE` bytes.
+    """
+
+    buffer = bytearray()
+    async for data in body:
+        buffer += data
+        if len(buffer) >= IMPORT_CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+
+    if buffer:
+        yield bytes(buffer)
+
+
+async def _prepend(
+    first: bytes,
+    rest: AsyncIterator[bytes],
+) -> AsyncIterator[bytes]:
+    """A private function yielding the already consumed first chunk.
+
+    Args:
+        first (bytes): The first chunk.
+        rest (AsyncIterator[bytes]): The remaining chunks.
+
+    Yields:
+        AsyncIterator[bytes]: All chunks.
+    """
+
+    yield first
+    async for chunk in rest:
+        yield chunk
@@ -0,0 +1,187 @@
+"""Module containing the in-memory filter of the registered emails."""
+
+import asyncio
+import contextvars
+import logging
+
+import sqlalchemy
+
+from src.db import database, user_table
+from src.infrastructure.utils.bloom import BloomFilter
+from src.infrastructure.utils.metrics import (
+    EMAIL_FILTER_CHECKS,
+    EMAIL_FILTER_FALSE_POSITIVE_RATE,
+    EMAIL_FILTER_MEMORY,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class EmailFilter:
+    """A class telling the emails that are definitely not registered.
+
+    The Bloom filter is built by streaming `users.email` and updated
+    with every registration, including those of the other workers, which
+    arrive as user invalidations. It is rebuilt periodically, which drops
+    the stale items and resizes it to the grown table, and after missed
+    invalidations. Until it is built every email may be registered.
+    """
+
+    def __init__(
+        self,
+        error_rate: float = 0.01,
+        min_capacity: int = 100000,
+        rebuild_interval: float = 3600.0,
+    ) -> None:
+        """The initializer of the filter.
+
+        Args:
+            error_rate (float, optional): The target false positive rate.
+                Defaults to 0.01.
+            min_capacity (int, optional): The smallest sized capacity.
+                Defaults to 100000.
+            rebuild_interval (float, optional): The seconds between the
+                rebuilds. Defaults to 3600.0.
+        """
+
+        self.error_rate = error_rate
+        self.min_capacity = min_capacity
+        self.rebuild_interval = rebuild_interval
+        self._filter: BloomFilter | None = None
+        self._building: BloomFilter | None = None
+        self._rebuilding: asyncio.Task | None = None
+        self._scheduler: asyncio.Task | None = None
+        self._checks = {
+            result: EMAIL_FILTER_CHECKS.labels(result)
+            for result in ("new", "maybe", "false_positive")
+        }
+        EMAIL_FILTER_FALSE_POSITIVE_RATE.set_function(
+            lambda: self._filter.false_positive_rate if self._filter else 1.0,
+        )
+        EMAIL_FILTER_MEMORY.set_function(
+            lambda: sum(
+                bloom.memory
+                for bloom in (self._filter, self._building)
+                if bloom is not None
+            ),
+        )
+
+    async def start(self) -> None:
+        """The method building the filter and scheduling the rebuilds."""
+
+        self.rebuild()
+        self._scheduler = asyncio.create_task(self._schedule())
+
+    async def stop(self) -> None:
+        """The method stopping the rebuilds."""
+
+        for task in (self._scheduler, self._rebuilding):
+            if task is not None:
+                task.cancel()
+
+    def may_exist(self, email: str) -> bool:
+        """The method checking whether the email may be registered.
+
+        Args:
+            email (str): The email.
+
+        Returns:
+            bool: False if the email is definitely not registered.
+        """
+
+        maybe = self._filter is None or email in self._filter
+        self._checks["maybe" if maybe else "new"].inc()
+
+        return maybe
+
+    def false_positive(self) -> None:
+        """The method recording that a possibly registered email was not."""
+
+        if self._filter is not None:
+            self._checks["false_positive"].inc()
+
+    def add(self, email: str) -> None:
+        """The method adding the registered email.
+
+        Args:
+            email (str): The email.
+        """
+
+        for bloom in (self._filter, self._building):
+            if bloom is not None:
+                bloom.add(email)
+
+    def evict(self, entity: str, keys: list[str] | None) -> None:
+        """The method adding the emails of the changed users.
+
+        The keys of a registration are its email and its id, only the
+        email is added.
+
+        Args:
+            entity (str): The entity name.
+            keys (list[str] | None): The changed keys, None for all.
+        """
+
+        if entity != "user":
+            return
+        if keys is None:
+            self.rebuild()
+            return
+
+        for key in keys:
+            if "@" in key:
+                self.add(key)
+
+    def clear(self) -> None:
+        """The method rebuilding the filter after missed invalidations."""
+
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """The method rebuilding the filter in the background.
+
+        The build runs outside of the request context, so it is not
+        bounded by the deadline of the request triggering it.
+        """
+
+        if self._rebuilding is None or self._rebuilding.done():
+            self._rebuilding = asyncio.get_running_loop().create_task(
+                self._build(),
+                context=contextvars.Context(),
+            )
+
+    async def _schedule(self) -> None:
+        """A private method rebuilding the filter periodically."""
+
+        while True:
+            await asyncio.sleep(self.rebuild_interval)
+            self.rebuild()
+
+    async def _build(self) -> None:
+        """A private method streaming the emails into a new filter.
+
+        Emails registered while streaming are added to both filters, so
+        none is missing once the new one replaces the old one.
+        """
+
+        try:
+            count = await database.fetch_val(
+                sqlalchemy.select(sqlalchemy.func.count())
+                .select_from(user_table),
+            )
+            self._building = BloomFilter(
+                max(self.min_capacity, 2 * (count or 0)),
+                self.error_rate,
+            )
+            async for row in database.iterate(
+                sqlalchemy.select(user_table.c.email),
+            ):
+                if row["email"] is not None:
+                    self._building.add(row["email"])
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Building the email filter failed")
+            self._building = None
+            return
+
+        self._filter, self._building = self._building, None
+        logger.info("Email filter built with %d emails", self._filter.count)
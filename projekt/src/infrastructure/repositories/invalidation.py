@@ -0,0 +1,42 @@
+"""Module containing the publishing of cache invalidations."""
+
+from typing import Iterable
+
+import sqlalchemy
+
+from src.db import database, invalidation_bus
+from src.infrastructure.utils.invalidation import (
+    INVALIDATION_CHANNEL,
+    InvalidationBus,
+)
+
+
+async def publish_invalidation(
+    entity: str,
+    keys: Iterable[object] | None = None,
+) -> None:
+    """A function notifying all workers about the changed entity keys.
+
+    Called in the transaction of the write, the notification is sent
+    when it commits and dropped when it rolls back. The local caches are
+    evicted right away, so the writer reads its own write.
+
+    Args:
+        entity (str): The entity name, e.g. `club`.
+        keys (Iterable[object] | None, optional): The changed keys, None
+            for all entities. Defaults to None.
+    """
+
+    keys = None if keys is None else list(keys)
+    if keys == []:
+        return
+
+    query = sqlalchemy.select(sqlalchemy.func.pg_notify(
+        INVALIDATION_CHANNEL,
+        InvalidationBus.payload(entity, keys),
+    ))
+    await database.execute(query)
+    invalidation_bus.evict(
+        entity,
+        None if keys is None else [str(key) for key in keys],
+    )
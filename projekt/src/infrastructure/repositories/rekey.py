@@ -0,0 +1,79 @@
+"""Module containing the migration of user ids to UUIDv7.
+
+New users get UUIDv7 ids without it. Rekeying existing users is optional
+and logs them out: tokens carry the user id in `sub`, so every token
+issued to a rekeyed user stops resolving and the user has to log in
+again.
+"""
+
+import sqlalchemy
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.db import database, user_table
+from src.infrastructure.repositories.invalidation import publish_invalidation
+from src.infrastructure.utils.uuid7 import uuid7
+
+# The version is the first digit of the third group of the text form.
+_version = sqlalchemy.func.substr(
+    sqlalchemy.cast(user_table.c.id, sqlalchemy.String),
+    15,
+    1,
+)
+
+
+async def count_random_ids() -> int:
+    """A function counting the users which still have random ids.
+
+    Returns:
+        int: The number of users `rekey_users` would rekey.
+    """
+
+    return await database.fetch_val(
+        sqlalchemy.select(sqlalchemy.func.count())
+        .select_from(user_table)
+        .where(_version != "7"),
+    )
+
+
+async def rekey_users(batch_size: int = 1000) -> int:
+    """A function replacing the random ids of the users with UUIDv7 ones.
+
+    The users are rekeyed in batches, each in its own transaction, so the
+    migration can run on a live database and be resumed. Users have no
+    creation time, so the new ids follow the migration order. Tokens
+    issued before carry the old ids in `sub`, so the rekeyed users are
+    logged out.
+
+    Args:
+        batch_size (int, optional): The users rekeyed per transaction.
+            Defaults to 1000.
+
+    Returns:
+        int: The number of rekeyed users.
+    """
+
+    rekeyed = 0
+    while True:
+        async with database.transaction():
+            rows = await database.fetch_all(
+                sqlalchemy.select(user_table.c.id)
+                .where(_version != "7")
+                .limit(batch_size)
+                .with_for_update(skip_locked=True),
+            )
+            if not rows:
+                return rekeyed
+
+            source = sqlalchemy.values(
+                sqlalchemy.column("old", UUID(as_uuid=True)),
+                sqlalchemy.column("new", UUID(as_uuid=True)),
+                name="rekey",
+            ).data([(row["id"], uuid7()) for row in rows])
+            await database.execute(
+                user_table.update()
+                .where(user_table.c.id == source.c.old)
+                .values(id=source.c.new),
+            )
+            await publish_invalidation("user")
+
+        rekeyed += len(rows)
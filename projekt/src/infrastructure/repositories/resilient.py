@@ -0,0 +1,139 @@
+"""Module containing the circuit breaking repository wrapper."""
+
+import asyncio
+import inspect
+from typing import Any, Callable
+
+from src.infrastructure.utils.breaker import (
+    UNAVAILABLE_ERRORS,
+    CircuitBreaker,
+    CircuitOpen,
+    StaleCache,
+)
+from src.infrastructure.utils.requestcontext import (
+    DeadlineExceeded,
+    request_context,
+)
+
+READ_PREFIXES = ("get_", "count_")
+
+
+class ResilientRepository:
+    """A class guarding the repository calls with the circuit breaker.
+
+    Results of the read methods are kept in a bounded stale cache. While
+    the circuit is open, or when the database fails the call, reads are
+    answered from it and the response gets the `Warning` and `Age`
+    headers; without a stale result, and for all writes, the call fails
+    fast with `CircuitOpen`. Other attributes are passed through.
+    """
+
+    def __init__(
+        self,
+        repository: Any,
+        entity: str,
+        breaker: CircuitBreaker,
+        stale: StaleCache,
+    ) -> None:
+        """The initializer of the wrapper.
+
+        Args:
+            repository (Any): The wrapped repository.
+            entity (str): The entity name keying the stale results.
+            breaker (CircuitBreaker): The breaker of the database.
+            stale (StaleCache): The cache of the served reads.
+        """
+
+        self._repository = repository
+        self._entity = entity
+        self._breaker = breaker
+        self._stale = stale
+        self._methods: dict[str, Callable] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._repository, name)
+        if not inspect.iscoroutinefunction(attribute):
+            return attribute
+
+        if name not in self._methods:
+            self._methods[name] = self._guarded(name, attribute)
+
+        return self._methods[name]
+
+    def _guarded(self, name: str, method: Callable) -> Callable:
+        """A private method wrapping the repository coroutine method.
+
+        Args:
+            name (str): The method name.
+            method (Callable): The bound method.
+
+        Returns:
+            Callable: The guarded method.
+        """
+
+        read = name.startswith(READ_PREFIXES)
+
+        async def guarded(*args: Any, **kwargs: Any) -> Any:
+            key = (
+                self._entity, name, repr(args), repr(sorted(kwargs.items())),
+            ) if read else None
+            if not self._breaker.allow():
+                return self._fallback(key)
+
+            try:
+                result = await method(*args, **kwargs)
+            except (asyncio.CancelledError, DeadlineExceeded):
+                self._breaker.release()
+                raise
+            except UNAVAILABLE_ERRORS:
+                self._breaker.failure()
+                if key and (stale := self._stale.get(key)):
+                    return self._served_stale(*stale)
+                raise
+            except Exception:
+                self._breaker.success()
+                raise
+
+            self._breaker.success()
+            if key:
+                self._stale.put(key, result)
+
+            return result
+
+        return guarded
+
+    def _fallback(self, key: tuple | None) -> Any:
+        """A private method answering the call rejected by the breaker.
+
+        Args:
+            key (tuple | None): The key of the read, None for writes.
+
+        Raises:
+            CircuitOpen: If there is no stale result to serve.
+
+        Returns:
+            Any: The stale result.
+        """
+
+        if key is not None and (stale := self._stale.get(key)):
+            return self._served_stale(*stale)
+
+        raise CircuitOpen(self._breaker.name, self._breaker.retry_after())
+
+    @staticmethod
+    def _served_stale(age: float, result: Any) -> Any:
+        """A private method marking the response as stale.
+
+        Args:
+            age (float): The age of the result in seconds.
+            result (Any): The stale result.
+
+        Returns:
+            Any: The result.
+        """
+
+        if context := request_context.get():
+            context.headers["Warning"] = '110 - "Response is Stale"'
+            context.headers["Age"] = str(int(age))
+
+        return result
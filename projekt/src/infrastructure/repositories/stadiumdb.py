@@ -1,43 +1,139 @@
 """Module containing stadium database repository implementation."""
 
-from typing import Any, Iterable
+from typing import Any, AsyncIterable, AsyncIterator, Iterable
 
-from asyncpg import Record  # type: ignore
+import sqlalchemy
 
+from src.core.domain.batch import BatchOperation, BatchResult
+from src.core.domain.changes import ChangeSet
 from src.core.domain.stadium import Stadium, StadiumIn
 from src.core.repositories.istadium import IStadiumRepository
 from src.db import stadium_table, database
+from src.infrastructure.repositories.batch import apply_batch
+from src.infrastructure.repositories.changes import (
+    fetch_changes,
+    record_tombstones,
+)
+from src.infrastructure.repositories.coalesce import InsertCoalescer
+from src.infrastructure.repositories.count import count_rows
+from src.infrastructure.repositories.csvcopy import export_csv, import_csv
+from src.infrastructure.repositories.invalidation import publish_invalidation
+from src.infrastructure.utils.metrics import track_query
+from src.infrastructure.utils.prepared import hot_query
+
+FIELD_COLUMNS = {
+    "id": stadium_table.c.id,
+    "stadiumsName": stadium_table.c.name,
+    "clubName": stadium_table.c["club name"],
+}
+
+STADIUM_BY_ID = hot_query(
+    "stadium_by_id",
+    sqlalchemy.select(
+        *[column.label(field) for field, column in FIELD_COLUMNS.items()],
+    ).where(stadium_table.c.id == sqlalchemy.bindparam("id")),
+)
 
 
 class StadiumRepository(IStadiumRepository):
     """A class implementing the stadium repository."""
 
-    async def get_stadium_by_id(self, stadiumsId: int) -> Any | None:
+    def __init__(self, inserts: InsertCoalescer | None = None) -> None:
+        """The initializer of the repository.
+
+        Args:
+            inserts (InsertCoalescer | None, optional): The coalescer of
+                the concurrent inserts. Defaults to None.
+        """
+
+        self._inserts = inserts
+
+    @track_query
+    async def get_stadium_by_id(
+        self,
+        stadiumsId: int,
+        fields: Iterable[str] | None = None,
+    ) -> Any | None:
         """The method getting a stadium from the data storage.
 
         Args:
             stadiumsID (int): The id of the stadium.
+            fields (Iterable[str] | None, optional): The projected fields.
+                Defaults to None.
 
         Returns:
             Any | None: The stadium data if exists.
         """
 
-        stadium = await self._get_by_id(stadiumsId)
+        if fields:
+            query = (
+                sqlalchemy.select(*self._columns(fields))
+                .where(stadium_table.c.id == stadiumsId)
+            )
+            stadium = await database.fetch_one(query)
+
+            return dict(stadium) if stadium else None
 
-        return Stadium(**dict(stadium)) if stadium else None
+        return await self._get_by_id(stadiumsId)
 
-    async def get_all_stadiums(self) -> Iterable[Any]:
+    @track_query
+    async def get_all_stadiums(
+        self,
+        fields: Iterable[str] | None = None,
+    ) -> Iterable[Any]:
         """The method getting all stadiums from the data storage.
 
+        Args:
+            fields (Iterable[str] | None, optional): The projected fields.
+                Defaults to None.
+
         Returns:
             Iterable[Any]: The collection of the all stadiums.
         """
 
+        if fields:
+            query = (
+                sqlalchemy.select(*self._columns(fields))
+                .order_by(stadium_table.c.name.asc())
+            )
+            stadiums = await database.fetch_all(query)
+
+            return [dict(stadium) for stadium in stadiums]
+
         query = stadium_table.select().order_by(stadium_table.c.name.asc())
         stadiums = await database.fetch_all(query)
 
         return [Stadium(**dict(stadium)) for stadium in stadiums]
 
+    @track_query
+    async def get_changes(self, since: str, limit: int) -> ChangeSet:
+        """The method getting the stadiums changed after the cursor.
+
+        Args:
+            since (str): The cursor of the last synced change.
+            limit (int): The maximum number of changes.
+
+        Returns:
+            ChangeSet: The changed and deleted stadiums and the next cursor.
+        """
+
+        return await fetch_changes(stadium_table, FIELD_COLUMNS, since, limit)
+
+    @track_query
+    async def count_stadiums(self, approximate: bool = False) -> int:
+        """The method counting all stadiums.
+
+        Args:
+            approximate (bool, optional): Whether the planner estimate is
+                sufficient. Defaults to False.
+
+        Returns:
+            int: The number of stadiums.
+        """
+
+        return await count_rows(stadium_table, approximate)
+
+    @track_query
     async def add_stadium(self, data: StadiumIn) -> Any | None:
         """The method adding new stadium to the data storage.
 
@@ -48,12 +144,17 @@ class StadiumRepository(IStadiumRepository):
             Any | None: The newly created stadium.
         """
 
+        if self._inserts is not None:
+            return Stadium(**await self._inserts.insert(data))
+
         query = stadium_table.insert().values(**data.model_dump())
-        new_stadium_id = await database.execute(query)
-        new_stadium = await self._get_by_id(new_stadium_id)
+        async with database.transaction():
+            new_stadium_id = await database.execute(query)
+            await publish_invalidation("stadium", [new_stadium_id])
 
-        return Stadium(**dict(new_stadium)) if new_stadium else None
+        return await self._get_by_id(new_stadium_id)
 
+    @track_query
     async def update_stadium(
         self,
         stadiumsId: int,
@@ -75,14 +176,15 @@ class StadiumRepository(IStadiumRepository):
                 .where(stadium_table.c.id == stadiumsId)
                 .values(**data.model_dump())
             )
-            await database.execute(query)
-
-            stadium = await self._get_by_id(stadiumsId)
+            async with database.transaction():
+                await database.execute(query)
+                await publish_invalidation("stadium", [stadiumsId])
 
-            return Stadium(**dict(stadium)) if stadium else None
+            return await self._get_by_id(stadiumsId)
 
         return None
 
+    @track_query
     async def delete_stadium(self, stadiumsId: int) -> bool:
         """The method updating removing stadium from the data storage.
 
@@ -93,30 +195,113 @@ class StadiumRepository(IStadiumRepository):
             bool: Success of the operation.
         """
 
-        if self._get_by_id(stadiumsId):
-            query = stadium_table \
-                .delete() \
-                .where(stadium_table.c.id == stadiumsId)
-            await database.execute(query)
+        query = (
+            stadium_table.delete()
+            .where(stadium_table.c.id == stadiumsId)
+            .returning(stadium_table.c.id)
+        )
+        async with database.transaction():
+            deleted = await database.fetch_all(query)
+            await record_tombstones(
+                stadium_table,
+                [row["id"] for row in deleted],
+            )
+            await publish_invalidation(
+                "stadium",
+                [row["id"] for row in deleted],
+            )
+
+        return bool(deleted)
+
+    @track_query
+    async def apply_batch(
+        self,
+        operations: list[BatchOperation[StadiumIn]],
+    ) -> list[BatchResult]:
+        """The method applying the batch of mutations in one transaction.
+
+        Args:
+            operations (list[BatchOperation[StadiumIn]]): The operations.
+
+        Raises:
+            ValueError: If an id is targeted by more than one operation.
+
+        Returns:
+            list[BatchResult]: The per-item results.
+        """
+
+        async with database.transaction():
+            results = await apply_batch(
+                stadium_table,
+                FIELD_COLUMNS,
+                operations,
+            )
+            await publish_invalidation(
+                "stadium",
+                [result.id for result in results if result.status != 404],
+            )
+
+        return results
 
-            return True
+    def export_csv(self) -> AsyncIterator[bytes]:
+        """The method streaming all stadiums with `COPY ... TO STDOUT`.
 
-        return False
+        Returns:
+            AsyncIterator[bytes]: The CSV chunks.
+        """
+
+        return export_csv(stadium_table)
 
-    async def _get_by_id(self, stadiumsId: int) -> Record | None:
+    @track_query
+    async def import_csv(self, body: AsyncIterable[bytes]) -> int:
+        """The method loading stadiums with `COPY ... FROM STDIN`.
+
+        Args:
+            body (AsyncIterable[bytes]): The CSV upload.
+
+        Raises:
+            ValueError: If the CSV does not match the table.
+
+        Returns:
+            int: The number of imported stadiums.
+        """
+
+        rows = await import_csv(stadium_table, body)
+        await publish_invalidation("stadium")
+
+        return rows
+
+    async def _get_by_id(self, stadiumsId: int) -> Stadium | None:
         """A private method getting stadium from the DB based on its ID.
 
+        It runs the prepared statement of the hot query.
+
         Args:
             stadiumsId (int): The ID of the stadium.
 
         Returns:
-            Any | None: Stadium record if exists.
+            Stadium | None: The stadium if exists.
         """
 
-        query = (
-            stadium_table.select()
-            .where(stadium_table.c.id == stadiumsId)
-            .order_by(stadium_table.c.name.asc())
-        )
+        stadium = await database.fetch_prepared(STADIUM_BY_ID, stadiumsId)
+
+        return Stadium.model_validate(stadium) if stadium else None
+
+    @staticmethod
+    def _columns(fields: Iterable[str]) -> list:
+        """A private method mapping model fields to labelled columns.
+
+        Args:
+            fields (Iterable[str]): The projected fields.
+
+        Raises:
+            ValueError: If any of the fields is not stored in the table.
+
+        Returns:
+            list: The columns labelled with the model field names.
+        """
 
-        return await database.fetch_one(query)
\ No newline at end of file
+        try:
+            return [FIELD_COLUMNS[field].label(field) for field in fields]
+        except KeyError as error:
+            raise ValueError(f"Field {error} cannot be projected") from error
\ No newline at end of file
@@ -2,21 +2,51 @@
 
 
 from typing import Any
-
-from pydantic import UUID5
-
-from src.infrastructure.utils.password import hash_password
-from src.core.domain.user import UserIn
+from uuid import UUID
+
+import sqlalchemy
+from asyncpg import UniqueViolationError  # type: ignore
+
+from src.infrastructure.repositories.emailfilter import EmailFilter
+from src.infrastructure.repositories.invalidation import publish_invalidation
+from src.infrastructure.utils.metrics import track_query
+from src.infrastructure.utils.password import hash_password_async
+from src.infrastructure.utils.prepared import hot_query
+from src.infrastructure.utils.uuid7 import uuid7
+from src.core.domain.user import User, UserIn
 from src.core.repositories.iuser import IUserRepository
 from src.db import database, user_table
 
+USER_BY_EMAIL = hot_query(
+    "user_by_email",
+    sqlalchemy.select(
+        user_table.c.id,
+        user_table.c.email,
+        user_table.c.password,
+    ).where(user_table.c.email == sqlalchemy.bindparam("email")),
+)
+
 
 class UserRepository(IUserRepository):
     """An implementation of repository class for user."""
 
+    def __init__(self, emails: EmailFilter | None = None) -> None:
+        """The initializer of the repository.
+
+        Args:
+            emails (EmailFilter | None, optional): The filter of the
+                registered emails. Defaults to None.
+        """
+
+        self._emails = emails
+
+    @track_query
     async def register_user(self, user: UserIn) -> Any | None:
         """A method registering new user.
 
+        Emails the filter reports as definitely new skip the lookup; the
+        unique index still rejects an email registered concurrently.
+
         Args:
             user (UserIn): The user input data.
 
@@ -24,21 +54,37 @@ class UserRepository(IUserRepository):
             Any | None: The new user object.
         """
 
-        if await self.get_by_email(user.email):
+        if self._emails is None or self._emails.may_exist(user.email):
+            if await self.get_by_email(user.email):
+                return None
+            if self._emails is not None:
+                self._emails.false_positive()
+
+        user.password = await hash_password_async(user.password)
+
+        new_user_uuid = uuid7()
+        query = user_table.insert().values(
+            id=new_user_uuid,
+            **user.model_dump(),
+        )
+        try:
+            async with database.transaction():
+                await database.execute(query)
+                await publish_invalidation(
+                    "user",
+                    [user.email, new_user_uuid],
+                )
+        except UniqueViolationError:
             return None
 
-        user.password = hash_password(user.password)
-
-        query = user_table.insert().values(**user.model_dump())
-        new_user_uuid = await database.execute(query)
-
         return await self.get_by_uuid(new_user_uuid)
 
-    async def get_by_uuid(self, uuid: UUID5) -> Any | None:
+    @track_query
+    async def get_by_uuid(self, uuid: UUID) -> Any | None:
         """A method getting user by UUID.
 
         Args:
-            uuid (UUID5): UUID of the user.
+            uuid (UUID): UUID of the user.
 
         Returns:
             Any | None: The user object if exists.
@@ -51,19 +97,19 @@ class UserRepository(IUserRepository):
 
         return user
 
-    async def get_by_email(self, email: str) -> Any | None:
+    @track_query
+    async def get_by_email(self, email: str) -> User | None:
         """A method getting user by email.
 
+        It runs the prepared statement of the hot query.
+
         Args:
             email (str): The email of the user.
 
         Returns:
-            Any | None: The user object if exists.
+            User | None: The user object if exists.
         """
 
-        query = user_table \
-            .select() \
-            .where(user_table.c.email == email)
-        user = await database.fetch_one(query)
+        user = await database.fetch_prepared(USER_BY_EMAIL, email)
 
-        return user
\ No newline at end of file
+        return User.model_validate(user) if user else None
\ No newline at end of file
@@ -1,7 +1,9 @@
 """Module containing country service implementation."""
 
-from typing import Iterable
+from typing import AsyncIterable, AsyncIterator, Iterable
 
+from src.core.domain.batch import BatchOperation, BatchResult
+from src.core.domain.changes import ChangeSet
 from src.core.domain.club import Club, ClubIn
 from src.core.repositories.iclub import IClubRepository
 from src.infrastructure.services.iclub import IClubService
@@ -21,44 +23,41 @@ class ClubService(IClubService):
 
         self._repository = repository
 
-    async def get_club_by_id(self, clubId: int) -> Club | None:
+    async def get_club_by_id(
+            self,
+            clubId: int,
+            fields: Iterable[str] | None = None,
+    ) -> Club | dict | None:
         """The abstract getting a club from the repository.
 
         Args:
             clubId (int): The id of the club.
+            fields (Iterable[str] | None, optional): The projected fields.
+                Defaults to None.
 
         Returns:
-            Club | None: The club data if exists.
+            Club | dict | None: The club data if exists.
         """
 
-        return await self._repository.get_club_by_id(clubId)
-
-    async def get_all_countries(self) -> Iterable[Club]:
-        """The abstract getting all clubs from the repository.
+        return await self._repository.get_club_by_id(clubId, fields)
 
-        Returns:
-            Iterable[Club]: The collection of the all club.
-        """
-
-        return await self._repository.get_all_clubs()
-
-    async def get_countries_by_stadium(
+    async def get_all_clubs(
             self,
-            StadiumId: int,
-    ) -> Iterable[Club]:
-        """The abstract getting all provided stadium's club
-            from the repository.
+            fields: Iterable[str] | None = None,
+    ) -> Iterable[Club | dict]:
+        """The abstract getting all clubs from the repository.
 
         Args:
-            stadiumId (int): The id of the stadium.
+            fields (Iterable[str] | None, optional): The projected fields.
+                Defaults to None.
 
         Returns:
-            Iterable[Stadium]: The collection of the countries.
+            Iterable[Club | dict]: The collection of the all club.
         """
 
-        return await self._repository.get_countries_by_stadium(StadiumId)
+        return await self._repository.get_all_clubs(fields)
 
-    async def add_country(self, data: ClubIn) -> Club | None:
+    async def add_club(self, data: ClubIn) -> Club | None:
         """The abstract adding new club to the repository.
 
         Args:
@@ -90,7 +89,7 @@ class ClubService(IClubService):
             data=data,
         )
 
-    async def delete_country(self, clubId: int) -> bool:
+    async def delete_club(self, clubId: int) -> bool:
         """The abstract updating removing club from the repository.
 
         Args:
@@ -101,3 +100,65 @@ class ClubService(IClubService):
         """
 
         return await self._repository.delete_club(clubId)
+
+    async def apply_batch(
+        self,
+        operations: list[BatchOperation[ClubIn]],
+    ) -> list[BatchResult]:
+        """The method applying the batch of mutations in one transaction.
+
+        Args:
+            operations (list[BatchOperation[ClubIn]]): The operations.
+
+        Returns:
+            list[BatchResult]: The per-item results.
+        """
+
+        return await self._repository.apply_batch(operations)
+
+    def export_csv(self) -> AsyncIterator[bytes]:
+        """The method streaming all clubs as CSV.
+
+        Returns:
+            AsyncIterator[bytes]: The CSV chunks.
+        """
+
+        return self._repository.export_csv()
+
+    async def import_csv(self, body: AsyncIterable[bytes]) -> int:
+        """The method loading clubs from the streamed CSV.
+
+        Args:
+            body (AsyncIterable[bytes]): The CSV upload.
+
+        Returns:
+            int: The number of imported clubs.
+        """
+
+        return await self._repository.import_csv(body)
+
+    async def get_changes(self, since: str, limit: int) -> ChangeSet:
+        """The method getting the clubs changed after the cursor.
+
+        Args:
+            since (str): The cursor of the last synced change.
+            limit (int): The maximum number of changes.
+
+        Returns:
+            ChangeSet: The changed and deleted clubs and the next cursor.
+        """
+
+        return await self._repository.get_changes(since, limit)
+
+    async def count_clubs(self, approximate: bool = False) -> int:
+        """The method counting all clubs.
+
+        Args:
+            approximate (bool, optional): Whether an estimate is
+                sufficient. Defaults to False.
+
+        Returns:
+            int: The number of clubs.
+        """
+
+        return await self._repository.count_clubs(approximate)
@@ -1,9 +1,11 @@
 """Module containing airport service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import AsyncIterable, AsyncIterator, Iterable
 
-from src.core.domain.stadium import Stadium, StadiumBroker
+from src.core.domain.batch import BatchOperation, BatchResult
+from src.core.domain.changes import ChangeSet
+from src.core.domain.stadium import Stadium, StadiumIn
 from src.infrastructure.dto.stadiumdto import StadiumDTO
 
 
@@ -11,11 +13,35 @@ class IStadiumService(ABC):
     """A class representing stadium repository."""
 
     @abstractmethod
-    async def get_all(self) -> Iterable[StadiumDTO]:
+    async def get_all_stadiums(
+        self,
+        fields: Iterable[str] | None = None,
+    ) -> Iterable[Stadium | dict]:
         """The method getting all stadiums from the repository.
 
+        Args:
+            fields (Iterable[str] | None, optional): The projected fields.
+                Defaults to None.
+
+        Returns:
+            Iterable[Stadium | dict]: All stadiums.
+        """
+
+    @abstractmethod
+    async def get_stadium_by_id(
+        self,
+        stadiumsId: int,
+        fields: Iterable[str] | None = None,
+    ) -> Stadium | dict | None:
+        """The method getting stadium by provided id.
+
+        Args:
+            stadiumsId (int): The id of the stadium.
+            fields (Iterable[str] | None, optional): The projected fields.
+                Defaults to None.
+
         Returns:
-            Iterable[StadiumDTO]: All stadiums.
+            Stadium | dict | None: The stadium details.
         """
 
     @abstractmethod
@@ -76,11 +102,11 @@ class IStadiumService(ABC):
 
 
     @abstractmethod
-    async def add_stadium(self, data: StadiumBroker) -> Stadium | None:
+    async def add_stadium(self, data: StadiumIn) -> Stadium | None:
         """The method adding new stadium to the data storage.
 
         Args:
-            data (StadiumBroker): The details of the new stadium.
+            data (StadiumIn): The details of the new stadium.
 
         Returns:
             Stadium | None: Full details of the newly added airport.
@@ -90,13 +116,13 @@ class IStadiumService(ABC):
     async def update_stadium(
         self,
         stadiumsId: int,
-        data: StadiumBroker,
+        data: StadiumIn,
     ) -> Stadium | None:
         """The method updating stadium data in the data storage.
 
         Args:
             stadiumID (int): The id of the stadium.
-            data (StadiumBroker): The details of the updated stadium.
+            data (StadiumIn): The details of the updated stadium.
 
         Returns:
             Stadium | None: The updated stadium details.
@@ -111,4 +137,61 @@ class IStadiumService(ABC):
 
         Returns:
             bool: Success of the operation.
-        """
\ No newline at end of file
+        """
+
+    @abstractmethod
+    async def apply_batch(
+        self,
+        operations: list[BatchOperation[StadiumIn]],
+    ) -> list[BatchResult]:
+        """The abstract applying the batch of mutations in one transaction.
+
+        Args:
+            operations (list[BatchOperation[StadiumIn]]): The operations.
+
+        Returns:
+            list[BatchResult]: The per-item results.
+        """
+
+    @abstractmethod
+    def export_csv(self) -> AsyncIterator[bytes]:
+        """The abstract streaming all stadiums as CSV.
+
+        Returns:
+            AsyncIterator[bytes]: The CSV chunks.
+        """
+
+    @abstractmethod
+    async def import_csv(self, body: AsyncIterable[bytes]) -> int:
+        """The abstract loading stadiums from the streamed CSV.
+
+        Args:
+            body (AsyncIterable[bytes]): The CSV upload.
+
+        Returns:
+            int: The number of imported stadiums.
+        """
+
+    @abstractmethod
+    async def get_changes(self, since: str, limit: int) -> ChangeSet:
+        """The abstract getting the stadiums changed after the cursor.
+
+        Args:
+            since (str): The cursor of the last synced change.
+            limit (int): The maximum number of changes.
+
+        Returns:
+            ChangeSet: The changed and deleted stadiums and the next cursor.
+        """
+
+    @abstractmethod
+    async def count_stadiums(self, approximate: bool = False) -> int:
+        """The abstract counting all stadiums.
+
+        Args:
+            approximate (bool, optional): Whether an estimate is
+                sufficient. Defaults to False.
+
+        Returns:
+            int: The number of stadiums.
+        """
@@ -1,8 +1,7 @@
 """A module containing user service."""
 
 from abc import ABC, abstractmethod
-
-from pydantic import UUID5
+from uuid import UUID
 
 from src.core.domain.user import UserIn
 from src.infrastructure.dto.userdto import UserDTO
@@ -35,11 +34,11 @@ class IUserService(ABC):
         """
 
     @abstractmethod
-    async def get_by_uuid(self, uuid: UUID5) -> UserDTO | None:
+    async def get_by_uuid(self, uuid: UUID) -> UserDTO | None:
         """A method getting user by UUID.
 
         Args:
-            uuid (UUID5): The UUID of the user.
+            uuid (UUID): The UUID of the user.
 
         Returns:
             UserDTO | None: The user data, if found.
@@ -1,8 +1,10 @@
 """Module containing continent service implementation."""
 
-from typing import Iterable
+from typing import AsyncIterable, AsyncIterator, Iterable
 
-from src.core.domain.stadium import Stadium, StadiumBroker
+from src.core.domain.batch import BatchOperation, BatchResult
+from src.core.domain.changes import ChangeSet
+from src.core.domain.stadium import Stadium, StadiumIn
 from src.core.repositories.istadium import IStadiumRepository
 from src.infrastructure.dto.stadiumdto import StadiumDTO
 from src.infrastructure.services.istadium import IStadiumService
@@ -22,14 +24,21 @@ class StadiumService(IStadiumService):
 
         self._repository = repository
 
-    async def get_all(self) -> Iterable[StadiumDTO]:
+    async def get_all_stadiums(
+            self,
+            fields: Iterable[str] | None = None,
+    ) -> Iterable[Stadium | dict]:
         """The method getting all stadiums from the repository.
 
+        Args:
+            fields (Iterable[str] | None, optional): The projected fields.
+                Defaults to None.
+
         Returns:
-            Iterable[StadiumDTO]: All stadiums.
+            Iterable[Stadium | dict]: All stadiums.
         """
 
-        return await self._repository.get_all_stadiums()
+        return await self._repository.get_all_stadiums(fields)
 
     async def get_by_amountOfSeats(self, amountOfSeats: int) -> Iterable[Stadium]:
         """The method getting stadiums assigned to particular amount of seats.
@@ -39,17 +48,23 @@ class StadiumService(IStadiumService):
 
         return await self._repository.get_by_amountOfSeats(amountOfSeats)
 
-    async def get_by_id(self, stadiumId: int) -> StadiumDTO | None:
+    async def get_stadium_by_id(
+            self,
+            stadiumsId: int,
+            fields: Iterable[str] | None = None,
+    ) -> Stadium | dict | None:
         """The method getting stadium by provided id.
 
         Args:
-            stadiumId (int): The id of the stadium.
+            stadiumsId (int): The id of the stadium.
+            fields (Iterable[str] | None, optional): The projected fields.
+                Defaults to None.
 
         Returns:
-            StadiumDTO | None: The stadium details.
+            Stadium | dict | None: The stadium details.
         """
 
-        return await self._repository.get_by_id(stadiumId)
+        return await self._repository.get_stadium_by_id(stadiumsId, fields)
 
     async def get_by_clubName(self, clubName: str) -> StadiumDTO | None:
         """The method getting stadium by provided name of club.
@@ -63,8 +78,11 @@ class StadiumService(IStadiumService):
 
         return await self._repository.get_by_clubName(clubName)
 
-    async def get_by_iata(self, stadiumName: str) -> StadiumDTO | None:
-        """The method getting stadiumairport by provided name.
+    async def get_by_stadiumName(
+            self,
+            stadiumName: str,
+    ) -> StadiumDTO | None:
+        """The method getting stadium by provided name.
 
         Args:
             stadiumName (str): The name of stadium.
@@ -87,31 +105,31 @@ class StadiumService(IStadiumService):
 
         return await self._repository.get_by_user(user_id)
 
-    async def add_airport(self, data: StadiumBroker) -> Stadium | None:
-        """The method adding new airport to the data storage.
+    async def add_stadium(self, data: StadiumIn) -> Stadium | None:
+        """The method adding new stadium to the data storage.
 
         Args:
-            data (AirportBroker): The details of the new airport.
+            data (StadiumIn): The details of the new stadium.
 
         Returns:
-            Airport | None: Full details of the newly added airport.
+            Stadium | None: Full details of the newly added stadium.
         """
 
         return await self._repository.add_stadium(data)
 
     async def update_stadium(
             self,
-            airport_id: int,
-            data: StadiumBroker,
+            stadiumsId: int,
+            data: StadiumIn,
     ) -> Stadium | None:
-        """The method updating airport data in the data storage.
+        """The method updating stadium data in the data storage.
 
         Args:
-            airport_id (int): The id of the airport.
-            data (AirportBroker): The details of the updated airport.
+            stadiumsId (int): The id of the stadium.
+            data (StadiumIn): The details of the updated stadium.
 
         Returns:
-            Airport | None: The updated airport details.
+            Stadium | None: The updated stadium details.
         """
 
         return await self._repository.update_stadium(
@@ -119,14 +137,76 @@ class StadiumService(IStadiumService):
             data=data,
         )
 
-    async def delete_airport(self, stadiumsId: int) -> bool:
-        """The method updating removing airport from the data storage.
+    async def delete_stadium(self, stadiumsId: int) -> bool:
+        """The method removing stadium from the data storage.
 
         Args:
-            airport_id (int): The id of the airport.
+            stadiumsId (int): The id of the stadium.
 
         Returns:
             bool: Success of the operation.
         """
 
-        return await self._repository.delete_stadiums(stadiumsId)
+        return await self._repository.delete_stadium(stadiumsId)
+
+    async def apply_batch(
+        self,
+        operations: list[BatchOperation[StadiumIn]],
+    ) -> list[BatchResult]:
+        """The method applying the batch of mutations in one transaction.
+
+        Args:
+            operations (list[BatchOperation[StadiumIn]]): The operations.
+
+        Returns:
+            list[BatchResult]: The per-item results.
+        """
+
+        return await self._repository.apply_batch(operations)
+
+    def export_csv(self) -> AsyncIterator[bytes]:
+        """The method streaming all stadiums as CSV.
+
+        Returns:
+            AsyncIterator[bytes]: The CSV chunks.
+        """
+
+        return self._repository.export_csv()
+
+    async def import_csv(self, body: AsyncIterable[bytes]) -> int:
+        """The method loading stadiums from the streamed CSV.
+
+        Args:
+            body (AsyncIterable[bytes]): The CSV upload.
+
+        Returns:
+            int: The number of imported stadiums.
+        """
+
+        return await self._repository.import_csv(body)
+
+    async def get_changes(self, since: str, limit: int) -> ChangeSet:
+        """The method getting the stadiums changed after the cursor.
+
+        Args:
+            since (str): The cursor of the last synced change.
+            limit (int): The maximum number of changes.
+
+        Returns:
+            ChangeSet: The changed and deleted stadiums and the next cursor.
+        """
+
+        return await self._repository.get_changes(since, limit)
+
+    async def count_stadiums(self, approximate: bool = False) -> int:
+        """The method counting all stadiums.
+
+        Args:
+            approximate (bool, optional): Whether an estimate is
+                sufficient. Defaults to False.
+
+        Returns:
+            int: The number of stadiums.
+        """
+
+        return await self._repository.count_stadiums(approximate)
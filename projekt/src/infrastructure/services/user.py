@@ -1,15 +1,18 @@
 """A module containing user service."""
 
-from pydantic import UUID4
+import logging
+from uuid import UUID
 
 from src.core.domain.user import UserIn
 from src.core.repositories.iuser import IUserRepository
 from src.infrastructure.dto.userdto import UserDTO
 from src.infrastructure.dto.tokendto import TokenDTO
 from src.infrastructure.services.iuser import IUserService
-from src.infrastructure.utils.password import verify_password
+from src.infrastructure.utils.password import verify_password_async
 from src.infrastructure.utils.token import generate_user_token
 
+logger = logging.getLogger(__name__)
+
 
 class UserService(IUserService):
     """An abstract class for user service."""
@@ -42,7 +45,11 @@ class UserService(IUserService):
         """
 
         if user_data := await self._repository.get_by_email(user.email):
-            if verify_password(user.password, user_data.password):
+            if await verify_password_async(
+                user.password,
+                user_data.password,
+            ):
+                logger.debug("User %s authenticated", user_data.id)
                 token_details = generate_user_token(user_data.id)
                 # trunk-ignore(bandit/B106)
                 return TokenDTO(token_type="Bearer", **token_details)
@@ -51,11 +58,11 @@ class UserService(IUserService):
 
         return None
 
-    async def get_by_uuid(self, uuid: UUID4) -> UserDTO | None:
+    async def get_by_uuid(self, uuid: UUID) -> UserDTO | None:
         """A method getting user by UUID.
 
         Args:
-            uuid (UUID5): The UUID of the user.
+            uuid (UUID): The UUID of the user.
 
         Returns:
             UserDTO | None: The user data, if found.
@@ -0,0 +1,87 @@
+"""A module containing the Bloom filter."""
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """A class representing a set answering "definitely not" or "maybe".
+
+    It is sized for `capacity` items at the `error_rate` false positive
+    rate; beyond it the rate grows. Items are strings, hashed once with
+    BLAKE2b and placed by double hashing.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        """The initializer of the filter.
+
+        Args:
+            capacity (int): The expected number of items.
+            error_rate (float, optional): The false positive rate at the
+                capacity. Defaults to 0.01.
+        """
+
+        capacity = max(1, capacity)
+        self.size = max(8, math.ceil(
+            -capacity * math.log(error_rate) / math.log(2) ** 2,
+        ))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def add(self, item: str) -> None:
+        """The method adding the item.
+
+        Args:
+            item (str): The item.
+        """
+
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & 1 << (position & 7)
+            for position in self._positions(item)
+        )
+
+    @property
+    def memory(self) -> int:
+        """The property getting the size of the bit array.
+
+        Returns:
+            int: The number of bytes.
+        """
+
+        return len(self._bits)
+
+    @property
+    def false_positive_rate(self) -> float:
+        """The property estimating the current false positive rate.
+
+        Returns:
+            float: The probability that a new item is reported as added.
+        """
+
+        return (1 - math.exp(-self.hashes * self.count / self.size)) \
+            ** self.hashes
+
+    def _positions(self, item: str) -> list[int]:
+        """A private method computing the bit positions of the item.
+
+        Args:
+            item (str): The item.
+
+        Returns:
+            list[int]: The positions.
+        """
+
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+
+        return [
+            (first + index * second) % self.size
+            for index in range(self.hashes)
+        ]
@@ -0,0 +1,239 @@
+"""A module containing the circuit breaker of the database calls."""
+
+import logging
+from collections import OrderedDict
+from time import monotonic
+from typing import Any
+
+import asyncpg  # type: ignore
+
+from src.infrastructure.utils.metrics import (
+    CIRCUIT_BREAKER_CALLS,
+    CIRCUIT_BREAKER_STATE,
+)
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+STATES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+# Errors showing that the database cannot be reached, as opposed to
+# errors of a single query.
+UNAVAILABLE_ERRORS = (
+    OSError,
+    asyncpg.PostgresConnectionError,
+    asyncpg.InterfaceError,
+    asyncpg.CannotConnectNowError,
+    asyncpg.TooManyConnectionsError,
+)
+
+
+class CircuitOpen(Exception):
+    """An exception raised when a call is rejected by the open circuit."""
+
+    def __init__(self, name: str, retry_after: float) -> None:
+        """The initializer of the exception.
+
+        Args:
+            name (str): The name of the breaker.
+            retry_after (float): The seconds until the next probe.
+        """
+
+        super().__init__(f"The {name} circuit is open")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """A class tracking the availability of a dependency.
+
+    The circuit opens after `failure_threshold` consecutive failures and
+    rejects calls for `reset_timeout` seconds. Then a single call is let
+    through as a probe: its success closes the circuit, its failure opens
+    it for another `reset_timeout`, so probes run at most once per
+    timeout regardless of the traffic.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 5.0,
+    ) -> None:
+        """The initializer of the breaker.
+
+        Args:
+            name (str): The name of the dependency.
+            failure_threshold (int, optional): The consecutive failures
+                opening the circuit. Defaults to 5.
+            reset_timeout (float, optional): The seconds between probes.
+                Defaults to 5.0.
+        """
+
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._state_gauge = CIRCUIT_BREAKER_STATE.labels(name)
+        self._calls = {
+            result: CIRCUIT_BREAKER_CALLS.labels(name, result)
+            for result in ("success", "failure", "rejected")
+        }
+
+    def allow(self) -> bool:
+        """The method deciding whether the call may proceed.
+
+        Returns:
+            bool: True if the circuit is closed or the call is the probe.
+        """
+
+        if self.state == CLOSED:
+            return True
+
+        if (
+            self.state == OPEN
+            and monotonic() - self.opened_at >= self.reset_timeout
+        ):
+            self._set_state(HALF_OPEN)
+            return True
+
+        self._calls["rejected"].inc()
+
+        return False
+
+    def success(self) -> None:
+        """The method recording the successful call."""
+
+        self._calls["success"].inc()
+        self.failures = 0
+        if self.state != CLOSED:
+            self._set_state(CLOSED)
+
+    def failure(self) -> None:
+        """The method recording the call failed by the dependency."""
+
+        self._calls["failure"].inc()
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.opened_at = monotonic()
+            self._set_state(OPEN)
+
+    def release(self) -> None:
+        """The method ending the call without an outcome.
+
+        An unfinished probe, e.g. a cancelled one, makes room for the
+        next probe.
+        """
+
+        if self.state == HALF_OPEN:
+            self._set_state(OPEN)
+
+    def retry_after(self) -> float:
+        """The method getting the time until the next probe.
+
+        Returns:
+            float: The number of seconds.
+        """
+
+        return max(0.0, self.opened_at + self.reset_timeout - monotonic())
+
+    def _set_state(self, state: str) -> None:
+        """A private method switching the state.
+
+        Args:
+            state (str): The new state.
+        """
+
+        if state != self.state:
+            logger.warning(
+                "The %s circuit is %s",
+                self.name,
+                state.replace("_", "-"),
+            )
+        self.state = state
+        self._state_gauge.set(STATES[state])
+
+
+class StaleCache:
+    """A class keeping the last results to serve during an outage.
+
+    The cache holds at most `max_entries` results, and results older
+    than `max_age` are never served. Keys start with the entity name, so
+    the entries of a changed entity can be invalidated.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_age: float = 300.0,
+    ) -> None:
+        """The initializer of the cache.
+
+        Args:
+            max_entries (int, optional): The number of kept results.
+                Defaults to 1024.
+            max_age (float, optional): The longest age of a served result
+                in seconds. Defaults to 300.0.
+        """
+
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = \
+            OrderedDict()
+
+    def put(self, key: tuple, value: Any) -> None:
+        """The method storing the fresh result.
+
+        Args:
+            key (tuple): The call key.
+            value (Any): The result.
+        """
+
+        self._entries[key] = (monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: tuple) -> tuple[float, Any] | None:
+        """The method getting the result if not too old.
+
+        Args:
+            key (tuple): The call key.
+
+        Returns:
+            tuple[float, Any] | None: The age in seconds and the result.
+        """
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        age = monotonic() - entry[0]
+        if age > self.max_age:
+            del self._entries[key]
+            return None
+
+        return age, entry[1]
+
+    def evict(self, entity: str, keys: list[str] | None) -> None:
+        """The method evicting the results of the changed entity.
+
+        Listings may contain any of the keys, so all results of the
+        entity are evicted.
+
+        Args:
+            entity (str): The entity name.
+            keys (list[str] | None): The changed keys.
+        """
+
+        for key in [key for key in self._entries if key[0] == entity]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """The method evicting all results."""
+
+        self._entries.clear()
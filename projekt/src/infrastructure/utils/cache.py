@@ -0,0 +1,450 @@
+"""A module containing the two-tier cache of serialized reads.
+
+The in-process L1 answers repeated reads of a worker without any I/O,
+and the shared L2 lets a worker that starts cold reuse what the others
+already loaded, so the database sees a cold start once instead of once
+per worker. Values are stored as bytes in both tiers.
+
+Every entry carries its expiry and the time its load took. Reads refresh
+an entry early with a probability growing towards its expiry (XFetch),
+so a popular key is reloaded by one request ahead of time instead of
+by all requests at once when it expires. TTLs are jittered, so entries
+loaded together do not expire together. Concurrent loads of the same key
+in a worker share one call.
+
+Keys are namespaced by entity and generation. Invalidating an entity
+drops its L1 entries and increments its generation in L2, which makes
+all of its L2 entries unreachable to every worker at once.
+"""
+
+import asyncio
+import logging
+import math
+import random
+import struct
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic, time
+from typing import Awaitable, Callable, Protocol
+
+from src.infrastructure.utils.metrics import CACHE_REQUESTS
+from src.infrastructure.utils.resp import RespError
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct("!dd")
+
+# Errors of the shared cache, which are treated as misses.
+SHARED_CACHE_ERRORS = (OSError, RespError, struct.error, ValueError)
+
+
+class SharedCache(Protocol):
+    """A protocol of the shared L2 backends."""
+
+    async def get(self, key: str) -> bytes | None:
+        """The method getting the value of the key."""
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """The method setting the value of the key with the TTL."""
+
+    async def incr(self, key: str) -> int:
+        """The method incrementing the counter of the key."""
+
+    async def close(self) -> None:
+        """The method closing the connection."""
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A class representing the cached value."""
+
+    payload: bytes
+    expiry: float
+    delta: float
+
+    def to_bytes(self) -> bytes:
+        """The method encoding the entry for the shared cache.
+
+        Returns:
+            bytes: The expiry and load time followed by the payload.
+        """
+
+        return _HEADER.pack(self.expiry, self.delta) + self.payload
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CacheEntry":
+        """The method decoding the entry read from the shared cache.
+
+        Args:
+            data (bytes): The encoded entry.
+
+        Returns:
+            CacheEntry: The entry.
+        """
+
+        expiry, delta = _HEADER.unpack_from(data)
+
+        return cls(data[_HEADER.size:], expiry, delta)
+
+    def fresh(self, beta: float) -> bool:
+        """The method deciding whether the entry is served (XFetch).
+
+        Args:
+            beta (float): The eagerness of the early refresh, 0 disables
+                it.
+
+        Returns:
+            bool: False once expired, or when picked for early refresh.
+        """
+
+        draw = 1.0 - random.random()  # nosec B311
+        jump = -self.delta * beta * math.log(draw)
+
+        return time() + jump < self.expiry
+
+
+class LocalCache:
+    """A class representing the in-process LRU cache."""
+
+    def __init__(self, max_entries: int = 10000) -> None:
+        """The initializer of the cache.
+
+        Args:
+            max_entries (int, optional): The number of kept entries.
+                Defaults to 10000.
+        """
+
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    def get(self, key: str) -> CacheEntry | None:
+        """The method getting the entry.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            CacheEntry | None: The entry if cached.
+        """
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+
+        return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        """The method storing the entry.
+
+        Args:
+            key (str): The key.
+            entry (CacheEntry): The entry.
+        """
+
+        if self.max_entries <= 0:
+            return
+
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def evict_prefix(self, prefix: str) -> None:
+        """The method evicting the entries of the key prefix.
+
+        Args:
+            prefix (str): The key prefix.
+        """
+
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """The method evicting all entries."""
+
+        self._entries.clear()
+
+
+class TieredCache:
+    """A class combining the local L1 with an optional shared L2.
+
+    Failures of the shared cache are treated as misses, so it can go
+    away without failing any request.
+    """
+
+    def __init__(
+        self,
+        local: LocalCache,
+        shared: SharedCache | None = None,
+        ttl: float = 60.0,
+        jitter: float = 0.1,
+        beta: float = 1.0,
+        namespace: str = "projekt",
+        settle: float = 0.0,
+    ) -> None:
+        """The initializer of the cache.
+
+        Args:
+            local (LocalCache): The L1 cache.
+            shared (SharedCache | None, optional): The L2 cache. Defaults
+                to None.
+            ttl (float, optional): The default TTL in seconds. Defaults
+                to 60.0.
+            jitter (float, optional): The relative TTL spread. Defaults
+                to 0.1.
+            beta (float, optional): The XFetch eagerness. Defaults to 1.0.
+            namespace (str, optional): The prefix of the shared keys.
+                Defaults to projekt.
+            settle (float, optional): The seconds after an invalidation
+                during which loaded values are not cached, as they may
+                come from a lagging replica. Defaults to 0.0.
+        """
+
+        self.local = local
+        self.shared = shared
+        self.ttl = ttl
+        self.jitter = jitter
+        self.beta = beta
+        self.namespace = namespace
+        self.settle = settle
+        self._epochs: dict[str, int] = {}
+        self._evicted_at: dict[str, float] = {}
+        self._generations: dict[str, int] = {}
+        self._bumps: dict[str, asyncio.Task] = {}
+        self._loads: dict[str, asyncio.Task] = {}
+        self._results = {
+            result: CACHE_REQUESTS.labels("tiered", result)
+            for result in ("l1_hit", "l2_hit", "miss")
+        }
+
+    async def get_or_load(
+        self,
+        entity: str,
+        key: str,
+        loader: Callable[[], Awaitable[bytes]],
+        ttl: float | None = None,
+    ) -> bytes:
+        """The method getting the cached value or loading and caching it.
+
+        The load runs in its own task shared by all concurrent callers,
+        so a caller going away does not fail the others.
+
+        Args:
+            entity (str): The entity the value depends on.
+            key (str): The key within the entity.
+            loader (Callable[[], Awaitable[bytes]]): The function loading
+                the serialized value.
+            ttl (float | None, optional): The TTL in seconds. Defaults to
+                the cache TTL.
+
+        Returns:
+            bytes: The serialized value.
+        """
+
+        generation = await self._generation(entity)
+        shared = generation is not None
+        full_key = f"{self.namespace}:{entity}:{generation}:{key}"
+
+        entry = self.local.get(full_key)
+        if entry is not None and entry.fresh(self.beta):
+            self._results["l1_hit"].inc()
+            return entry.payload
+
+        load = self._loads.get(full_key)
+        if load is None:
+            load = asyncio.ensure_future(
+                self._load(entity, full_key, loader, ttl, shared),
+            )
+            self._loads[full_key] = load
+            load.add_done_callback(
+                lambda task: self._loaded(full_key, task),
+            )
+
+        return await asyncio.shield(load)
+
+    def evict(self, entity: str, keys: list[str] | None) -> None:
+        """The method invalidating all cached values of the entity.
+
+        Listings may contain any of the keys, so all values of the entity
+        are invalidated.
+
+        Args:
+            entity (str): The entity name.
+            keys (list[str] | None): The changed keys.
+        """
+
+        prefix = f"{self.namespace}:{entity}:"
+        self._epochs[entity] = self._epochs.get(entity, 0) + 1
+        self._evicted_at[entity] = monotonic()
+        self.local.evict_prefix(prefix)
+        for key in [key for key in self._loads if key.startswith(prefix)]:
+            del self._loads[key]
+
+        self._generations.pop(entity, None)
+        if self.shared is not None:
+            self._bumps[entity] = asyncio.ensure_future(
+                self._bump(entity, self._bumps.get(entity)),
+            )
+
+    def clear(self) -> None:
+        """The method invalidating all cached values."""
+
+        for entity in {*self._generations, *self._epochs}:
+            self.evict(entity, None)
+        self.local.clear()
+
+    async def close(self) -> None:
+        """The method closing the shared cache."""
+
+        if self.shared is not None:
+            await self.shared.close()
+
+    async def _load(
+        self,
+        entity: str,
+        full_key: str,
+        loader: Callable[[], Awaitable[bytes]],
+        ttl: float | None,
+        shared: bool,
+    ) -> bytes:
+        """A private method reading L2 or calling the loader.
+
+        A value loaded while the entity was invalidated, or shortly after,
+        may be outdated, so it is returned but not cached.
+
+        Args:
+            entity (str): The entity name.
+            full_key (str): The namespaced key.
+            loader (Callable[[], Awaitable[bytes]]): The value loader.
+            ttl (float | None): The TTL in seconds.
+            shared (bool): Whether the shared cache is used.
+
+        Returns:
+            bytes: The serialized value.
+        """
+
+        if shared and self.shared is not None:
+            try:
+                data = await self.shared.get(full_key)
+                entry = CacheEntry.from_bytes(data) if data else None
+            except SHARED_CACHE_ERRORS as error:
+                logger.debug("Shared cache read failed: %s", error)
+                entry = None
+            if entry is not None and entry.fresh(self.beta):
+                self._results["l2_hit"].inc()
+                self.local.put(full_key, entry)
+                return entry.payload
+
+        self._results["miss"].inc()
+        epoch = self._epochs.get(entity, 0)
+        evicted_at = self._evicted_at.get(entity, -math.inf)
+        settling = monotonic() - evicted_at < self.settle
+        start = time()
+        payload = await loader()
+        ttl = (ttl or self.ttl) * random.uniform(  # nosec B311
+            1 - self.jitter,
+            1 + self.jitter,
+        )
+        entry = CacheEntry(payload, time() + ttl, time() - start)
+        if settling or epoch != self._epochs.get(entity, 0):
+            return payload
+
+        self.local.put(full_key, entry)
+        if shared and self.shared is not None:
+            try:
+                await self.shared.set(full_key, entry.to_bytes(), ttl)
+            except SHARED_CACHE_ERRORS as error:
+                logger.debug("Shared cache write failed: %s", error)
+
+        return payload
+
+    def _loaded(self, full_key: str, task: asyncio.Task) -> None:
+        """A private method forgetting the finished load.
+
+        Args:
+            full_key (str): The namespaced key.
+            task (asyncio.Task): The load task.
+        """
+
+        if self._loads.get(full_key) is task:
+            del self._loads[full_key]
+        if not task.cancelled():
+            task.exception()
+
+    async def _generation(self, entity: str) -> int | None:
+        """A private method getting the current generation of the entity.
+
+        Args:
+            entity (str): The entity name.
+
+        Returns:
+            int | None: The generation, 0 without the shared cache and
+                None if the shared cache cannot tell it.
+        """
+
+        if (generation := self._generations.get(entity)) is not None:
+            return generation
+
+        if self.shared is None:
+            return 0
+
+        if (bump := self._bumps.get(entity)) is not None:
+            generation = await asyncio.shield(bump)
+        else:
+            try:
+                value = await self.shared.get(self._generation_key(entity))
+                generation = int(value or 0)
+            except SHARED_CACHE_ERRORS as error:
+                logger.debug("Shared cache read failed: %s", error)
+                generation = None
+            if generation is not None and entity not in self._bumps:
+                self._generations[entity] = generation
+
+        return generation
+
+    async def _bump(
+        self,
+        entity: str,
+        previous: asyncio.Task | None,
+    ) -> int | None:
+        """A private method incrementing the shared generation.
+
+        Args:
+            entity (str): The entity name.
+            previous (asyncio.Task | None): The bump still in progress.
+
+        Returns:
+            int | None: The new generation, None if the shared cache
+                failed.
+        """
+
+        if previous is not None:
+            await asyncio.gather(previous, return_exceptions=True)
+
+        generation: int | None
+        try:
+            generation = await self.shared.incr(  # type: ignore[union-attr]
+                self._generation_key(entity),
+            )
+        except SHARED_CACHE_ERRORS as error:
+            logger.warning("Shared cache invalidation failed: %s", error)
+            generation = None
+
+        if self._bumps.get(entity) is asyncio.current_task():
+            del self._bumps[entity]
+            if generation is not None:
+                self._generations[entity] = generation
+
+        return generation
+
+    def _generation_key(self, entity: str) -> str:
+        """A private method building the key of the entity generation.
+
+        Args:
+            entity (str): The entity name.
+
+        Returns:
+            str: The shared key.
+        """
+
+        return f"{self.namespace}:{entity}:generation"
@@ -0,0 +1,144 @@
+"""A module containing the in-process fan-out of table changes."""
+
+import asyncio
+import json
+import logging
+from dataclasses import asdict, dataclass
+
+from src.infrastructure.utils.metrics import (
+    CHANGE_FEED_EVENTS,
+    CHANGE_FEED_SUBSCRIBERS,
+)
+
+logger = logging.getLogger(__name__)
+
+CHANGES_CHANNEL = "table_changes"
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """A class representing a single row change.
+
+    Statements changing too many rows are reported as a single `reload`
+    event without an id.
+    """
+
+    table: str
+    op: str
+    id: int | None
+
+    def to_json(self) -> str:
+        """The method serializing the event.
+
+        Returns:
+            str: The event as JSON.
+        """
+
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+
+class Subscription:
+    """A class representing the bounded queue of one subscriber."""
+
+    def __init__(self, size: int) -> None:
+        """The initializer of the subscription.
+
+        Args:
+            size (int): The maximum number of pending events.
+        """
+
+        self.queue: asyncio.Queue[ChangeEvent | None] = asyncio.Queue(size)
+        self.dropped = False
+
+    async def get(self) -> ChangeEvent | None:
+        """The method waiting for the next event.
+
+        Returns:
+            ChangeEvent | None: The event, None once the subscriber was
+                dropped.
+        """
+
+        return await self.queue.get()
+
+    def drop(self) -> None:
+        """The method discarding the backlog and ending the subscription."""
+
+        self.dropped = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+
+class ChangeFeed:
+    """A class fanning out table changes to the subscribers.
+
+    Publishing never waits: a subscriber whose queue is full is dropped,
+    so a slow client cannot hold back the others or grow the memory.
+    """
+
+    def __init__(self, queue_size: int = 100) -> None:
+        """The initializer of the feed.
+
+        Args:
+            queue_size (int, optional): The per-subscriber queue size.
+                Defaults to 100.
+        """
+
+        self.queue_size = queue_size
+        self.subscriptions: set[Subscription] = set()
+        self._subscribers = CHANGE_FEED_SUBSCRIBERS.labels()
+        self._delivered = CHANGE_FEED_EVENTS.labels("delivered")
+        self._dropped = CHANGE_FEED_EVENTS.labels("dropped")
+
+    def subscribe(self) -> Subscription:
+        """The method adding a subscriber.
+
+        Returns:
+            Subscription: The new subscription.
+        """
+
+        subscription = Subscription(self.queue_size)
+        self.subscriptions.add(subscription)
+        self._subscribers.inc()
+
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """The method removing the subscriber.
+
+        Args:
+            subscription (Subscription): The subscription to remove.
+        """
+
+        if subscription in self.subscriptions:
+            self.subscriptions.discard(subscription)
+            self._subscribers.dec()
+
+    def publish(self, event: ChangeEvent) -> None:
+        """The method delivering the event to all subscribers.
+
+        Args:
+            event (ChangeEvent): The change.
+        """
+
+        for subscription in list(self.subscriptions):
+            try:
+                subscription.queue.put_nowait(event)
+                self._delivered.inc()
+            except asyncio.QueueFull:
+                logger.warning("Dropping a slow change feed subscriber")
+                self._dropped.inc()
+                subscription.drop()
+                self.unsubscribe(subscription)
+
+    def publish_payload(self, payload: str) -> None:
+        """The method publishing the `pg_notify` payload.
+
+        Args:
+            payload (str): The JSON payload sent by the trigger.
+        """
+
+        try:
+            self.publish(ChangeEvent(**json.loads(payload)))
+        except (TypeError, ValueError):
+            logger.warning("Invalid change notification: %s", payload)
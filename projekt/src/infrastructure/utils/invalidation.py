@@ -0,0 +1,113 @@
+"""A module containing the cross-worker cache invalidation bus.
+
+Repository writes publish the changed entity keys with `pg_notify`. The
+notification is delivered on commit to every worker listening on the
+channel, the writer included, and each of them evicts the keys from its
+subscribed caches. After the `LISTEN` connection was lost the caches are
+flushed, as the invalidations sent meanwhile never arrive.
+"""
+
+import json
+import logging
+from typing import Iterable, Protocol
+
+from src.infrastructure.utils.metrics import CACHE_INVALIDATIONS
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache_invalidation"
+
+# A notification payload is limited to 8000 bytes, so larger writes
+# invalidate the whole entity instead.
+MAX_KEYS = 200
+
+
+class InvalidatedCache(Protocol):
+    """A protocol of the caches subscribed to the invalidations."""
+
+    def evict(self, entity: str, keys: list[str] | None) -> None:
+        """The method evicting the entries of the entity keys.
+
+        Args:
+            entity (str): The entity name, e.g. `club`.
+            keys (list[str] | None): The changed keys, None for all.
+        """
+
+    def clear(self) -> None:
+        """The method evicting all entries."""
+
+
+class InvalidationBus:
+    """A class dispatching the invalidations to the local caches."""
+
+    def __init__(self) -> None:
+        """The initializer of the bus."""
+
+        self.caches: list[InvalidatedCache] = []
+
+    def subscribe(self, cache: InvalidatedCache) -> None:
+        """The method registering the cache.
+
+        Args:
+            cache (InvalidatedCache): The cache to keep fresh.
+        """
+
+        self.caches.append(cache)
+
+    @staticmethod
+    def payload(entity: str, keys: Iterable[object] | None) -> str:
+        """The method building the notification payload.
+
+        Args:
+            entity (str): The entity name.
+            keys (Iterable[object] | None): The changed keys, None for
+                all.
+
+        Returns:
+            str: The JSON payload.
+        """
+
+        keys = None if keys is None else [str(key) for key in keys]
+        if keys is not None and len(keys) > MAX_KEYS:
+            keys = None
+
+        return json.dumps(
+            {"entity": entity, "keys": keys},
+            separators=(",", ":"),
+        )
+
+    def receive(self, payload: str) -> None:
+        """The method applying the notification payload.
+
+        Args:
+            payload (str): The JSON payload.
+        """
+
+        try:
+            message = json.loads(payload)
+            entity, keys = message["entity"], message["keys"]
+        except (TypeError, ValueError, KeyError):
+            logger.warning("Invalid invalidation: %s", payload)
+            return
+
+        self.evict(entity, keys)
+
+    def evict(self, entity: str, keys: list[str] | None) -> None:
+        """The method evicting the keys from all caches.
+
+        Args:
+            entity (str): The entity name.
+            keys (list[str] | None): The changed keys, None for all.
+        """
+
+        CACHE_INVALIDATIONS.labels("evict").inc()
+        for cache in self.caches:
+            cache.evict(entity, keys)
+
+    def flush(self) -> None:
+        """The method clearing all caches after missed invalidations."""
+
+        CACHE_INVALIDATIONS.labels("flush").inc()
+        logger.warning("Flushing %d caches", len(self.caches))
+        for cache in self.caches:
+            cache.clear()
@@ -0,0 +1,105 @@
+"""A module containing the structured logging setup.
+
+Records are formatted as JSON lines and written by a `QueueListener`
+thread, so emitting a record on the event loop only puts it on a queue.
+"""
+
+import copy
+import json
+import logging
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+_RESERVED = frozenset(vars(logging.makeLogRecord({}))) | {"message"}
+
+
+class JsonFormatter(logging.Formatter):
+    """A class formatting log records as single line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """The method formatting the record.
+
+        Args:
+            record (logging.LogRecord): The log record.
+
+        Returns:
+            str: The JSON representation of the record.
+        """
+
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc)
+            .isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(
+            (key, value)
+            for key, value in record.__dict__.items()
+            if key not in _RESERVED
+        )
+
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+
+        return json.dumps(entry, default=str)
+
+
+class StructuredQueueHandler(QueueHandler):
+    """A class enqueuing records without merging them into text."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """The method preparing the record to be pickled and enqueued.
+
+        Args:
+            record (logging.LogRecord): The log record.
+
+        Returns:
+            logging.LogRecord: The copy with the message rendered.
+        """
+
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(
+                record.exc_info,
+            )
+            record.exc_info = None
+
+        return record
+
+
+def setup_logging(level: str = "INFO") -> QueueListener:
+    """A function routing all logging through a background thread.
+
+    Args:
+        level (str, optional): The root logger level. Defaults to "INFO".
+
+    Returns:
+        QueueListener: The started listener, to be stopped on shutdown.
+    """
+
+    queue: SimpleQueue = SimpleQueue()
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(JsonFormatter())
+    listener = QueueListener(queue, stream, respect_handler_level=True)
+
+    root = logging.getLogger()
+    root.handlers = [StructuredQueueHandler(queue)]
+    root.setLevel(level)
+
+    for name in ("uvicorn", "uvicorn.error"):
+        logging.getLogger(name).handlers = []
+        logging.getLogger(name).propagate = True
+
+    logging.getLogger("uvicorn.access").disabled = True
+
+    listener.start()
+
+    return listener
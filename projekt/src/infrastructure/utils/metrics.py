@@ -0,0 +1,514 @@
+"""A module containing the in-process metrics registry.
+
+The metrics are rendered in the Prometheus text exposition format. They
+are kept per worker process and are updated from the event loop thread
+only, so recording a sample is a dictionary lookup and a few additions.
+"""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Iterable
+
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+def _escape(value: str) -> str:
+    """A function escaping the label value.
+
+    Args:
+        value (str): The raw label value.
+
+    Returns:
+        str: The escaped label value.
+    """
+
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    """A function formatting the label set of the sample.
+
+    Args:
+        names (Iterable[str]): The label names.
+        values (Iterable[str]): The label values.
+
+    Returns:
+        str: The formatted label set, empty if there are no labels.
+    """
+
+    pairs = ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)
+    )
+
+    return f"{{{pairs}}}" if pairs else ""
+
+
+class _CounterChild:
+    """A class representing a single counter time series."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """The method incrementing the counter.
+
+        Args:
+            amount (float, optional): The increment. Defaults to 1.0.
+        """
+
+        self.value += amount
+
+
+class _GaugeChild:
+    """A class representing a single gauge time series."""
+
+    __slots__ = ("value", "function")
+
+    def __init__(self) -> None:
+        self.value = 0.0
+        self.function: Callable[[], float] | None = None
+
+    def inc(self, amount: float = 1.0) -> None:
+        """The method incrementing the gauge.
+
+        Args:
+            amount (float, optional): The increment. Defaults to 1.0.
+        """
+
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """The method decrementing the gauge.
+
+        Args:
+            amount (float, optional): The decrement. Defaults to 1.0.
+        """
+
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        """The method setting the gauge value.
+
+        Args:
+            value (float): The new value.
+        """
+
+        self.value = value
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """The method making the gauge evaluated on collection.
+
+        Args:
+            function (Callable[[], float]): The value provider.
+        """
+
+        self.function = function
+
+    def get(self) -> float:
+        """The method getting the current value of the gauge.
+
+        Returns:
+            float: The gauge value.
+        """
+
+        return self.function() if self.function else self.value
+
+
+class _HistogramChild:
+    """A class representing a single histogram time series."""
+
+    __slots__ = ("buckets", "counts", "sum")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """The method recording the observation.
+
+        Args:
+            value (float): The observed value.
+        """
+
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+class Metric(ABC):
+    """A base class of the labelled metric family."""
+
+    kind = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        registry: "Registry | None" = None,
+    ) -> None:
+        """The initializer of the metric family.
+
+        Args:
+            name (str): The metric name.
+            documentation (str): The help text.
+            labelnames (Iterable[str], optional): The label names.
+                Defaults to ().
+            registry (Registry | None, optional): The registry to add the
+                metric to. Defaults to the global registry.
+        """
+
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple, Any] = {}
+
+        (registry or REGISTRY).register(self)
+
+    def labels(self, *values: str) -> Any:
+        """The method getting the time series for the label values.
+
+        Args:
+            *values (str): The label values in the declaration order.
+
+        Returns:
+            Any: The time series of the metric.
+        """
+
+        try:
+            return self._children[values]
+        except KeyError:
+            if len(values) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} expects labels {self.labelnames}"
+                ) from None
+            child = self._children[values] = self._new_child()
+
+            return child
+
+    @abstractmethod
+    def _new_child(self) -> Any:
+        """A private method creating the time series.
+
+        Returns:
+            Any: The new time series.
+        """
+
+    def _default(self) -> Any:
+        """A private method getting the unlabelled time series.
+
+        Returns:
+            Any: The time series without labels.
+        """
+
+        return self.labels()
+
+    @abstractmethod
+    def collect(self) -> Iterable[str]:
+        """The method rendering the samples of the metric.
+
+        Returns:
+            Iterable[str]: The sample lines.
+        """
+
+
+class Counter(Metric):
+    """A class representing a monotonic counter."""
+
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """The method incrementing the unlabelled counter.
+
+        Args:
+            amount (float, optional): The increment. Defaults to 1.0.
+        """
+
+        self._default().inc(amount)
+
+    def collect(self) -> Iterable[str]:
+        for values, child in list(self._children.items()):
+            labels = _format_labels(self.labelnames, values)
+            yield f"{self.name}{labels} {child.value}"
+
+
+class Gauge(Metric):
+    """A class representing a value that can go up and down."""
+
+    kind = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """The method incrementing the unlabelled gauge.
+
+        Args:
+            amount (float, optional): The increment. Defaults to 1.0.
+        """
+
+        self._default().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        """The method decrementing the unlabelled gauge.
+
+        Args:
+            amount (float, optional): The decrement. Defaults to 1.0.
+        """
+
+        self._default().dec(amount)
+
+    def set(self, value: float) -> None:
+        """The method setting the unlabelled gauge.
+
+        Args:
+            value (float): The new value.
+        """
+
+        self._default().set(value)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """The method making the unlabelled gauge evaluated on collection.
+
+        Args:
+            function (Callable[[], float]): The value provider.
+        """
+
+        self._default().set_function(function)
+
+    def collect(self) -> Iterable[str]:
+        for values, child in list(self._children.items()):
+            try:
+                value = child.get()
+            except Exception:  # pylint: disable=broad-except
+                continue
+            labels = _format_labels(self.labelnames, values)
+            yield f"{self.name}{labels} {value}"
+
+
+class Histogram(Metric):
+    """A class representing a distribution of observations."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+        registry: "Registry | None" = None,
+    ) -> None:
+        """The initializer of the histogram family.
+
+        Args:
+            name (str): The metric name.
+            documentation (str): The help text.
+            labelnames (Iterable[str], optional): The label names.
+                Defaults to ().
+            buckets (Iterable[float], optional): The upper bounds of the
+                buckets. Defaults to DEFAULT_BUCKETS.
+            registry (Registry | None, optional): The registry to add the
+                metric to. Defaults to the global registry.
+        """
+
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """The method recording the unlabelled observation.
+
+        Args:
+            value (float): The observed value.
+        """
+
+        self._default().observe(value)
+
+    def collect(self) -> Iterable[str]:
+        names = self.labelnames + ("le",)
+
+        for values, child in list(self._children.items()):
+            cumulative = 0
+            bounds = [*map(str, self.buckets), "+Inf"]
+            for bound, count in zip(bounds, child.counts):
+                cumulative += count
+                labels = _format_labels(names, values + (bound,))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+
+            labels = _format_labels(self.labelnames, values)
+            yield f"{self.name}_sum{labels} {child.sum}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class Registry:
+    """A class collecting the metric families."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> None:
+        """The method adding the metric family to the registry.
+
+        Args:
+            metric (Metric): The metric family.
+
+        Raises:
+            ValueError: If the metric name is already registered.
+        """
+
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+
+        self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        """The method rendering all metrics in the text exposition format.
+
+        Returns:
+            str: The rendered metrics.
+        """
+
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.collect())
+
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template and status.",
+    ("method", "route", "status"),
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being handled.",
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Database time spent by repository method.",
+    ("repository", "method"),
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Database pool connections by state.",
+    ("state",),
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Cache lookups by cache and result.",
+    ("cache", "result"),
+)
+BCRYPT_QUEUE_DEPTH = Gauge(
+    "bcrypt_queue_depth",
+    "Password hashing jobs waiting for or running in the bcrypt pool.",
+)
+CHANGE_FEED_SUBSCRIBERS = Gauge(
+    "change_feed_subscribers",
+    "Clients subscribed to the change feed.",
+)
+CHANGE_FEED_EVENTS = Counter(
+    "change_feed_events_total",
+    "Change events by delivery result.",
+    ("result",),
+)
+CONCURRENCY_LIMIT = Gauge(
+    "concurrency_limit",
+    "Adaptive concurrency limit by route class.",
+    ("route_class",),
+)
+CONCURRENCY_IN_FLIGHT = Gauge(
+    "concurrency_in_flight",
+    "Admitted requests being handled by route class.",
+    ("route_class",),
+)
+REQUESTS_SHED = Counter(
+    "requests_shed_total",
+    "Requests rejected with 503 by route class and reason.",
+    ("route_class", "reason"),
+)
+CIRCUIT_BREAKER_STATE = Gauge(
+    "circuit_breaker_state",
+    "Circuit state by breaker: 0 closed, 1 half-open, 2 open.",
+    ("breaker",),
+)
+CIRCUIT_BREAKER_CALLS = Counter(
+    "circuit_breaker_calls_total",
+    "Guarded calls by breaker and result.",
+    ("breaker", "result"),
+)
+CACHE_INVALIDATIONS = Counter(
+    "cache_invalidations_total",
+    "Cache invalidations applied by kind.",
+    ("kind",),
+)
+INSERT_BATCH_SIZE = Histogram(
+    "db_coalesced_insert_rows",
+    "Rows per coalesced insert statement by table.",
+    ("table",),
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+EMAIL_FILTER_CHECKS = Counter(
+    "email_filter_checks_total",
+    "Registration email pre-checks by filter result.",
+    ("result",),
+)
+EMAIL_FILTER_FALSE_POSITIVE_RATE = Gauge(
+    "email_filter_false_positive_rate",
+    "Estimated false positive rate of the registered email filter.",
+)
+EMAIL_FILTER_MEMORY = Gauge(
+    "email_filter_memory_bytes",
+    "Memory used by the registered email filter.",
+)
+REPLICA_LAG = Gauge(
+    "db_replica_lag_seconds",
+    "Replication lag by replica, -1 while unavailable.",
+    ("replica",),
+)
+REPLICA_QUERIES = Counter(
+    "db_routed_queries_total",
+    "Routed reads by target database.",
+    ("target",),
+)
+
+
+def track_query(function: Callable) -> Callable:
+    """A decorator recording the duration of the repository method.
+
+    Args:
+        function (Callable): The repository coroutine method.
+
+    Returns:
+        Callable: The decorated method.
+    """
+
+    repository, method = function.__qualname__.split(".")[-2:]
+    series = DB_QUERY_DURATION.labels(repository, method)
+
+    @wraps(function)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = perf_counter()
+        try:
+            return await function(*args, **kwargs)
+        finally:
+            series.observe(perf_counter() - start)
+
+    return wrapper
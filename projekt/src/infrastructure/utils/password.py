@@ -1,9 +1,22 @@
 """A module containing password helper methods."""
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
 from passlib.context import CryptContext
 
+from src.config import config
+from src.infrastructure.utils.metrics import BCRYPT_QUEUE_DEPTH
+
 pwd_context = CryptContext(schemes=["bcrypt"])
 
+bcrypt_executor = ThreadPoolExecutor(
+    max_workers=config.BCRYPT_WORKERS,
+    thread_name_prefix="bcrypt",
+)
+bcrypt_queue = BCRYPT_QUEUE_DEPTH.labels()
+
 
 def hash_password(password: str) -> str:
     """A function generating has password.
@@ -28,3 +41,52 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         bool: True if the password matches the hash, False otherwise.
     """
     return pwd_context.verify(plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """A function hashing the password in the bcrypt pool.
+
+    Args:
+        password (str): A raw form of the password.
+
+    Returns:
+        str: The hashed password.
+    """
+    return await _run_in_pool(hash_password, password)
+
+
+async def verify_password_async(
+    plain_password: str,
+    hashed_password: str,
+) -> bool:
+    """A function verifying the password in the bcrypt pool.
+
+    Args:
+        plain_password (str): The raw password.
+        hashed_password (str): The hashed password.
+
+    Returns:
+        bool: True if the password matches the hash, False otherwise.
+    """
+    return await _run_in_pool(verify_password, plain_password, hashed_password)
+
+
+async def _run_in_pool(function: Callable, *args: Any) -> Any:
+    """A function running the blocking call off the event loop.
+
+    Args:
+        function (Callable): The blocking function.
+        *args (Any): The function arguments.
+
+    Returns:
+        Any: The function result.
+    """
+    bcrypt_queue.inc()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(
+            bcrypt_executor,
+            function,
+            *args,
+        )
+    finally:
+        bcrypt_queue.dec()
@@ -0,0 +1,189 @@
+"""A module containing the shared Postgres `LISTEN` connection."""
+
+import asyncio
+import logging
+from typing import Callable
+
+import asyncpg  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+
+class PgListener:
+    """A class multiplexing notification channels over one connection.
+
+    The connection is opened outside of the query pool, so listening
+    never holds a pooled connection, and every worker process listens
+    once regardless of the number of subscribers. A lost connection is
+    re-established with an exponential backoff. Notifications sent in
+    the meantime are lost, so the reconnect callbacks are called to
+    resynchronize the consumers.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+        health_interval: float = 10.0,
+    ) -> None:
+        """The initializer of the listener.
+
+        Args:
+            dsn (str): The asyncpg connection string.
+            reconnect_delay (float, optional): The first reconnect delay
+                in seconds. Defaults to 0.5.
+            max_reconnect_delay (float, optional): The longest reconnect
+                delay in seconds. Defaults to 30.0.
+            health_interval (float, optional): The seconds between the
+                checks of a silently broken connection. Defaults to 10.0.
+        """
+
+        self.dsn = dsn
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.health_interval = health_interval
+        self.callbacks: dict[str, list[Callable[[str], None]]] = {}
+        self.reconnect_callbacks: list[Callable[[], None]] = []
+        self._connection: asyncpg.Connection | None = None
+        self._running = False
+        self._reconnecting: asyncio.Task | None = None
+        self._health: asyncio.Task | None = None
+
+    def add_listener(
+        self,
+        channel: str,
+        callback: Callable[[str], None],
+    ) -> None:
+        """The method registering the callback of the channel.
+
+        Callbacks run on the event loop and must not block.
+
+        Args:
+            channel (str): The notification channel.
+            callback (Callable[[str], None]): The payload consumer.
+        """
+
+        self.callbacks.setdefault(channel, []).append(callback)
+
+    def add_reconnect_listener(self, callback: Callable[[], None]) -> None:
+        """The method registering the callback of a reconnect.
+
+        Args:
+            callback (Callable[[], None]): The function resynchronizing
+                the state missed while disconnected.
+        """
+
+        self.reconnect_callbacks.append(callback)
+
+    async def start(self) -> None:
+        """The method connecting and listening on all channels."""
+
+        self._running = True
+        await self._connect()
+        self._health = asyncio.create_task(self._check_health())
+
+    async def stop(self) -> None:
+        """The method closing the connection."""
+
+        self._running = False
+        for task in (self._reconnecting, self._health):
+            if task is not None:
+                task.cancel()
+
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            await connection.close()
+
+    async def _connect(self) -> None:
+        """A private method opening the connection and listening."""
+
+        connection = await asyncpg.connect(self.dsn)
+        try:
+            for channel in self.callbacks:
+                await connection.add_listener(channel, self._notify)
+        except BaseException:
+            await connection.close()
+            raise
+
+        connection.add_termination_listener(self._terminated)
+        self._connection = connection
+
+    async def _reconnect(self) -> None:
+        """A private method reconnecting until it succeeds."""
+
+        delay = self.reconnect_delay
+        while self._running:
+            await asyncio.sleep(delay)
+            try:
+                await self._connect()
+            except (OSError, asyncpg.PostgresError) as error:
+                logger.warning("LISTEN reconnect failed: %s", error)
+                delay = min(delay * 2, self.max_reconnect_delay)
+                continue
+
+            logger.warning("The LISTEN connection was re-established")
+            for callback in self.reconnect_callbacks:
+                try:
+                    callback()
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception("Reconnect callback failed")
+            return
+
+    async def _check_health(self) -> None:
+        """A private method detecting a connection broken without notice.
+
+        A connection cut by the network may not be closed for a long time,
+        so it is probed periodically and dropped if it does not answer.
+        """
+
+        while self._running:
+            await asyncio.sleep(self.health_interval)
+            connection = self._connection
+            if connection is None:
+                continue
+
+            try:
+                await asyncio.wait_for(
+                    connection.fetchval("SELECT 1"),
+                    self.health_interval,
+                )
+            except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError):
+                connection.terminate()
+                self._terminated(connection)
+
+    def _notify(
+        self,
+        _connection: asyncpg.Connection,
+        _pid: int,
+        channel: str,
+        payload: str,
+    ) -> None:
+        """A private method dispatching the notification.
+
+        Args:
+            _connection (asyncpg.Connection): The listening connection.
+            _pid (int): The id of the notifying backend.
+            channel (str): The notification channel.
+            payload (str): The notification payload.
+        """
+
+        for callback in self.callbacks.get(channel, ()):
+            try:
+                callback(payload)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Notification callback failed: %s", channel)
+
+    def _terminated(self, connection: asyncpg.Connection) -> None:
+        """A private method reconnecting after the connection was lost.
+
+        Args:
+            connection (asyncpg.Connection): The closed connection.
+        """
+
+        if connection is not self._connection or not self._running:
+            return
+
+        logger.error("The LISTEN connection was lost")
+        self._connection = None
+        self._reconnecting = asyncio.create_task(self._reconnect())
@@ -0,0 +1,136 @@
+"""A module containing the prepared statements of the hot queries.
+
+The hot queries skip SQLAlchemy compilation and the `databases` layer:
+every pooled connection prepares them once when it is opened, and they
+are executed with the positional arguments straight on asyncpg. Their
+columns are labelled with the model fields and the records expose them
+as attributes, so models validate the records directly.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+import asyncpg  # type: ignore
+import databases
+import sqlalchemy
+from sqlalchemy.dialects.postgresql import asyncpg as asyncpg_dialect
+from sqlalchemy.sql import ClauseElement
+
+_dialect = asyncpg_dialect.dialect()
+
+
+@dataclass(frozen=True)
+class HotQuery:
+    """A class representing the query prepared on every connection."""
+
+    query: ClauseElement
+    sql: str
+    params: tuple[str, ...]
+
+
+hot_queries: dict[str, HotQuery] = {}
+
+
+def hot_query(name: str, query: sqlalchemy.Select) -> str:
+    """A function declaring the query to prepare on every connection.
+
+    Args:
+        name (str): The unique name of the query.
+        query (sqlalchemy.Select): The query with the columns labelled by
+            the model fields and named bind parameters.
+
+    Returns:
+        str: The name.
+    """
+
+    compiled = query.compile(dialect=_dialect)
+    hot_queries[name] = HotQuery(
+        query=query,
+        sql=str(compiled),
+        params=tuple(compiled.positiontup or ()),
+    )
+
+    return name
+
+
+class ModelRecord(asyncpg.Record):
+    """A class of the records readable by `from_attributes` models."""
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError as error:
+            raise AttributeError(name) from error
+
+
+class PreparedConnection(asyncpg.Connection):
+    """A class of the asyncpg connections holding the hot statements."""
+
+    statements: dict[str, asyncpg.prepared_stmt.PreparedStatement]
+
+
+async def prepare_hot_queries(connection: PreparedConnection) -> None:
+    """A function preparing the hot queries on the new connection.
+
+    Args:
+        connection (PreparedConnection): The opened connection.
+    """
+
+    connection.statements = {
+        name: await connection.prepare(query.sql, record_class=ModelRecord)
+        for name, query in hot_queries.items()
+    }
+
+
+async def fetch_hot(
+    database: databases.Database,
+    name: str,
+    args: tuple,
+) -> ModelRecord | None:
+    """A function fetching the first row of the hot query.
+
+    The query runs on the connection of the calling task, so it sees the
+    writes of its transaction. The query lock of the connection is held
+    while asyncpg is used directly, as `databases` does for its queries.
+    Queries declared after the connection was opened are prepared on
+    first use. Connections of other classes run the query through the
+    statement cache of asyncpg.
+
+    Args:
+        database (databases.Database): The database of the query.
+        name (str): The name of the query.
+        args (tuple): The positional parameters.
+
+    Returns:
+        ModelRecord | None: The row if any.
+    """
+
+    hot = hot_queries[name]
+    async with database.connection() as connection:
+        # pylint: disable-next=protected-access
+        async with connection._query_lock:
+            raw = connection.raw_connection
+            statements = getattr(raw, "statements", None)
+            if statements is None:
+                return await raw.fetchrow(
+                    hot.sql,
+                    *args,
+                    record_class=ModelRecord,
+                )
+
+            if (statement := statements.get(name)) is None:
+                statement = await raw.prepare(
+                    hot.sql,
+                    record_class=ModelRecord,
+                )
+                statements[name] = statement
+
+            return await statement.fetchrow(*args)
+
+
+# The options of `databases.Database` making its pool prepare the hot
+# queries on every connection.
+PREPARED_POOL_OPTIONS: dict[str, Any] = {
+    "connection_class": PreparedConnection,
+    "init": prepare_hot_queries,
+}
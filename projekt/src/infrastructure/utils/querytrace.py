@@ -0,0 +1,427 @@
+"""A module containing the database query instrumentation layer."""
+
+import asyncio
+import json
+import logging
+import random
+import re
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, AsyncIterator, Coroutine, TypeVar
+
+import databases
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import ClauseElement
+
+from src.infrastructure.utils.prepared import fetch_hot, hot_queries
+from src.infrastructure.utils.requestcontext import (
+    DeadlineExceeded,
+    request_context,
+)
+
+logger = logging.getLogger(__name__)
+
+_dialect = postgresql.dialect(paramstyle="named")
+_whitespace = re.compile(r"\s+")
+
+T = TypeVar("T")
+
+
+@dataclass
+class QueryTrace:
+    """A class representing a single traced query."""
+
+    fingerprint: str
+    parameters: int
+    rows: int
+    duration: float
+    timestamp: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat(),
+    )
+
+    def to_dict(self) -> dict:
+        """The method converting the trace into a dictionary.
+
+        Returns:
+            dict: The trace attributes.
+        """
+
+        return asdict(self)
+
+
+class QueryTracer:
+    """A class collecting traces of slow queries."""
+
+    def __init__(
+        self,
+        threshold: float,
+        explain_rate: float = 0.0,
+        buffer_size: int = 100,
+    ) -> None:
+        """The initializer of the tracer.
+
+        Args:
+            threshold (float): The slow query threshold in seconds.
+            explain_rate (float, optional): The probability of sampling
+                `EXPLAIN ANALYZE` for a new worst query of a fingerprint.
+                Defaults to 0.0.
+            buffer_size (int, optional): The size of the ring buffers.
+                Defaults to 100.
+        """
+
+        self.threshold = threshold
+        self.explain_rate = explain_rate
+        self.slow_queries: deque[QueryTrace] = deque(maxlen=buffer_size)
+        self.explains: deque[dict] = deque(maxlen=buffer_size)
+        self._worst: dict[str, float] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def wants(self, duration: float) -> bool:
+        """The method checking whether the query should be traced.
+
+        Args:
+            duration (float): The query duration in seconds.
+
+        Returns:
+            bool: True if the query is slow.
+        """
+
+        return duration >= self.threshold
+
+    def record(
+        self,
+        database: databases.Database,
+        query: ClauseElement | str,
+        values: dict | None,
+        rows: int,
+        duration: float,
+    ) -> None:
+        """The method recording the trace of the executed query.
+
+        Args:
+            database (databases.Database): The database the query ran on.
+            query (ClauseElement | str): The executed query.
+            values (dict | None): The raw query values.
+            rows (int): The number of rows returned.
+            duration (float): The query duration in seconds.
+        """
+
+        if duration < self.threshold:
+            return
+
+        sql, params = self._compile(query, values)
+        trace = QueryTrace(
+            fingerprint=sql,
+            parameters=len(params),
+            rows=rows,
+            duration=duration,
+        )
+
+        logger.warning(
+            "Slow query (%.1f ms, %d rows): %s",
+            duration * 1000,
+            rows,
+            sql,
+        )
+        self.slow_queries.append(trace)
+
+        if (
+            self.explain_rate
+            and sql.lstrip().upper().startswith("SELECT")
+            and duration > self._worst.get(sql, 0.0)
+            and random.random() < self.explain_rate  # nosec B311
+        ):
+            self._worst[sql] = duration
+            task = asyncio.create_task(self._explain(database, trace, params))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _explain(
+        self,
+        database: databases.Database,
+        trace: QueryTrace,
+        params: dict,
+    ) -> None:
+        """A private method storing the query plan in the ring buffer.
+
+        Args:
+            database (databases.Database): The database to explain on.
+            trace (QueryTrace): The trace of the slow query.
+            params (dict): The query parameters.
+        """
+
+        try:
+            plan = await database.fetch_val(
+                f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {trace.fingerprint}",
+                params,
+            )
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Could not explain query: %s", trace.fingerprint)
+            return
+
+        self.explains.append({
+            **trace.to_dict(),
+            "plan": json.loads(plan) if isinstance(plan, str) else plan,
+        })
+
+    @staticmethod
+    def _compile(
+        query: ClauseElement | str,
+        values: dict | None,
+    ) -> tuple[str, dict]:
+        """A private method getting the fingerprint of the query.
+
+        Args:
+            query (ClauseElement | str): The executed query.
+            values (dict | None): The raw query values.
+
+        Returns:
+            tuple[str, dict]: The parametrized SQL and its parameters.
+        """
+
+        if isinstance(query, str):
+            return _whitespace.sub(" ", query).strip(), values or {}
+
+        compiled = query.compile(dialect=_dialect)
+
+        return _whitespace.sub(" ", str(compiled)).strip(), compiled.params
+
+
+class TracedDatabase:
+    """A class instrumenting the calls of the `databases.Database`.
+
+    Every query is bounded by the remaining budget of the request
+    deadline and cancelled when it runs past it. Queries of a handler
+    cancelled on the client disconnect are cancelled as well. In both
+    cases asyncpg sends a cancel request, so Postgres stops the query.
+    """
+
+    def __init__(
+        self,
+        database: databases.Database,
+        tracer: QueryTracer,
+    ) -> None:
+        """The initializer of the traced database.
+
+        Args:
+            database (databases.Database): The wrapped database.
+            tracer (QueryTracer): The tracer recording the queries.
+        """
+
+        self._database = database
+        self.tracer = tracer
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._database, name)
+
+    async def fetch_all(
+        self,
+        query: ClauseElement | str,
+        values: dict | None = None,
+    ) -> list:
+        """The method fetching all rows of the query.
+
+        Args:
+            query (ClauseElement | str): The query.
+            values (dict | None, optional): The query values.
+
+        Returns:
+            list: The fetched records.
+        """
+
+        start = perf_counter()
+        result = await self._bounded(self._database.fetch_all(query, values))
+        self._trace(query, values, len(result), perf_counter() - start)
+
+        return result
+
+    async def fetch_one(
+        self,
+        query: ClauseElement | str,
+        values: dict | None = None,
+    ) -> Any:
+        """The method fetching the first row of the query.
+
+        Args:
+            query (ClauseElement | str): The query.
+            values (dict | None, optional): The query values.
+
+        Returns:
+            Any: The fetched record if exists.
+        """
+
+        start = perf_counter()
+        result = await self._bounded(self._database.fetch_one(query, values))
+        duration = perf_counter() - start
+        self._trace(query, values, int(result is not None), duration)
+
+        return result
+
+    async def fetch_val(
+        self,
+        query: ClauseElement | str,
+        values: dict | None = None,
+        column: Any = 0,
+    ) -> Any:
+        """The method fetching a single value of the query.
+
+        Args:
+            query (ClauseElement | str): The query.
+            values (dict | None, optional): The query values.
+            column (Any, optional): The column to fetch. Defaults to 0.
+
+        Returns:
+            Any: The fetched value.
+        """
+
+        start = perf_counter()
+        result = await self._bounded(
+            self._database.fetch_val(query, values, column),
+        )
+        duration = perf_counter() - start
+        self._trace(query, values, int(result is not None), duration)
+
+        return result
+
+    async def execute(
+        self,
+        query: ClauseElement | str,
+        values: dict | None = None,
+    ) -> Any:
+        """The method executing the statement.
+
+        Args:
+            query (ClauseElement | str): The statement.
+            values (dict | None, optional): The statement values.
+
+        Returns:
+            Any: The result of the statement.
+        """
+
+        start = perf_counter()
+        result = await self._bounded(self._database.execute(query, values))
+        self._trace(query, values, 0, perf_counter() - start)
+
+        return result
+
+    async def execute_many(
+        self,
+        query: ClauseElement | str,
+        values: list,
+    ) -> None:
+        """The method executing the statement for every set of values.
+
+        Args:
+            query (ClauseElement | str): The statement.
+            values (list): The statement values.
+        """
+
+        start = perf_counter()
+        await self._bounded(self._database.execute_many(query, values))
+        duration = perf_counter() - start
+        self._trace(query, values[0] if values else None, 0, duration)
+
+    async def fetch_prepared(self, name: str, *args: Any) -> Any:
+        """The method fetching the first row of the hot query.
+
+        Args:
+            name (str): The name of the hot query.
+            *args (Any): The positional parameters.
+
+        Returns:
+            Any: The fetched record if exists.
+        """
+
+        start = perf_counter()
+        result = await self._bounded(fetch_hot(self._database, name, args))
+        duration = perf_counter() - start
+        hot = hot_queries[name]
+        self._trace(
+            hot.query,
+            dict(zip(hot.params, args)),
+            int(result is not None),
+            duration,
+        )
+
+        return result
+
+    @asynccontextmanager
+    async def dedicated_connection(self) -> AsyncIterator[Any]:
+        """The method acquiring a pool connection of its own.
+
+        Unlike `connection()`, it is not shared with the other queries
+        of the task, so long operations on the raw asyncpg connection,
+        like `COPY`, do not hold them up.
+
+        Yields:
+            AsyncIterator[Any]: The raw asyncpg connection.
+        """
+
+        # pylint: disable-next=protected-access
+        connection = self._database._backend.connection()
+        await connection.acquire()
+        try:
+            yield connection.raw_connection
+        finally:
+            await connection.release()
+
+    async def _bounded(self, call: Coroutine[Any, Any, T]) -> T:
+        """A private method awaiting the query within the request deadline.
+
+        The query is cancelled when the deadline passes, which makes
+        asyncpg cancel it in Postgres, the same way as its own `timeout`.
+        No statement or transaction is added, so the query still takes a
+        single round trip.
+
+        Args:
+            call (Coroutine[Any, Any, T]): The query coroutine.
+
+        Raises:
+            DeadlineExceeded: If the deadline passed before or during the
+                query.
+
+        Returns:
+            T: The result of the query.
+        """
+
+        context = request_context.get()
+        remaining = context.remaining() if context else None
+        if remaining is None:
+            return await call
+
+        if remaining <= 0:
+            call.close()
+            raise DeadlineExceeded("The request deadline was exceeded")
+
+        try:
+            async with asyncio.timeout(remaining):
+                return await call
+        except TimeoutError as error:
+            raise DeadlineExceeded("The request deadline was exceeded") \
+                from error
+
+    def _trace(
+        self,
+        query: ClauseElement | str,
+        values: dict | None,
+        rows: int,
+        duration: float,
+    ) -> None:
+        """A private method passing the query to the tracer.
+
+        Args:
+            query (ClauseElement | str): The executed query.
+            values (dict | None): The query values.
+            rows (int): The number of rows returned.
+            duration (float): The query duration in seconds.
+        """
+
+        if context := request_context.get():
+            context.db_time += duration
+            context.db_queries += 1
+
+        if self.tracer.wants(duration):
+            self.tracer.record(self._database, query, values, rows, duration)
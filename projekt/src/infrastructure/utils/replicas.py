@@ -0,0 +1,362 @@
+"""A module containing the routing of reads to the read replicas."""
+
+import asyncio
+import logging
+import random
+from time import monotonic
+from typing import Any
+
+from sqlalchemy.sql import ClauseElement
+
+from src.infrastructure.utils.breaker import UNAVAILABLE_ERRORS
+from src.infrastructure.utils.metrics import REPLICA_LAG, REPLICA_QUERIES
+from src.infrastructure.utils.querytrace import TracedDatabase
+from src.infrastructure.utils.requestcontext import (
+    DeadlineExceeded,
+    request_context,
+)
+
+logger = logging.getLogger(__name__)
+
+# The replication lag in seconds, 0 when the replica replayed everything
+# it received, e.g. while the primary is idle, and the replayed position
+# of the write-ahead log in bytes.
+STATE_QUERY = """
+SELECT
+    CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END AS lag,
+    pg_last_wal_replay_lsn() - '0/0'::pg_lsn AS replayed
+"""
+
+# The position of the write-ahead log of the primary in bytes.
+POSITION_QUERY = "SELECT pg_current_wal_lsn() - '0/0'::pg_lsn"
+
+
+class Replica:
+    """A class holding the state of a read replica."""
+
+    def __init__(self, name: str, database: TracedDatabase) -> None:
+        """The initializer of the replica.
+
+        Args:
+            name (str): The name used in logs and metrics.
+            database (TracedDatabase): The database of the replica.
+        """
+
+        self.name = name
+        self.database = database
+        self.in_flight = 0
+        self.lag: float | None = None
+        self.replayed: int | None = None
+        self.down_until = 0.0
+        self._lag_gauge = REPLICA_LAG.labels(name)
+        self.queries = REPLICA_QUERIES.labels(name)
+
+    def available(self, max_lag: float, position: int | None = None) -> bool:
+        """The method deciding whether the replica may serve reads.
+
+        The replayed position is the one of the last poll, so it is never
+        ahead of the replica and a replica reported past the position of
+        a write does include it.
+
+        Args:
+            max_lag (float): The longest acceptable lag in seconds.
+            position (int | None, optional): The position of the write
+                the read has to see. Defaults to None.
+
+        Returns:
+            bool: True if the replica is up and close enough.
+        """
+
+        return (
+            self.lag is not None
+            and self.lag <= max_lag
+            and monotonic() >= self.down_until
+            and (position is None or self.includes(position))
+        )
+
+    def includes(self, position: int) -> bool:
+        """The method checking whether the replica replayed the position.
+
+        Args:
+            position (int): The position of the write-ahead log in bytes.
+
+        Returns:
+            bool: True if the position was replayed at the last poll.
+        """
+
+        return self.replayed is not None and self.replayed >= position
+
+    def set_lag(
+        self,
+        lag: float | None,
+        replayed: int | None = None,
+    ) -> None:
+        """The method storing the measured lag and replayed position.
+
+        Args:
+            lag (float | None): The lag in seconds, None if unknown.
+            replayed (int | None, optional): The replayed position of the
+                write-ahead log in bytes, None if unknown.
+        """
+
+        self.lag = lag
+        if replayed is not None:
+            self.replayed = max(replayed, self.replayed or 0)
+        self._lag_gauge.set(-1 if lag is None else lag)
+
+
+class RoutedDatabase:
+    """A class sending the reads of the request to the read replicas.
+
+    Reads go to the least loaded available replica only when the request
+    context allows it, which the routing middleware does for reads of
+    the routed resources. A client that wrote carries the position of
+    its write, and only replicas which replayed it serve its reads.
+    Everything else, including writes and transactions, uses the
+    primary. A replica failing a read is skipped for `retry_delay`
+    seconds and the read is retried on the primary. Replicas lagging
+    more than `max_lag` seconds, or not polled yet, are skipped as well.
+    """
+
+    def __init__(
+        self,
+        primary: TracedDatabase,
+        replicas: list[Replica],
+        max_lag: float = 2.0,
+        poll_interval: float = 1.0,
+        retry_delay: float = 5.0,
+    ) -> None:
+        """The initializer of the router.
+
+        Args:
+            primary (TracedDatabase): The primary database.
+            replicas (list[Replica]): The read replicas.
+            max_lag (float, optional): The longest acceptable replica lag
+                in seconds. Defaults to 2.0.
+            poll_interval (float, optional): The seconds between the lag
+                checks. Defaults to 1.0.
+            retry_delay (float, optional): The seconds a failed replica
+                is skipped. Defaults to 5.0.
+        """
+
+        self.primary = primary
+        self.replicas = replicas
+        self.max_lag = max_lag
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+        self._poller: asyncio.Task | None = None
+        self._primary_reads = REPLICA_QUERIES.labels("primary")
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.primary, name)
+
+    async def connect(self) -> None:
+        """The method connecting the primary and the replicas.
+
+        Replicas failing to connect are retried on every poll.
+        """
+
+        await self.primary.connect()
+        if self.replicas:
+            await self._poll()
+            self._poller = asyncio.create_task(self._watch())
+
+    async def disconnect(self) -> None:
+        """The method disconnecting the primary and the replicas."""
+
+        if self._poller is not None:
+            self._poller.cancel()
+        for replica in self.replicas:
+            if replica.database.is_connected:
+                await replica.database.disconnect()
+        await self.primary.disconnect()
+
+    async def fetch_all(
+        self,
+        query: ClauseElement | str,
+        values: dict | None = None,
+    ) -> list:
+        """The method fetching all rows on the routed database.
+
+        Args:
+            query (ClauseElement | str): The query.
+            values (dict | None, optional): The query parameters.
+
+        Returns:
+            list: The rows.
+        """
+
+        return await self._read("fetch_all", query, values)
+
+    async def fetch_one(
+        self,
+        query: ClauseElement | str,
+        values: dict | None = None,
+    ) -> Any:
+        """The method fetching the first row on the routed database.
+
+        Args:
+            query (ClauseElement | str): The query.
+            values (dict | None, optional): The query parameters.
+
+        Returns:
+            Any: The row, None if there is none.
+        """
+
+        return await self._read("fetch_one", query, values)
+
+    async def fetch_val(
+        self,
+        query: ClauseElement | str,
+        values: dict | None = None,
+        column: Any = 0,
+    ) -> Any:
+        """The method fetching the first value on the routed database.
+
+        Args:
+            query (ClauseElement | str): The query.
+            values (dict | None, optional): The query parameters.
+            column (Any, optional): The column. Defaults to 0.
+
+        Returns:
+            Any: The value.
+        """
+
+        return await self._read("fetch_val", query, values, column)
+
+    async def fetch_prepared(self, name: str, *args: Any) -> Any:
+        """The method fetching the hot query row on the routed database.
+
+        Args:
+            name (str): The name of the hot query.
+            *args (Any): The positional parameters.
+
+        Returns:
+            Any: The row, None if there is none.
+        """
+
+        return await self._read("fetch_prepared", name, *args)
+
+    async def write_position(self) -> int | None:
+        """The method reading the position of the committed writes.
+
+        Returns:
+            int | None: The write-ahead log position of the primary in
+                bytes, None without replicas.
+        """
+
+        if not self.replicas:
+            return None
+
+        return int(await self.primary.fetch_val(POSITION_QUERY))
+
+    def replayed(self, position: int) -> bool:
+        """The method checking whether all replicas replayed the position.
+
+        Args:
+            position (int): The write-ahead log position in bytes.
+
+        Returns:
+            bool: True if every replica includes the position.
+        """
+
+        return all(replica.includes(position) for replica in self.replicas)
+
+    def pick(self) -> Replica | None:
+        """The method choosing the replica of the read.
+
+        Returns:
+            Replica | None: The least loaded available replica, None if
+                the read goes to the primary.
+        """
+
+        context = request_context.get()
+        if context is None or not context.use_replica:
+            return None
+
+        available = [
+            replica
+            for replica in self.replicas
+            if replica.available(self.max_lag, context.read_position)
+        ]
+        if not available:
+            return None
+
+        least = min(replica.in_flight for replica in available)
+
+        return random.choice(  # nosec B311
+            [replica for replica in available if replica.in_flight == least],
+        )
+
+    async def _read(self, method: str, *args: Any) -> Any:
+        """A private method running the read on the routed database.
+
+        Args:
+            method (str): The name of the fetch method.
+            *args (Any): The method arguments.
+
+        Returns:
+            Any: The method result.
+        """
+
+        replica = self.pick()
+        if replica is None:
+            self._primary_reads.inc()
+            return await getattr(self.primary, method)(*args)
+
+        replica.in_flight += 1
+        try:
+            result = await getattr(replica.database, method)(*args)
+        except DeadlineExceeded:
+            raise
+        except UNAVAILABLE_ERRORS as error:
+            logger.warning("Replica %s failed: %s", replica.name, error)
+            replica.down_until = monotonic() + self.retry_delay
+            self._primary_reads.inc()
+            return await getattr(self.primary, method)(*args)
+        finally:
+            replica.in_flight -= 1
+
+        replica.queries.inc()
+
+        return result
+
+    async def _watch(self) -> None:
+        """A private method polling the replicas periodically."""
+
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            await self._poll()
+
+    async def _poll(self) -> None:
+        """A private method connecting and measuring every replica."""
+
+        for replica in self.replicas:
+            try:
+                if not replica.database.is_connected:
+                    await asyncio.wait_for(
+                        replica.database.connect(),
+                        self.poll_interval,
+                    )
+                state = await asyncio.wait_for(
+                    replica.database.fetch_one(STATE_QUERY),
+                    self.poll_interval,
+                )
+            except (*UNAVAILABLE_ERRORS, asyncio.TimeoutError) as error:
+                if replica.lag is not None:
+                    logger.warning(
+                        "Replica %s is unavailable: %s",
+                        replica.name,
+                        error,
+                    )
+                replica.set_lag(None)
+                continue
+
+            replayed = state["replayed"]
+            replica.set_lag(
+                float(state["lag"] or 0),
+                None if replayed is None else int(replayed),
+            )
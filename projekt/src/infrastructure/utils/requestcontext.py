@@ -0,0 +1,40 @@
+"""A module containing the request-scoped context."""
+
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import monotonic
+
+
+class DeadlineExceeded(TimeoutError):
+    """An exception raised when the request ran out of its time budget."""
+
+
+@dataclass
+class RequestContext:
+    """A class holding the state collected while handling a request."""
+
+    request_id: str
+    db_time: float = 0.0
+    db_queries: int = 0
+    deadline: float | None = None
+    use_replica: bool = False
+    read_position: int | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+
+    def remaining(self) -> float | None:
+        """The method getting the time left until the deadline.
+
+        Returns:
+            float | None: The remaining seconds, None without a deadline.
+        """
+
+        if self.deadline is None:
+            return None
+
+        return self.deadline - monotonic()
+
+
+request_context: ContextVar[RequestContext | None] = ContextVar(
+    "request_context",
+    default=None,
+)
@@ -0,0 +1,304 @@
+"""A module containing a minimal client of the Redis protocol (RESP).
+
+It covers the commands used by the shared cache and works with Redis,
+Valkey, KeyDB or any other server speaking RESP2. Commands are pipelined
+over one connection: they are written as soon as they are issued and the
+replies are matched to them in order by a single reader task.
+"""
+
+import asyncio
+from collections import deque
+from time import monotonic
+from typing import Any
+from urllib.parse import urlsplit
+
+RespReply = bytes | int | list | None
+
+
+class RespError(Exception):
+    """An exception raised for error replies and protocol failures."""
+
+
+class RespClient:
+    """A class sending commands to a RESP server."""
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: str | None = None,
+        timeout: float = 0.5,
+        retry_delay: float = 1.0,
+    ) -> None:
+        """The initializer of the client.
+
+        Args:
+            host (str, optional): The server host. Defaults to localhost.
+            port (int, optional): The server port. Defaults to 6379.
+            db (int, optional): The database number. Defaults to 0.
+            password (str | None, optional): The password. Defaults to
+                None.
+            timeout (float, optional): The connect and reply timeout in
+                seconds. Defaults to 0.5.
+            retry_delay (float, optional): The seconds commands fail
+                without connecting after a failed connect. Defaults to
+                1.0.
+        """
+
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self.retry_delay = retry_delay
+        self._retry_at = 0.0
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task | None = None
+        self._pending: deque[asyncio.Future] = deque()
+        self._connecting = asyncio.Lock()
+
+    @classmethod
+    def from_url(cls, url: str, timeout: float = 0.5) -> "RespClient":
+        """The method creating the client of the `redis://` URL.
+
+        Args:
+            url (str): The URL, e.g. `redis://:secret@cache:6379/0`.
+            timeout (float, optional): The connect and reply timeout in
+                seconds. Defaults to 0.5.
+
+        Returns:
+            RespClient: The client.
+        """
+
+        parts = urlsplit(url)
+
+        return cls(
+            host=parts.hostname or "localhost",
+            port=parts.port or 6379,
+            db=int(parts.path.lstrip("/") or 0),
+            password=parts.password,
+            timeout=timeout,
+        )
+
+    async def get(self, key: str) -> bytes | None:
+        """The method getting the value of the key.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            bytes | None: The value, None if missing.
+        """
+
+        return await self.execute("GET", key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """The method setting the value of the key with the TTL.
+
+        Args:
+            key (str): The key.
+            value (bytes): The value.
+            ttl (float): The time to live in seconds.
+        """
+
+        await self.execute("SET", key, value, "PX", max(1, int(ttl * 1000)))
+
+    async def incr(self, key: str) -> int:
+        """The method incrementing the counter of the key.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            int: The incremented value.
+        """
+
+        return await self.execute("INCR", key)
+
+    async def delete(self, *keys: str) -> int:
+        """The method deleting the keys.
+
+        Args:
+            *keys (str): The keys.
+
+        Returns:
+            int: The number of deleted keys.
+        """
+
+        return await self.execute("DEL", *keys)
+
+    async def execute(self, *args: Any) -> Any:
+        """The method sending the command and waiting for its reply.
+
+        Args:
+            *args (Any): The command name and its arguments.
+
+        Raises:
+            RespError: If the server replied with an error.
+            OSError: If the server cannot be reached or did not reply in
+                time.
+
+        Returns:
+            Any: The decoded reply.
+        """
+
+        writer = await self._connection()
+        reply = asyncio.get_running_loop().create_future()
+        self._pending.append(reply)
+        writer.write(_encode(args))
+        try:
+            result = await asyncio.wait_for(reply, self.timeout)
+        except asyncio.TimeoutError:
+            self._reset()
+            raise
+
+        if isinstance(result, RespError):
+            raise result
+
+        return result
+
+    async def close(self) -> None:
+        """The method closing the connection."""
+
+        writer = self._writer
+        self._reset()
+        if writer is not None:
+            await writer.wait_closed()
+
+    async def _connection(self) -> asyncio.StreamWriter:
+        """A private method getting the open connection.
+
+        A failed connect is not retried for `retry_delay` seconds, so an
+        unavailable server does not slow every command down.
+
+        Raises:
+            OSError: If the server cannot be reached.
+
+        Returns:
+            asyncio.StreamWriter: The writer of the connection.
+        """
+
+        if self._writer is not None:
+            return self._writer
+
+        async with self._connecting:
+            if self._writer is not None:
+                return self._writer
+            if monotonic() < self._retry_at:
+                raise ConnectionRefusedError("RESP server unavailable")
+
+            try:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.host, self.port),
+                    self.timeout,
+                )
+            except OSError:
+                self._retry_at = monotonic() + self.retry_delay
+                raise
+            self._writer = writer
+            self._reader_task = asyncio.create_task(self._read(reader))
+
+            setup: list[tuple] = []
+            if self.password:
+                setup.append(("AUTH", self.password))
+            if self.db:
+                setup.append(("SELECT", self.db))
+            for command in setup:
+                reply = asyncio.get_running_loop().create_future()
+                self._pending.append(reply)
+                writer.write(_encode(command))
+                if isinstance(result := await reply, RespError):
+                    self._reset()
+                    raise result
+
+            return writer
+
+    async def _read(self, reader: asyncio.StreamReader) -> None:
+        """A private method resolving the pending replies in order.
+
+        Args:
+            reader (asyncio.StreamReader): The reader of the connection.
+        """
+
+        try:
+            while True:
+                reply = await _read_reply(reader)
+                if not self._pending:
+                    raise RespError("Unexpected reply")
+                future = self._pending.popleft()
+                if not future.done():
+                    future.set_result(reply)
+        except (OSError, EOFError, ValueError, RespError):
+            self._reset()
+
+    def _reset(self) -> None:
+        """A private method dropping the connection and pending commands."""
+
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.close()
+        if self._reader_task is not None:
+            if self._reader_task is not asyncio.current_task():
+                self._reader_task.cancel()
+            self._reader_task = None
+
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(ConnectionResetError("RESP closed"))
+
+
+def _encode(args: tuple) -> bytes:
+    """A private function encoding the command as a RESP array.
+
+    Args:
+        args (tuple): The command name and its arguments.
+
+    Returns:
+        bytes: The encoded command.
+    """
+
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if not isinstance(arg, bytes):
+            arg = str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+
+    return b"".join(parts)
+
+
+async def _read_reply(reader: asyncio.StreamReader) -> RespReply | RespError:
+    """A private function reading one RESP2 reply.
+
+    Args:
+        reader (asyncio.StreamReader): The reader of the connection.
+
+    Raises:
+        RespError: If the reply is malformed.
+
+    Returns:
+        RespReply | RespError: The decoded reply, or the error reply.
+    """
+
+    line = await reader.readuntil(b"\r\n")
+    kind, value = line[:1], line[1:-2]
+
+    if kind == b"+":
+        return value
+    if kind == b"-":
+        return RespError(value.decode(errors="replace"))
+    if kind == b":":
+        return int(value)
+    if kind == b"$":
+        length = int(value)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if kind == b"*":
+        length = int(value)
+        if length < 0:
+            return None
+        return [await _read_reply(reader) for _ in range(length)]
+
+    raise RespError(f"Invalid reply type {kind!r}")
@@ -1,9 +1,9 @@
 """A module containing helper functions for token generation."""
 
 from datetime import datetime, timedelta, timezone
+from uuid import UUID
 
 from jose import jwt
-from pydantic import UUID4
 
 from src.infrastructure.utils.consts import (
     EXPIRATION_MINUTES,
@@ -12,11 +12,11 @@ from src.infrastructure.utils.consts import (
 )
 
 
-def generate_user_token(user_uuid: UUID4) -> dict:
+def generate_user_token(user_uuid: UUID) -> dict:
     """A function returning JWT token for user.
 
     Args:
-        user_uuid (UUID5): The UUID of the user.
+        user_uuid (UUID): The UUID of the user.
 
     Returns:
         dict: The token details.
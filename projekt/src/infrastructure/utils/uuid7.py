@@ -0,0 +1,71 @@
+"""A module containing the generator of time-ordered UUIDs (RFC 9562).
+
+A UUIDv7 starts with the Unix time in milliseconds, so keys generated
+later sort later. New rows are appended to the right edge of the primary
+key index instead of landing on random pages of it, and the keys can be
+used as pagination cursors.
+"""
+
+import os
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    """A function generating the UUIDv7.
+
+    The 12 bits following the version hold a counter, which starts at a
+    random value every millisecond and is incremented within it, so the
+    UUIDs of one process are strictly increasing. When the counter runs
+    out, the timestamp is advanced by a millisecond.
+
+    Returns:
+        uuid.UUID: The UUID.
+    """
+
+    global _last_ms, _counter  # pylint: disable=global-statement
+
+    random = int.from_bytes(os.urandom(10), "big")
+    with _lock:
+        now = time.time_ns() // 1_000_000
+        if now > _last_ms:
+            _last_ms = now
+            _counter = random >> 69
+        else:
+            _counter += 1
+            if _counter > 0xFFF:
+                _last_ms += 1
+                _counter = random >> 69
+        timestamp, counter = _last_ms, _counter
+
+    return uuid.UUID(
+        int=(timestamp & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | random & 0x3FFFFFFFFFFFFFFF,
+    )
+
+
+def uuid7_timestamp(value: uuid.UUID) -> float:
+    """A function reading the creation time of the UUIDv7.
+
+    Args:
+        value (uuid.UUID): The UUID.
+
+    Raises:
+        ValueError: If the UUID is not a version 7 one.
+
+    Returns:
+        float: The Unix time in seconds.
+    """
+
+    if value.version != 7:
+        raise ValueError("Not a version 7 UUID")
+
+    return (value.int >> 80) / 1000
@@ -1,40 +1,109 @@
 """Main module of the app"""
 
+import logging
+import math
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.exception_handlers import http_exception_handler
+from fastapi.responses import JSONResponse
 
+from src.api.routers.admin import router as admin_router
+from src.api.routers.changes import router as changes_router
 from src.api.routers.club import router as club_router
+from src.api.routers.metrics import router as metrics_router
 from src.api.routers.stadium import router as stadium_router
 from src.api.routers.user import router as user_router
-from src.container import Container
-from src.db import database, init_db
+from src.api.utils.access import AccessLogMiddleware
+from src.api.utils.deadline import DeadlineMiddleware
+from src.api.utils.encoding import (
+    CompressionMiddleware,
+    FormatMiddleware,
+    NegotiatedResponse,
+)
+from src.api.utils.limiter import ConcurrencyLimitMiddleware
+from src.api.utils.metrics import MetricsMiddleware
+from src.api.utils.profiling import ProfilingMiddleware
+from src.api.utils.replicas import ReadRoutingMiddleware
+from src.config import config
+from src.container import container
+from src.db import database, init_db, invalidation_bus, pg_listener
+from src.infrastructure.utils.breaker import CircuitOpen
+from src.infrastructure.utils.logs import setup_logging
+from src.infrastructure.utils.requestcontext import DeadlineExceeded
 
-container = Container()
-container.wire(modules=[
-    "src.api.routers.continent",
-    "src.api.routers.country",
-    "src.api.routers.airport",
-    "src.api.routers.meteo",
-    "src.api.routers.user",
-])
+logger = logging.getLogger(__name__)
+
+invalidation_bus.subscribe(container.stale_cache())
+invalidation_bus.subscribe(container.cache())
+if config.EMAIL_FILTER_ENABLED:
+    invalidation_bus.subscribe(container.email_filter())
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncGenerator:
     """Lifespan function working on app startup."""
+    log_listener = setup_logging(config.LOG_LEVEL)
     await init_db()
     await database.connect()
+    await pg_listener.start()
+    if config.EMAIL_FILTER_ENABLED:
+        await container.email_filter().start()
     yield
+    if config.EMAIL_FILTER_ENABLED:
+        await container.email_filter().stop()
+    await pg_listener.stop()
+    await container.cache().close()
     await database.disconnect()
+    log_listener.stop()
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=NegotiatedResponse)
 app.include_router(club_router, prefix="/club")
 app.include_router(stadium_router, prefix="/stadium")
 app.include_router(user_router, prefix="")
+app.include_router(metrics_router, prefix="")
+app.include_router(admin_router, prefix="/admin")
+app.include_router(changes_router, prefix="/changes")
+
+if config.CONCURRENCY_LIMIT_ENABLED:
+    app.add_middleware(
+        ConcurrencyLimitMiddleware,
+        initial_limit=config.CONCURRENCY_INITIAL_LIMIT,
+        max_limit=config.CONCURRENCY_MAX_LIMIT,
+        queue_size=config.CONCURRENCY_QUEUE_SIZE,
+        queue_timeout=config.CONCURRENCY_QUEUE_TIMEOUT,
+        tolerance=config.CONCURRENCY_LATENCY_TOLERANCE,
+    )
+
+app.add_middleware(
+    DeadlineMiddleware,
+    default_timeout=config.REQUEST_TIMEOUT,
+    max_timeout=config.REQUEST_TIMEOUT_MAX,
+)
+app.add_middleware(ReadRoutingMiddleware, database=database)
+app.add_middleware(FormatMiddleware)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=config.COMPRESSION_MIN_SIZE,
+    gzip_level=config.GZIP_LEVEL,
+    brotli_quality=config.BROTLI_QUALITY,
+    zstd_level=config.ZSTD_LEVEL,
+)
+app.add_middleware(
+    AccessLogMiddleware,
+    sample_rate=config.ACCESS_LOG_SAMPLE_RATE,
+    slow_ms=config.ACCESS_LOG_SLOW_MS,
+)
+app.add_middleware(MetricsMiddleware)
+
+if config.PROFILING_ENABLED:
+    app.add_middleware(
+        ProfilingMiddleware,
+        sample_rate=config.PROFILING_SAMPLE_RATE,
+        top=config.PROFILING_TOP,
+    )
 
 
 @app.exception_handler(HTTPException)
@@ -51,4 +120,59 @@ async def http_exception_handle_logging(
     Returns:
         Response: The HTTP response.
     """
-    return await http_exception_handler(request, exception)
\ No newline at end of file
+    logger.log(
+        logging.ERROR if exception.status_code >= 500 else logging.INFO,
+        "HTTP %d: %s",
+        exception.status_code,
+        exception.detail,
+        extra={"method": request.method, "path": request.url.path},
+    )
+    return await http_exception_handler(request, exception)
+
+
+@app.exception_handler(DeadlineExceeded)
+async def deadline_exceeded_handler(
+    request: Request,
+    exception: DeadlineExceeded,
+) -> Response:
+    """A function handling queries cut short by the request deadline.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        exception (DeadlineExceeded): A related exception.
+
+    Returns:
+        Response: The 504 response.
+    """
+    logger.warning(
+        "%s",
+        exception,
+        extra={"method": request.method, "path": request.url.path},
+    )
+    return JSONResponse(status_code=504, content={"detail": str(exception)})
+
+
+@app.exception_handler(CircuitOpen)
+async def circuit_open_handler(
+    request: Request,
+    exception: CircuitOpen,
+) -> Response:
+    """A function failing fast while the database circuit is open.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        exception (CircuitOpen): A related exception.
+
+    Returns:
+        Response: The 503 response.
+    """
+    logger.warning(
+        "%s",
+        exception,
+        extra={"method": request.method, "path": request.url.path},
+    )
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exception)},
+        headers={"Retry-After": str(math.ceil(exception.retry_after) or 1)},
+    )
\ No newline at end of file
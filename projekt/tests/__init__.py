@@ -0,0 +1 @@
+"""The test suite of the application."""
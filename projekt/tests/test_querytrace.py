@@ -0,0 +1,127 @@
+"""A module containing tests of the query instrumentation layer."""
+
+import asyncio
+from contextlib import nullcontext
+from time import monotonic
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.utils.access import AccessLogMiddleware
+from src.api.utils.deadline import DeadlineMiddleware
+from src.infrastructure.utils.querytrace import QueryTracer, TracedDatabase
+from src.infrastructure.utils.requestcontext import (
+    DeadlineExceeded,
+    RequestContext,
+    request_context,
+)
+
+
+class RecordingDatabase:
+    """A class standing in for `databases.Database` recording statements.
+
+    Opening a transaction or a connection is recorded as well, as either
+    would cost round trips of its own.
+    """
+
+    def __init__(self, delay: float = 0.0) -> None:
+        """The initializer of the stand-in.
+
+        Args:
+            delay (float, optional): The duration of every query.
+                Defaults to 0.0.
+        """
+
+        self.delay = delay
+        self.statements: list[str] = []
+
+    async def fetch_all(self, query: Any, values: Any = None) -> list:
+        """The method recording the query."""
+
+        self.statements.append(str(query))
+        await asyncio.sleep(self.delay)
+
+        return []
+
+    async def fetch_one(self, query: Any, values: Any = None) -> Any:
+        """The method recording the query."""
+
+        self.statements.append(str(query))
+        await asyncio.sleep(self.delay)
+
+        return None
+
+    def transaction(self) -> Any:
+        """The method recording the opened transaction."""
+
+        self.statements.append("BEGIN")
+
+        return nullcontext()
+
+    def connection(self) -> Any:
+        """The method recording the acquired connection."""
+
+        self.statements.append("CONNECTION")
+
+        return nullcontext()
+
+
+def _traced(delay: float = 0.0) -> tuple[TracedDatabase, RecordingDatabase]:
+    """A function wrapping the recording stand-in.
+
+    Args:
+        delay (float, optional): The duration of every query.
+            Defaults to 0.0.
+
+    Returns:
+        tuple[TracedDatabase, RecordingDatabase]: The traced database and
+            the stand-in it wraps.
+    """
+
+    recorder = RecordingDatabase(delay)
+
+    return TracedDatabase(recorder, QueryTracer(threshold=60.0)), recorder
+
+
+def test_get_runs_only_its_queries() -> None:
+    """A plain GET with the default deadline adds no statements."""
+
+    database, recorder = _traced()
+    app = FastAPI()
+
+    @app.get("/clubs")
+    async def get_clubs() -> list:
+        await database.fetch_one("SELECT count(*) FROM clubs")
+        return await database.fetch_all("SELECT id FROM clubs")
+
+    app.add_middleware(DeadlineMiddleware)
+    app.add_middleware(AccessLogMiddleware)
+
+    response = TestClient(app).get("/clubs")
+
+    assert response.status_code == 200
+    assert recorder.statements == [
+        "SELECT count(*) FROM clubs",
+        "SELECT id FROM clubs",
+    ]
+
+
+def test_query_past_deadline_is_cancelled() -> None:
+    """A query running past the deadline raises `DeadlineExceeded`."""
+
+    database, recorder = _traced(delay=1.0)
+
+    async def query() -> None:
+        request_context.set(
+            RequestContext(request_id="test", deadline=monotonic() + 0.05),
+        )
+        await database.fetch_all("SELECT id FROM clubs")
+
+    start = monotonic()
+    with pytest.raises(DeadlineExceeded):
+        asyncio.run(query())
+
+    assert monotonic() - start < 0.5
+    assert recorder.statements == ["SELECT id FROM clubs"]
@@ -0,0 +1,199 @@
+"""A module containing tests of the read replica routing."""
+
+import asyncio
+import os
+import uuid
+from typing import Any
+
+import databases
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.utils.access import AccessLogMiddleware
+from src.api.utils.replicas import POSITION_COOKIE, ReadRoutingMiddleware
+from src.infrastructure.utils.querytrace import QueryTracer, TracedDatabase
+from src.infrastructure.utils.replicas import Replica, RoutedDatabase
+from src.infrastructure.utils.requestcontext import (
+    RequestContext,
+    request_context,
+)
+
+PRIMARY_URL = os.environ.get("TEST_DATABASE_URL")
+REPLICA_URL = os.environ.get("TEST_REPLICA_URL")
+
+
+class NamedDatabase:
+    """A class standing in for a database answering with its name."""
+
+    is_connected = True
+
+    def __init__(self, name: str) -> None:
+        """The initializer of the stand-in.
+
+        Args:
+            name (str): The returned name.
+        """
+
+        self.name = name
+
+    async def fetch_val(
+        self,
+        query: Any,
+        values: Any = None,
+        column: Any = 0,
+    ) -> str:
+        """The method returning the name."""
+
+        return self.name
+
+
+class PositionDatabase:
+    """A class standing in for the routed database of the middleware."""
+
+    def __init__(self, position: int) -> None:
+        """The initializer of the stand-in.
+
+        Args:
+            position (int): The position of every write.
+        """
+
+        self.position = position
+        self.replicated = False
+
+    async def write_position(self) -> int | None:
+        """The method returning the position of the write."""
+
+        return self.position
+
+    def replayed(self, position: int) -> bool:
+        """The method returning whether the replicas caught up."""
+
+        return self.replicated
+
+
+def test_reads_wait_for_the_write_position() -> None:
+    """Replicas serve a writing client only once they replayed its write."""
+
+    replica = Replica("replica1", NamedDatabase("replica"))  # type: ignore
+    database = RoutedDatabase(
+        NamedDatabase("primary"),  # type: ignore
+        [replica],
+    )
+    replica.set_lag(0.0, 100)
+
+    async def read(position: int | None) -> str:
+        request_context.set(RequestContext(
+            request_id="test",
+            use_replica=True,
+            read_position=position,
+        ))
+        return await database.fetch_val("SELECT 1")
+
+    assert asyncio.run(read(None)) == "replica"
+    assert asyncio.run(read(100)) == "replica"
+    assert asyncio.run(read(101)) == "primary"
+
+    replica.set_lag(0.0, 101)
+    assert asyncio.run(read(101)) == "replica"
+    assert not database.replayed(102)
+
+
+def test_position_cookie() -> None:
+    """A write sets the position cookie, which is dropped when replayed."""
+
+    database = PositionDatabase(42)
+    app = FastAPI()
+
+    @app.post("/club/")
+    async def add_club() -> dict:
+        return {}
+
+    @app.get("/club/")
+    async def get_clubs() -> dict:
+        context = request_context.get()
+        return {
+            "replica": context.use_replica,  # type: ignore
+            "position": context.read_position,  # type: ignore
+        }
+
+    @app.get("/club/changes")
+    async def get_changes() -> dict:
+        return {"replica": request_context.get().use_replica}  # type: ignore
+
+    app.add_middleware(ReadRoutingMiddleware, database=database)
+    app.add_middleware(AccessLogMiddleware)
+    client = TestClient(app)
+
+    client.post("/club/")
+    assert client.cookies.get(POSITION_COOKIE) == "42"
+
+    response = client.get("/club/changes")
+    assert response.json() == {"replica": False}
+
+    response = client.get("/club/")
+    assert response.json() == {"replica": True, "position": 42}
+    assert "set-cookie" not in response.headers
+
+    database.replicated = True
+    response = client.get("/club/")
+    assert response.json() == {"replica": True, "position": None}
+    assert POSITION_COOKIE not in client.cookies
+
+
+@pytest.mark.skipif(
+    not (PRIMARY_URL and REPLICA_URL),
+    reason="TEST_DATABASE_URL and TEST_REPLICA_URL are not set",
+)
+def test_reads_see_own_writes_on_replicas() -> None:
+    """Reads after a write see it on two Postgres instances.
+
+    `TEST_DATABASE_URL` is the primary and `TEST_REPLICA_URL` a streaming
+    replica of it.
+    """
+
+    tracer = QueryTracer(threshold=60.0)
+    replica = Replica(
+        "replica1",
+        TracedDatabase(databases.Database(REPLICA_URL), tracer),
+    )
+    database = RoutedDatabase(
+        TracedDatabase(databases.Database(PRIMARY_URL), tracer),
+        [replica],
+        max_lag=60.0,
+        poll_interval=0.05,
+    )
+    table = f"ryw_{uuid.uuid4().hex[:8]}"
+
+    async def scenario() -> None:
+        await database.connect()
+        try:
+            await database.execute(
+                f"CREATE TABLE {table} (id serial PRIMARY KEY, value text)",
+            )
+            for index in range(50):
+                row_id = await database.fetch_val(
+                    f"INSERT INTO {table} (value) VALUES (:value) "
+                    "RETURNING id",
+                    {"value": str(index)},
+                )
+                position = await database.write_position()
+                request_context.set(RequestContext(
+                    request_id="test",
+                    use_replica=True,
+                    read_position=position,
+                ))
+                assert await database.fetch_val(
+                    f"SELECT value FROM {table} WHERE id = :id",
+                    {"id": row_id},
+                ) == str(index)
+
+            while not database.replayed(position):  # type: ignore
+                await asyncio.sleep(0.05)
+            assert database.pick() is replica
+        finally:
+            request_context.set(None)
+            await database.execute(f"DROP TABLE IF EXISTS {table}")
+            await database.disconnect()
+
+    asyncio.run(scenario())
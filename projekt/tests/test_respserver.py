@@ -0,0 +1,34 @@
+"""A module containing tests of the RESP stand-in server and client."""
+
+import asyncio
+
+from benchmarks.respserver import RespServer
+from src.infrastructure.utils.resp import RespClient
+
+
+def test_round_trip() -> None:
+    """GET, SET and INCR round-trip and close leaves no task behind."""
+
+    async def scenario() -> None:
+        server = RespServer()
+        client = RespClient(port=await server.start())
+        try:
+            assert await client.get("club") is None
+
+            await client.set("club", b"Wisla", ttl=60)
+            assert await client.get("club") == b"Wisla"
+
+            assert await client.incr("version") == 1
+            assert await client.incr("version") == 2
+
+            await client.set("stale", b"x", ttl=0.001)
+            await asyncio.sleep(0.01)
+            assert await client.get("stale") is None
+        finally:
+            await client.close()
+            await server.stop()
+
+        await asyncio.sleep(0)
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    asyncio.run(scenario())